@@ -0,0 +1,182 @@
+import os
+import numpy as np
+import maya.cmds as cmds
+import System.blueprint as blueprint_mod
+import System.utils as utils
+import System.bulk_attrs as bulk_attrs
+from System.joint_layout import JointLayout
+
+CLASS_NAME = "Chain"
+TITLE = "Chain"
+DESCRIPTION = "Creates a chain of 10 to 200 joints, driven by a root and an end control. Ideal use: tail, tentacle, long spine"
+ICON = f"{os.environ['RIGGING_TOOL_ROOT']}/Icons/_spline.xpm"
+
+MIN_JOINT_COUNT = 10
+MAX_JOINT_COUNT = 200
+DEFAULT_JOINT_COUNT = 20
+DEFAULT_LENGTH = 20.0
+JOINT_COUNT_ATTR = "chainJointCount"
+LENGTH_ATTR = "chainLength"
+CURVE_ATTR = "chainCurve"
+
+_layouts = {}
+
+
+def chain_layout(joint_count=DEFAULT_JOINT_COUNT, length=DEFAULT_LENGTH, curve=0.0):
+    """
+    Shared layout of joint_count joints spaced evenly along an arc of the given length in the XY plane.
+    curve = total bend of the chain in degrees, 0 = straight along X. Positions are computed in one pass
+    and each (joint_count, length, curve) layout is built once per session.
+    """
+    joint_count = int(joint_count)
+    if joint_count < MIN_JOINT_COUNT or joint_count > MAX_JOINT_COUNT:
+        raise RuntimeError(f"A chain takes {MIN_JOINT_COUNT} to {MAX_JOINT_COUNT} joints, got {joint_count}")
+
+    key = (joint_count, float(length), float(curve))
+    layout = _layouts.get(key)
+    if layout is None:
+        arc = np.linspace(0.0, length, joint_count)
+        positions = np.zeros((joint_count, 3))
+        angle = np.radians(curve)
+        if abs(angle) < 1e-6:
+            positions[:, 0] = arc
+        else:
+            radius = length / angle
+            positions[:, 0] = radius * np.sin(arc / radius)
+            positions[:, 1] = radius * (1.0 - np.cos(arc / radius))
+
+        names = ["root_joint"] + [f"joint_{index:03d}" for index in range(1, joint_count - 1)] + ["end_joint"]
+        layout = JointLayout(names, positions, shared=True)
+        _layouts[key] = layout
+    return layout
+
+
+def scene_chain_options(module_namespace):
+    # {"joint_count", "length", "curve"} of an installed chain, None when the module is not in the scene
+    module_grp = f"{module_namespace}:module_grp"
+    if not cmds.objExists(module_grp) or not cmds.attributeQuery(JOINT_COUNT_ATTR, n=module_grp, ex=1):
+        return None
+
+    options = {"joint_count": cmds.getAttr(f"{module_grp}.{JOINT_COUNT_ATTR}"), "length": DEFAULT_LENGTH, "curve": 0.0}
+    for option, attr in (("length", LENGTH_ATTR), ("curve", CURVE_ATTR)):
+        if cmds.attributeQuery(attr, n=module_grp, ex=1):
+            options[option] = cmds.getAttr(f"{module_grp}.{attr}")
+    return options
+
+
+class Chain(blueprint_mod.Blueprint):
+    """
+    Joints are placed from (joint_count, length, curve) and only the root and end joints get translation controls.
+    Instead of a stretchy IK per segment the whole chain sits under one frame that follows the root control,
+    aims at the end control and scales uniformly by control distance / original distance, so the network
+    is the same handful of nodes for any joint count and the chain keeps its shape.
+    """
+
+    def __init__(self, user_specified_name, hook_obj, joint_count=None, length=None, curve=None) -> None:
+        # Instances of installed chains pick up the options they were not given from the scene
+        options = scene_chain_options(f"{CLASS_NAME}__{user_specified_name}") or {}
+        self.length = float(options.get("length", DEFAULT_LENGTH) if length is None else length)
+        self.curve = float(options.get("curve", 0.0) if curve is None else curve)
+        if joint_count is None:
+            joint_count = options.get("joint_count", DEFAULT_JOINT_COUNT)
+
+        blueprint_mod.Blueprint.__init__(self, CLASS_NAME, user_specified_name, chain_layout(joint_count, self.length, self.curve).shared_copy(), hook_obj)
+
+    def rebuild_options(self):
+        return {"joint_count": len(self.joint_info), "length": self.length, "curve": self.curve}
+
+    def translation_controlled_joints(self, joints):
+        return [joints[0], joints[-1]]
+
+    def setup_stretchy_joint_segments(self, joints):
+        root_control = self.get_translation_control(joints[0])
+        end_control = self.get_translation_control(joints[-1])
+
+        # Same pole vector locator as Blueprint.setup_stretchy_joint_segment, so mirroring treats both alike
+        pole_vector_locator = cmds.spaceLocator(n=f"{root_control}_poleVectorLocator")[0]
+        pole_vector_locator_grp = cmds.group(n=f"{pole_vector_locator}_parentConstraintGrp")
+        cmds.parent(pole_vector_locator_grp, self.module_grp, a=1)
+        pole_parent_constraint = cmds.parentConstraint(root_control, pole_vector_locator_grp, mo=0)[0]
+        cmds.setAttr(f"{pole_vector_locator}.visibility", 0)
+        cmds.setAttr(f"{pole_vector_locator}.ty", -0.5)
+
+        chain_frame = cmds.group(em=1, n=f"{self.module_namespace}:chain_frame", p=self.joints_grp)
+        frame_point_constraint = cmds.pointConstraint(root_control, chain_frame, mo=0, n=f"{chain_frame}_pointConstraint")[0]
+        frame_aim_constraint = cmds.aimConstraint(end_control, chain_frame, mo=0, aim=[1.0, 0.0, 0.0], u=[0.0, -1.0, 0.0],
+                                                  wut="object", wuo=pole_vector_locator, n=f"{chain_frame}_aimConstraint")[0]
+
+        # Scale factor = control distance / original distance, shared by every joint
+        positions = self.joint_info.positions
+        original_length = float(np.linalg.norm(positions[-1] - positions[0]))
+
+        dist_node = cmds.shadingNode("distanceBetween", au=1, n=f"{self.module_namespace}:chain_distBetween")
+        cmds.connectAttr(f"{root_control}.worldMatrix[0]", f"{dist_node}.inMatrix1")
+        cmds.connectAttr(f"{end_control}.worldMatrix[0]", f"{dist_node}.inMatrix2")
+
+        scale_factor = cmds.shadingNode("multiplyDivide", au=1, n=f"{self.module_namespace}:chain_scaleFactor")
+        cmds.setAttr(f"{scale_factor}.operation", 2)  # Divide
+        cmds.connectAttr(f"{dist_node}.distance", f"{scale_factor}.input1X")
+        cmds.setAttr(f"{scale_factor}.input2X", original_length)
+        for axis in ["X", "Y", "Z"]:
+            cmds.connectAttr(f"{scale_factor}.outputX", f"{chain_frame}.scale{axis}")
+
+        cmds.parent(joints[0], chain_frame, a=1)
+
+        # The joints are the hierarchy representation, displayed as reference so they can't be selected
+        cmds.setAttr(f"{chain_frame}.overrideEnabled", 1)
+        cmds.setAttr(f"{chain_frame}.overrideDisplayType", 2)
+        for joint in joints:
+            cmds.setAttr(f"{joint}.visibility", 1)
+
+        utils.add_node_to_container(self.container_name, [pole_vector_locator_grp, pole_parent_constraint, chain_frame, frame_point_constraint,
+                                                          frame_aim_constraint, dist_node, scale_factor], ihb=1)
+
+    def install_custom(self, joints):
+        cmds.addAttr(self.module_grp, at="long", ln=JOINT_COUNT_ATTR, dv=len(joints), k=0)
+        cmds.addAttr(self.module_grp, at="double", ln=LENGTH_ATTR, dv=self.length, k=0)
+        cmds.addAttr(self.module_grp, at="double", ln=CURVE_ATTR, dv=self.curve, k=0)
+
+    def mirror(self, original_module, mirror_plane, rotation_function, translation_function):
+        # The mirrored chain copies the joint count, length and curve of the original
+        options = scene_chain_options(original_module)
+        if options is not None:
+            self.length = float(options["length"])
+            self.curve = float(options["curve"])
+            self.joint_info = chain_layout(options["joint_count"], self.length, self.curve).shared_copy()
+
+        blueprint_mod.Blueprint.mirror(self, original_module, mirror_plane, rotation_function, translation_function)
+
+    def mirror_custom(self, original_module):
+        pass
+
+    def world_joint_orientation(self, joint):
+        # Orientation of joint with its parents' rotations frozen in, read from an unparented duplicate
+        clean_joint = cmds.duplicate(joint, po=1)[0]
+        cmds.parent(clean_joint, f"{self.module_namespace}:joints_grp", a=1)
+        cmds.makeIdentity(clean_joint, a=1, r=1, s=0, t=0)
+
+        orientation = bulk_attrs.joint_orients([clean_joint])[0].tolist()
+        cmds.delete(clean_joint)
+        return orientation
+
+    def lock_phase_1(self):
+        joints = self.get_joints()
+
+        joint_positions = bulk_attrs.world_positions(joints).tolist()
+
+        # Frame rotation and scale are baked into the root, the rest of the chain keeps its joint orients
+        joint_orientations_values = [self.world_joint_orientation(joints[0])] + bulk_attrs.joint_orients(joints[1:]).tolist()
+        joint_orientations = (joint_orientations_values, None)
+
+        joint_rotation_orders = bulk_attrs.rotate_orders(joints[:1]).tolist()
+        joint_preferred_angles = None
+        hook_object = self.find_hook_object_for_lock()
+        root_transform = False
+
+        module_info = (joint_positions, joint_orientations, joint_rotation_orders, joint_preferred_angles, hook_object, root_transform)
+        return module_info
+
+    def UI_custom(self):
+        joint = self.get_joints()[0]
+        joint_name = utils.strip_all_namespaces(joint)[1]
+        self.blueprint_UI_instance.add_rotation_order_widget(f"Joint: {joint_name}", ["xyz", "yzx", "zxy", "xzy", "yxz", "zyx"], joint)
@@ -1,9 +1,9 @@
 import os
 import maya.cmds as cmds
 import System.blueprint as blueprint_mod
-import importlib
 import System.utils as utils
-importlib.reload(blueprint_mod)
+import System.bulk_attrs as bulk_attrs
+from System.joint_layout import JointLayout
 
 CLASS_NAME = "SingleJointSegment"
 TITLE = "Single Joint Segment"
@@ -12,9 +12,10 @@ ICON = f"{os.environ['RIGGING_TOOL_ROOT']}/Icons/_singleJointSeg.xpm"
 
 
 class SingleJointSegment(blueprint_mod.Blueprint):
+    JOINT_LAYOUT = JointLayout(["root_joint", "end_joint"], [[0.0, 0.0, 0.0], [4.0, 0.0, 0.0]], shared=True)
+
     def __init__(self, user_specified_name, hook_obj) -> None:
-        joint_info = [["root_joint", [0.0, 0.0, 0.0]], ["end_joint", [4.0, 0.0, 0.0]]]
-        blueprint_mod.Blueprint.__init__(self, CLASS_NAME, user_specified_name, joint_info, hook_obj)
+        blueprint_mod.Blueprint.__init__(self, CLASS_NAME, user_specified_name, self.JOINT_LAYOUT.shared_copy(), hook_obj)
 
     def install_custom(self, joints):
         self.create_orientation_control(joints[0], joints[1])
@@ -34,14 +35,10 @@ class SingleJointSegment(blueprint_mod.Blueprint):
         module_info = (joint_positions, joint_orientations, joint_rotation_orders, joint_preferred_angles, hook_object)
         return module_info
         """
-        joint_positions = []
         joint_orientations_values = []
-        joint_rotation_orders = []
         joints = self.get_joints()
         
-        
-        for joint in joints:
-            joint_positions.append(cmds.xform(joint, q=1, ws=1, t=1))
+        joint_positions = bulk_attrs.world_positions(joints).tolist()
         
         clean_parent = f"{self.module_namespace}:joints_grp"
         orientation_info = self.orientation_controlled_joint_get_orientation(joints[0], clean_parent)
@@ -49,7 +46,7 @@ class SingleJointSegment(blueprint_mod.Blueprint):
         joint_orientations_values.append(orientation_info[0])
         joint_orientations = (joint_orientations_values, None)
         
-        joint_rotation_orders.append(cmds.getAttr(f"{joints[0]}.rotateOrder"))
+        joint_rotation_orders = bulk_attrs.rotate_orders(joints[:1]).tolist()
         joint_preferred_angles = None
         hook_object = self.find_hook_object_for_lock()
         root_transform = False
@@ -66,11 +63,10 @@ class SingleJointSegment(blueprint_mod.Blueprint):
         self.blueprint_UI_instance.add_rotation_order_widget(f"Joint: {joint_name}", ["xyz", "yzx", "zxy", "xzy", "yxz", "zyx"], joint)
         
     def mirror_custom(self, original_module):
-        joint_name = self.joint_info[0][0]
-        original_joint = f"{original_module}:{joint_name}"
-        new_joint = f"{self.module_namespace}:{joint_name}"
+        original_joint = self.joint_info.full_names(original_module)[0]
+        new_joint = self.joint_info.full_names(self.module_namespace)[0]
         
         original_orientation_control = self.get_orientation_control(original_joint)
         new_orientation_control = self.get_orientation_control(new_joint)
         
-        cmds.setAttr(f"{new_orientation_control}.rotateX", cmds.getAttr(f"{original_orientation_control}.rotateX"))
\ No newline at end of file
+        bulk_attrs.set_attr([new_orientation_control], "rotateX", bulk_attrs.get_attr([original_orientation_control], "rotateX"))
\ No newline at end of file
@@ -1,8 +1,10 @@
 from PySide2 import QtCore, QtWidgets
 import maya.cmds as cmds
 import System.utils as utils
-import importlib
-importlib.reload(utils)
+import System.group_index as group_index
+import System.blueprint as blueprint_mod
+import System.group_engine as group_engine
+import System.progress as progress
 
 
 class MirrorModule(QtWidgets.QDialog):
@@ -39,41 +41,17 @@ class MirrorModule(QtWidgets.QDialog):
             self.mirror_module_UI()
             
     def find_sub_modules(self, group):
-        return_modules = []
-        
-        children = cmds.listRelatives(group, c=1)
-        children = cmds.ls(children, tr=1)
-        
-        for child in children:
-            if child.find("Group__") == 0:
-                return_modules.extend(self.find_sub_modules(child))
-            else:
-                namespace_info = utils.strip_leading_namespace(child)
-                if namespace_info is not None and namespace_info[1] == "module_transform":
-                    module = namespace_info[0]
-                    return_modules.append(module)
-                    
-        return return_modules
+        return list(group_index.get_index().modules_under(group))
     
     def is_module_a_mirror(self, module):
         module_group = f"{module}:module_grp"
         return cmds.attributeQuery("mirrorLinks", n=module_group, ex=1)
     
     def can_module_be_mirrored(self, module):
-        module_name_info = utils.find_all_module_names("/Modules/Blueprint")
-        valid_modules = module_name_info[0]
-        valid_module_names = module_name_info[1]
-        
-        module_name = module.partition("__")[0]
-        
-        if module_name not in valid_module_names:
+        ModuleClass = utils.find_module_class(module)
+        if ModuleClass is None:
             return False
         
-        index = valid_module_names.index(module_name)
-        mod = __import__(f"Blueprint.{valid_modules[index]}", {}, {}, valid_modules[index])
-        importlib.reload(mod)
-        
-        ModuleClass = getattr(mod, mod.CLASS_NAME)
         module_inst = ModuleClass("null", None)
         
         return module_inst.can_module_be_mirrored()
@@ -265,130 +243,103 @@ class MirrorModule(QtWidgets.QDialog):
 
 
     def mirror_modules(self):
-        mirror_module_progress_UI = cmds.progressWindow(t="Mirroring Module(s)", st="This may take a few minutes", ii=0)
-        mirror_module_progress = 0
-        
-        mirror_modules_progress_stage1_proportion = 15
-        mirror_modules_progress_stage2_proportion = 70
-        mirror_modules_progress_stage3_proportion = 10
-        
-        module_name_info = utils.find_all_module_names("/Modules/Blueprint")
-        valid_modules = module_name_info[0]
-        valid_module_names = module_name_info[1]
-        
-        for module in self.module_info:
-            module_name = module[0].partition("__")[0]
+        try:
+            self.build_mirrored_modules()
+        except progress.OperationCancelled:
+            # build_mirrored_modules is one undo chunk, undoing it removes everything mirrored so far
+            progress.undo_cancelled_operation("mirror_modules")
+            group_index.invalidate()
             
-            if module_name in valid_module_names:
-                index = valid_module_names.index(module_name)
-                module.append(valid_modules[index])
-                
-        mirror_module_progress_increment = mirror_modules_progress_stage1_proportion/len(self.module_info)
+    @utils.build_mode("mirror_modules")
+    def build_mirrored_modules(self):
         for module in self.module_info:
-            user_specified_name = module[0].partition("__")[2]
-            mod = __import__(f"Blueprint.{module[5]}", {}, {}, [module[5]])
-            importlib.reload(mod)
+            ModuleClass = utils.find_module_class(module[0])
+            module.append(ModuleClass.__module__.rpartition(".")[2])
             
-            ModuleClass = getattr(mod, mod.CLASS_NAME)
-            module_inst = ModuleClass(user_specified_name, None)
+        original_instances = []
+        for module in self.module_info:
+            ModuleClass = utils.find_module_class(module[0])
+            original_instances.append(ModuleClass(module[0].partition("__")[2], None))
             
-            hook_object = module_inst.find_hook_object()
-            new_hook_object = None
-            hook_module = utils.strip_leading_namespace(hook_object)[0]
-            hook_found = False
+        module_costs = [progress.module_cost(module_inst) for module_inst in original_instances]
+        hook_costs = [1] * len(self.module_info)
+        if self.group is not None:
+            hook_costs.append(len(group_index.get_index().child_groups) + 1)
             
-            for m in self.module_info:
-                if hook_module == m[0]:
-                    hook_found = True
-                    
-                    if m == module:
-                        continue
+        stages = [
+            ("Gathering hooks", [1] * len(self.module_info), 0.05),
+            ("Mirroring modules", module_costs, 0.01),
+            ("Hooking mirrored modules", hook_costs, 0.05),
+        ]
+        with progress.ProgressTask("mirror_modules", "Mirroring Module(s)", stages) as task:
+            task.begin_stage("Gathering hooks")
+            for module, module_inst in zip(self.module_info, original_instances):
+                hook_object = module_inst.find_hook_object()
+                new_hook_object = None
+                hook_module = utils.strip_leading_namespace(hook_object)[0]
+                hook_found = False
+                
+                for m in self.module_info:
+                    if hook_module == m[0]:
+                        hook_found = True
+                        
+                        if m == module:
+                            continue
+                        
+                        hook_object_name = utils.strip_leading_namespace(hook_object)[1]
+                        new_hook_object = f"{m[1]}:{hook_object_name}"
+                
+                if not hook_found:
+                    new_hook_object = hook_object
                     
-                    hook_object_name = utils.strip_leading_namespace(hook_object)[1]
-                    new_hook_object = f"{m[1]}:{hook_object_name}"
-            
-            if not hook_found:
-                new_hook_object = hook_object
+                module.append(new_hook_object)
                 
-            module.append(new_hook_object)
-            
-            hook_constrained = module_inst.is_root_constrained()
-            module.append(hook_constrained)
-            mirror_module_progress += mirror_module_progress_increment
-            cmds.progressWindow(mirror_module_progress_UI, e=1, pr=mirror_module_progress)
-            
-        mirror_module_progress_increment = mirror_modules_progress_stage2_proportion / len(self.module_info)
-        for module in self.module_info:
-            new_user_specified_name = module[1].partition("__")[2]
-            mod = __import__(f"Blueprint.{module[5]}", {}, {}, [module[5]])
-            importlib.reload(mod)
-            
-            ModuleClass = getattr(mod, mod.CLASS_NAME)
-            module_inst = ModuleClass(new_user_specified_name, None)
-            
-            module_inst.mirror(module[0], module[2], module[3], module[4])
-            mirror_module_progress += mirror_module_progress_increment
-            cmds.progressWindow(mirror_module_progress_UI, e=1, pr= mirror_module_progress)
-            
-        mirror_module_progress_increment = mirror_modules_progress_stage3_proportion/len(self.module_info)
-        
-        for module in self.module_info:
-            new_user_specified_name = module[1].partition("__")[2]
-            mod = __import__(f"Blueprint.{module[5]}", {}, {}, [module[5]])
-            importlib.reload(mod)
-            
-            ModuleClass = getattr(mod, mod.CLASS_NAME)
-            module_inst = ModuleClass(new_user_specified_name, None)
-
-            module_inst.rehook(module[6])
-            
-            if hook_constrained:
-                module_inst.constrain_root_to_hook()
+                hook_constrained = module_inst.is_root_constrained()
+                module.append(hook_constrained)
+                task.advance()
                 
-            mirror_module_progress += mirror_module_progress_increment
-            cmds.progressWindow(mirror_module_progress_UI, e=1, pr=mirror_module_progress)
-        
-        if self.group is not None:
-            print(f"======> {self.group}")
-            cmds.lockNode("Group_container", l=0, lu=0)
-            
-            group_parent = cmds.listRelatives(self.group, p=1)
-            
-            if group_parent is not None:
-                group_parent = group_parent[0]
+            task.begin_stage("Mirroring modules")
+            for module in self.module_info:
+                task.check_cancel()
+                new_user_specified_name = module[1].partition("__")[2]
+                ModuleClass = utils.find_module_class(module[0])
+                module_inst = ModuleClass(new_user_specified_name, None)
                 
-            self.process_group(self.group, group_parent)
-            
-            cmds.lockNode("Group_container", l=1, lu=1)
-            cmds.select(cl=1)  
+                module_inst.mirror(module[0], module[2], module[3], module[4])
+                task.advance()
+                
+            task.check_cancel()
+            task.begin_stage("Hooking mirrored modules")
+            hook_map = {}
+            for module in self.module_info:
+                new_user_specified_name = module[1].partition("__")[2]
+                ModuleClass = utils.find_module_class(module[0])
+                module_inst = ModuleClass(new_user_specified_name, None)
+                hook_map[module_inst] = module[6]
+                
+            # One lock scope over every mirrored container, rehook, root constraints and group mirroring nest inside it
+            containers = [module_inst.container_name for module_inst in hook_map]
+            if self.group is not None:
+                containers.append(group_engine.GROUP_CONTAINER)
+                
+            with utils.unlocked_containers(containers):
+                blueprint_mod.rehook_modules(hook_map)
+                
+                for module_inst, module in zip(hook_map, self.module_info):
+                    hook_constrained = module[7]
+                    if hook_constrained:
+                        module_inst.constrain_root_to_hook()
+                task.advance(len(self.module_info))
+                
+                if self.group is not None:
+                    group_parent = group_index.get_index().parent_group(self.group)
+                    self.process_group(self.group, group_parent)
+                    cmds.select(cl=1)  
+                    task.advance()
+            task.end_stage()
         
-        cmds.progressWindow(mirror_module_progress_UI, e=1, ep=1)
         utils.force_scene_update()
         
     def process_group(self, group, parent):
-        import System.GroupSelected as groupSelected
-        importlib.reload(groupSelected)
-        
-        temp_group = cmds.duplicate(group, po=1, ic=1)[0]
-        empty_group = cmds.group(em=1)
-        cmds.parent(temp_group, empty_group, a=1)
-        
-        scale_axis = ".scaleX"
-        
-        if self.mirror_plane == "XZ":
-            scale_axis = ".scaleY"
-        elif self.mirror_plane == "XY":
-            scale_axis = ".scaleZ"
-        
-        cmds.setAttr(f"{empty_group}{scale_axis}", -1)
-        
-        # Create an instance of GroupSelected
-        group_selected_instance = groupSelected.GroupSelected()
-        
-        # Pass the instance to GroupUI
-        instance = groupSelected.GroupUI(group_selected_instance)
-       
-        group_suffix = group.partition("__")[2]
-        new_group = instance.create_group_at_specified(f"{group_suffix}_mirror", temp_group, parent)
-        
-        cmds.lockNode("Group_container", l=0, lu=1)
+        module_map = {module[0]: module[1] for module in self.module_info}
+        return group_engine.mirror_group(group, self.mirror_plane, module_map, parent)
@@ -1,19 +1,278 @@
-import os  # Import os for file operations
 import maya.cmds as cmds  # Import Maya commands module
 import System.utils as utils  # Import custom utility functions
-from PySide2 import QtWidgets
-import importlib
+import System.group_index as group_index  # Import group hierarchy index
+import System.hook_index as hook_index  # Import reverse hook index
+import System.control_index as control_index  # Import translation control spatial index
+import System.events as events  # Import scene change notifications
+import System.representations as representations  # Import procedural blueprint representations
+import System.bulk_attrs as bulk_attrs  # Import batched attribute access
+from System.joint_layout import JointLayout  # Import joint layout type
+
+
+
+
+HOOK_CONSTRAINT_PLUGS = (
+    ("parentMatrix[0]", "targetParentMatrix"),
+    ("translate", "targetTranslate"),
+    ("rotatePivot", "targetRotatePivot"),
+    ("rotatePivotTranslate", "targetRotateTranslate"),
+)
+MIRROR_PLANE_AXIS = {"YZ": 0, "XZ": 1, "XY": 2}  # Coordinate flipped by each mirror plane
+
+
+@utils.undo_chunk("rehook_modules")
+def rehook_modules(hook_map):
+    """
+    Apply many hook changes in one pass.
+    hook_map = {module instance: new hook object}, None (or anything that is not another module's translation control) unhooks.
+    Every target is validated before anything is changed, each affected container is unlocked once,
+    and the reverse hook index is written once per hook target module.
+    Returns the module instances whose root had to be unconstrained from their old hook.
+    """
+    changes = []
+    unchanged = []
+    missing = []
+    for module_inst, new_hook_object in hook_map.items():
+        old_hook_object = module_inst.find_hook_object()
+        hook_object = module_inst.resolve_hook_object(new_hook_object)
+        
+        if hook_object == old_hook_object:
+            unchanged.append((module_inst, hook_object))
+            continue
+        if not cmds.objExists(hook_object):
+            missing.append(hook_object)
+            continue
+        changes.append((module_inst, old_hook_object, hook_object))
+        
+    if missing:
+        raise RuntimeError(f"Cannot rehook, hook object(s) do not exist: {', '.join(missing)}")
+    
+    for module_inst, hook_object in unchanged:
+        module_inst.hook_object = hook_object
+    
+    unconstrained = []
+    if len(changes) == 0:
+        return unconstrained
+    
+    containers = [change[0].container_name for change in changes]
+    with utils.unlocked_containers(containers):
+        for module_inst, old_hook_object, hook_object in changes:
+            module_inst.hook_object = hook_object
+            if module_inst.remove_root_hook_constraint():
+                unconstrained.append(module_inst)
+            
+            hook_constraint = f"{module_inst.module_namespace}:hook_pointConstraint"
+            for source_attr, target_attr in HOOK_CONSTRAINT_PLUGS:
+                cmds.connectAttr(f"{module_inst.hook_object}.{source_attr}", f"{hook_constraint}.target[0].{target_attr}", f=1)
+                
+        hook_changes = [(m.module_namespace, old_hook_object, hook_object) for m, old_hook_object, hook_object in changes]
+        hook_index.get_index().update(hook_changes)
+    events.emit(events.ModulesRehooked(hook_changes))
+    return unconstrained
+
+
+def expand_selection(selection):
+    """
+    Resolve node names, module namespaces and Group__ groups into (modules, groups).
+    modules = {module namespace: module instance} for every module in the scene, a group brings every module below it.
+    groups = {group: None} for the selected groups and every group nested in them.
+    """
+    index = group_index.get_index()
+    
+    module_namespaces = {}
+    groups = {}
+    for node in selection:
+        if node.find("Group__") == 0:
+            if node not in index.group_parent:
+                continue
+            module_namespaces.update(dict.fromkeys(index.modules_under(node)))
+            pending = [node]
+            while pending:
+                group = pending.pop()
+                groups[group] = None
+                pending.extend(index.child_groups[group])
+        else:
+            namespace_info = utils.strip_leading_namespace(node)
+            module_namespaces[node if namespace_info is None else namespace_info[0]] = None
+            
+    modules = {}
+    for module_namespace in module_namespaces:
+        ModuleClass = utils.find_module_class(module_namespace)
+        if ModuleClass is not None and cmds.objExists(f"{module_namespace}:module_container"):
+            modules[module_namespace] = ModuleClass(module_namespace.partition("__")[2], None)
+            
+    return modules, groups
+
+
+@utils.build_mode("install_modules")
+def install_modules(specs):
+    """
+    Install many modules as one operation.
+    specs = [{"module": CLASS_NAME, "name": user specified name (None = next instance_N),
+              "positions": joint positions (None = module defaults), "hook": hook object or None,
+              "options": extra module constructor arguments, e.g. {"joint_count": 40} for a Chain}, ...]
+    Module classes and names are resolved once for the whole batch and validated before anything is built,
+    the module transform control file is imported once and duplicated, and the scene is refreshed once at the end.
+    A spec may hook onto a translation control of a module installed earlier in the same batch.
+    Returns the module instances in spec order.
+    """
+    taken = utils.existing_user_specified_names()
+    new_names = iter(utils.new_user_specified_names(sum(1 for spec in specs if spec.get("name") is None), taken=taken))
+    
+    prepared = []
+    names = set(taken)
+    for spec in specs:
+        ModuleClass = utils.find_module_class(spec["module"])
+        if ModuleClass is None:
+            raise RuntimeError(f"Unknown blueprint module {spec['module']}")
+        
+        name = spec.get("name")
+        if name is None:
+            name = next(new_names)
+        elif name in names:
+            raise RuntimeError(f"Name {name} already exists")
+        names.add(name)
+        
+        module_inst = ModuleClass(name, spec.get("hook"), **spec.get("options", {}))
+        positions = spec.get("positions")
+        if positions is not None:
+            if len(positions) != len(module_inst.joint_info):
+                raise RuntimeError(f"{spec['module']} takes {len(module_inst.joint_info)} joint positions, got {len(positions)}")
+            module_inst.joint_info.set_positions(positions)
+        prepared.append(module_inst)
+        
+    for module_inst in prepared:
+        module_inst.install()
+    return prepared
+
+
+@utils.undo_chunk("auto_hook_modules")
+def auto_hook_modules(module_instances, max_distance=None):
+    """
+    Hook the root of every module in module_instances to the nearest translation control of another module.
+    Controls of the module itself and of every module hooked onto it, directly, through other hooks or through
+    hooks planned in this call, are skipped so no hook cycle can form. Modules with no control within
+    max_distance keep their hook. Returns {module instance: new hook object}.
+    """
+    index = control_index.get_index()
+    hooks = hook_index.get_index()
+    
+    planned = {}
+    hook_map = {}
+    for module_inst in module_instances:
+        blocked = {module_inst.module_namespace}
+        pending = [module_inst.module_namespace]
+        while pending:
+            module_namespace = pending.pop()
+            dependents = hooks.module_dependents(module_namespace)
+            dependents += [m for m, target in planned.items() if target == module_namespace]
+            for dependent in dependents:
+                if dependent not in blocked:
+                    blocked.add(dependent)
+                    pending.append(dependent)
+                    
+        root_position = index.position_of(module_inst.get_root_translation_control())
+        hook_object = index.nearest(root_position, blocked, max_distance)
+        if hook_object is None:
+            continue
+        
+        planned[module_inst.module_namespace] = hook_object.partition(":")[0]
+        hook_map[module_inst] = hook_object
+        
+    rehook_modules(hook_map)
+    return hook_map
+
+
+@utils.undo_chunk("delete_modules")
+def delete_modules(selection):
+    """
+    Delete any mix of modules and Group__ groups as a single undoable operation.
+    selection = node names, module namespaces or groups. A group takes every module and group below it with it.
+    Dependents of the deleted modules are unhooked in one batch, groups left empty are removed,
+    and Group_container is deleted once no group remains.
+    """
+    index = group_index.get_index()
+    hooks = hook_index.get_index()
+    
+    # Work out the full affected set before touching the scene
+    modules, groups = expand_selection(selection)
+            
+    if len(modules) == 0 and len(groups) == 0:
+        return
+    
+    dependents = {}
+    for module_namespace in modules:
+        for dependent in hooks.module_dependents(module_namespace):
+            if dependent in modules or dependent in dependents:
+                continue
+            ModuleClass = utils.find_module_class(dependent)
+            if ModuleClass is not None:
+                dependents[dependent] = ModuleClass(dependent.partition("__")[2], None)
+                
+    # Hooks of deleted modules onto surviving modules have to leave the surviving modules' index entries
+    own_hooks = []
+    for module_namespace, module_inst in modules.items():
+        hook_object = module_inst.find_hook_object()
+        hook_namespace_info = utils.strip_leading_namespace(hook_object)
+        if hook_namespace_info is not None and hook_namespace_info[0] not in modules:
+            own_hooks.append((module_namespace, hook_object, None))
+            
+    removed_groups = dict(groups)
+    candidates = [index.parent_group(m) for m in modules] + [index.group_parent.get(g) for g in groups]
+    while candidates:
+        group = candidates.pop()
+        if group is None or group in removed_groups:
+            continue
+        remaining_modules = [m for m in index.group_modules[group] if m not in modules]
+        remaining_groups = [g for g in index.child_groups[group] if g not in removed_groups]
+        if len(remaining_modules) == 0 and len(remaining_groups) == 0:
+            removed_groups[group] = None
+            candidates.append(index.group_parent.get(group))
+            
+    group_container = "Group_container"
+    group_container_empty = set(index.group_parent).issubset(removed_groups)
+    
+    containers = [module_inst.container_name for module_inst in modules.values()]
+    scope = [module_inst.container_name for module_inst in dependents.values()] + containers
+    if removed_groups:
+        scope.append(group_container)
+    
+    with utils.unlocked_containers(scope):
+        rehook_modules({module_inst: None for module_inst in dependents.values()})
+        hooks.update(own_hooks)
+
+        if containers:
+            cmds.delete(containers)
 
+        if removed_groups and cmds.objExists(group_container):
+            for group in removed_groups:
+                for attr in ['t', 'r', 'globalScale']:
+                    cmds.container(group_container, e=1, ubp=f"{group}.{attr}")
 
+            # Deleting the outermost groups takes the nested ones with them
+            top_groups = [g for g in removed_groups if index.group_parent.get(g) not in removed_groups]
+            cmds.delete(top_groups)
 
+            if group_container_empty:
+                cmds.delete(group_container)
 
+    cmds.namespace(set=":")
+    for module_namespace in modules:
+        if cmds.namespace(exists=f":{module_namespace}"):
+            cmds.namespace(rm=module_namespace)
+        hooks.forget(module_namespace)
+
+    index.remove_many(modules, removed_groups)
+    events.emit(events.ModulesDeleted(list(modules), list(removed_groups)))
+        
+        
 class Blueprint:
     def __init__(self, module_name, user_specified_name, joint_info, hook_obj_in) -> None:
         self.module_name = module_name
         self.user_specified_name = user_specified_name
         self.module_namespace = f"{self.module_name}__{self.user_specified_name}"  # Set namespace
         self.container_name = f"{self.module_namespace}:module_container"  # Set container name
-        self.joint_info = joint_info
+        self.joint_info = JointLayout.from_joint_info(joint_info)
         self.hook_object = None
         if hook_obj_in != None:
             partition_info = hook_obj_in.rpartition("_translation_control")
@@ -31,6 +290,10 @@ class Blueprint:
     def UI_custom(self):
         pass  
 
+    def rebuild_options(self):
+        # Constructor arguments, besides name and hook, that reinstall this module as it is (lock checkpoints)
+        return {}
+
     def lock_phase_1(self):
         """
         Gather and return all required information from this module's control objects.
@@ -50,6 +313,7 @@ class Blueprint:
         print("mirror_custom() method is not implemented by derived class")
     
     # Base Class Methods
+    @utils.build_mode("blueprint_install")
     def install(self):
         cmds.namespace(setNamespace=":")  # Set namespace to root
         cmds.namespace(add=self.module_namespace)  # Add namespace
@@ -65,31 +329,30 @@ class Blueprint:
 
         cmds.select(clear=True)
 
-        index = 0
+        joint_names = self.joint_info.full_names(self.module_namespace)
         joints = []
 
-        for joint in self.joint_info:
-            joint_name = joint[0]
-            joint_pos = joint[1]
+        for index, joint_name in enumerate(self.joint_info.names):
+            joint_pos = self.joint_info.position(index)
 
             parent_joint = ""
             if index > 0:
-                parent_joint = f"{self.module_namespace}:{self.joint_info[index - 1][0]}"
+                parent_joint = joint_names[index - 1]
                 cmds.select(parent_joint, replace=True)
 
-            joint_name_full = cmds.joint(n=f"{self.module_namespace}:{joint_name}", p=joint_pos)  # Create joint
+            joint_name_full = cmds.joint(n=joint_names[index], p=joint_pos)  # Create joint
             joints.append(joint_name_full)
 
             cmds.setAttr(f"{joint_name_full}.visibility", 0)  # Hide joint
-            utils.add_node_to_container(self.container_name, joint_name_full)  # Add joint to container
-
-            cmds.container(self.container_name, edit=True, publishAndBind=[f"{joint_name_full}.rotate", f"{joint_name}_R"])  # Publish rotate attribute
-            cmds.container(self.container_name, edit=True, publishAndBind=[f"{joint_name_full}.rotateOrder", f"{joint_name}_rotateOrder"])  # Publish rotate order attribute
 
             if index > 0:
                 cmds.joint(parent_joint, edit=True, orientJoint="xyz", sao="yup")  # Orient joint
 
-            index += 1
+        utils.add_node_to_container(self.container_name, joints)  # Add all joints to container in one edit
+
+        for joint_name_full, joint_name in zip(joints, self.joint_info.names):
+            cmds.container(self.container_name, edit=True, publishAndBind=[f"{joint_name_full}.rotate", f"{joint_name}_R"])  # Publish rotate attribute
+            cmds.container(self.container_name, edit=True, publishAndBind=[f"{joint_name_full}.rotateOrder", f"{joint_name}_rotateOrder"])  # Publish rotate order attribute
         
         if self.mirrored:
             mirror_XY = False
@@ -118,23 +381,21 @@ class Blueprint:
                 else:
                     cmds.delete(node)
             
-            index = 0
+            mirror_positions = []
             
-            for joint in mirror_joints:
-                joint_name = self.joint_info[index][0]
-                new_joint_name = cmds.rename(joint, f"{self.module_namespace}:{joint_name}")
-                self.joint_info[index][1] = cmds.xform(new_joint_name, q=1, ws=1, t=1)
+            for index, joint in enumerate(mirror_joints):
+                new_joint_name = cmds.rename(joint, joint_names[index])
+                mirror_positions.append(cmds.xform(new_joint_name, q=1, ws=1, t=1))
                 
-                index += 1
-            # return
+            self.joint_info.set_positions(mirror_positions)  # Copies a shared class-level layout on write
                 
 
         cmds.parent(joints[0], self.joints_grp, absolute=True)  # Parent first joint to joints group
 
-        self.initialize_module_transform(self.joint_info[0][1])  # Initialize module transform
+        self.initialize_module_transform(self.joint_info.position(0))  # Initialize module transform
 
         translations_controls = []
-        for joint in joints:
+        for joint in self.translation_controlled_joints(joints):
             translations_controls.append(self.create_translation_controller_at_joints(joint))  # Create translation controllers
 
         root_joint_point_constraint = cmds.pointConstraint(translations_controls[0], joints[0], mo=0, n=f"{joints[0]}_pointConstraint")  # Create point constraint
@@ -143,16 +404,16 @@ class Blueprint:
         
         self.initialize_hook(translations_controls[0]) # Initialize hook
 
-        for index in range(len(joints) - 1):
-            self.setup_stretchy_joint_segment(joints[index], joints[index+1])  # Setup stretchy joint segment
+        self.setup_stretchy_joint_segments(joints)
 
         self.install_custom(joints)  # Call custom install method
 
-        utils.force_scene_update()  # Force scene update
+        utils.force_scene_update([self.module_namespace])  # Force scene update
         cmds.lockNode(self.container_name, lock=True, lockUnpublished=True)  # Lock container
+        events.emit(events.ModuleInstalled(self.module_namespace, self.container_name, self.hook_object))
 
     def create_translation_controller_at_joints(self, joint):
-        pos_control_file = f"{os.environ['RIGGING_TOOL_ROOT']}/ControlObjects/Blueprint/translation_control.ma"
+        pos_control_file = utils.control_asset_path("/ControlObjects/Blueprint/translation_control.ma")
         cmds.file(pos_control_file, i=True)  # Import translation control file
 
         container = cmds.rename("translation_control_container", f"{joint}_translation_control_container")  # Rename container
@@ -181,6 +442,15 @@ class Blueprint:
     def get_translation_control(self, joint_name):
         return f"{joint_name}_translation_control"  # Get translation control name
 
+    def translation_controlled_joints(self, joints):
+        # Joints that get a translation control, every joint by default
+        return list(joints)
+
+    def setup_stretchy_joint_segments(self, joints):
+        # One stretchy IK segment per pair of joints by default
+        for index in range(len(joints) - 1):
+            self.setup_stretchy_joint_segment(joints[index], joints[index+1])  # Setup stretchy joint segment
+
     def setup_stretchy_joint_segment(self, parent_joint, child_joint):
         parent_translation_control = self.get_translation_control(parent_joint)  # Get parent translation control
         child_translation_control = self.get_translation_control(child_joint)  # Get child translation control
@@ -222,14 +492,8 @@ class Blueprint:
         cmds.parent(constrained_grp, self.hierarchy_representation_grp, r=1)  # Parent group to hierarchy representation group
 
     def create_stretchy_object(self, object_relative_filepath, object_container_name, object_name, parent_joint, child_joint):
-        object_file = f"{os.environ['RIGGING_TOOL_ROOT']}{object_relative_filepath}"
-        cmds.file(object_file, i=1)  # Import object file
-        object_container = cmds.rename(object_container_name, f"{parent_joint}_{object_container_name}")  # Rename container
-
-        for node in cmds.container(object_container, q=1, nl=1):
-            cmds.rename(node, f"{parent_joint}_{node}", ignoreShape=1)  # Rename nodes
-
-        object = f"{parent_joint}_{object_name}"
+        # Generated at the current representation level of detail, or imported from the object file
+        object_container, object = representations.create(object_relative_filepath, object_container_name, object_name, parent_joint)
 
         constrained_grp = cmds.group(em=1, n=f"{object}_parentConstraint_grp")  # Create group for object
         cmds.parent(object, constrained_grp, a=1)  # Parent object to group
@@ -246,10 +510,8 @@ class Blueprint:
         return (object_container, object, constrained_grp)
 
     def initialize_module_transform(self, root_pos):
-        control_grp_file = f"{os.environ['RIGGING_TOOL_ROOT']}/ControlObjects/Blueprint/controlGroup_control.ma"
-        cmds.file(control_grp_file, i=1)  # Import control group file
-
-        self.module_transform = cmds.rename("controlGroup_control", f"{self.module_namespace}:module_transform")  # Rename control group
+        # Import control group file, duplicated from one import when several modules install in one build
+        self.module_transform = utils.import_control_copy("/ControlObjects/Blueprint/controlGroup_control.ma", "controlGroup_control", f"{self.module_namespace}:module_transform")
         cmds.xform(self.module_transform, ws=1, a=1, t=root_pos)  # Set transform position
         
         
@@ -314,13 +576,10 @@ class Blueprint:
         return orientation_control
 
     def get_joints(self):
-        joint_basename = f"{self.module_namespace}:"
-        joints = []
-
-        for joint_inf in self.joint_info:
-            joints.append(f"{joint_basename}{joint_inf[0]}")  # Get full joint name
+        return list(self.joint_info.full_names(self.module_namespace))  # Get full joint names
 
-        return joints
+    def get_root_translation_control(self):
+        return self.get_translation_control(self.joint_info.full_names(self.module_namespace)[0])
 
     def get_orientation_control(self, joint_name):
         return f"{joint_name}_orientation_control"  # Get orientation control name
@@ -338,11 +597,7 @@ class Blueprint:
 
         cmds.makeIdentity(new_clean_parent, a=1, r=1, s=0, t=0)  # Freeze transformations
 
-        orientX = cmds.getAttr(f"{new_clean_parent}.jointOrientX")
-        orientY = cmds.getAttr(f"{new_clean_parent}.jointOrientY")
-        orientZ = cmds.getAttr(f"{new_clean_parent}.jointOrientZ")
-
-        orientation_values = (orientX, orientY, orientZ)
+        orientation_values = tuple(bulk_attrs.joint_orients([new_clean_parent])[0].tolist())
 
         return (orientation_values, new_clean_parent)
 
@@ -372,21 +627,24 @@ class Blueprint:
         hook_object = module_info[4]
         root_transform = module_info[5]
 
-        cmds.lockNode(self.container_name, l=0, lu=0)  # Unlock container
-        cmds.delete(self.container_name)  # Delete container
+        with utils.unlocked_containers(self.container_name):
+            cmds.delete(self.container_name)  # Delete container
         cmds.namespace(set=":")  # Set namespace to root
 
         joint_radius = 1
         if num_joints == 1:
             joint_radius = 1.5
 
+        blueprint_joint_names = self.joint_info.full_names(self.module_namespace, "blueprint_")
+        creation_pose_joint_names = self.joint_info.full_names(self.module_namespace, "creation_pose_")
+
         new_joints = []
         for i in range(num_joints):
             new_joint = ""
             cmds.select(cl=1)
 
             if orient_with_axis:
-                new_joint = cmds.joint(n=f"{self.module_namespace}:blueprint_{self.joint_info[i][0]}",
+                new_joint = cmds.joint(n=blueprint_joint_names[i],
                                        p=joint_positions[i], roo="xyz", rad=joint_radius)  # Create joint
 
                 if i != 0:
@@ -405,7 +663,7 @@ class Blueprint:
                 if i < num_orientations:
                     joint_orientation = [joint_orientations[i][0], joint_orientations[i][1], joint_orientations[i][2]]
 
-                new_joint = cmds.joint(n=f"{self.module_namespace}:blueprint_{self.joint_info[i][0]}",
+                new_joint = cmds.joint(n=blueprint_joint_names[i],
                                        p=joint_positions[i], o=joint_orientation, roo="xyz", rad=joint_radius)  # Create joint
 
             new_joints.append(new_joint)
@@ -429,7 +687,7 @@ class Blueprint:
 
         i = 0
         for node in creation_pose_grp_nodes:
-            renamed_node = cmds.rename(node, f"{self.module_namespace}:creation_pose_{self.joint_info[i][0]}")  # Rename nodes
+            renamed_node = cmds.rename(node, creation_pose_joint_names[i])  # Rename nodes
             cmds.setAttr(f"{renamed_node}.visibility", 0)  # Hide nodes
             i += 1
 
@@ -536,59 +794,12 @@ class Blueprint:
         joint_name = utils.strip_all_namespaces(joint)[1]
         attr_control_group = cmds.attrControlGrp(attribute=f"{joint}.rotateOrder", label=joint_name)  # Create attribute control group
         
+    @utils.undo_chunk("blueprint_delete")
     def delete(self):
-        cmds.lockNode(self.container_name, l=0, lu=0)
-        
-        valid_module_info = utils.find_all_module_names("/Modules/Blueprint")
-        valid_module = valid_module_info[0]
-        valid_module_names = valid_module_info[1]
-        
-        hooked_modules = set()
-        for joint_inf in self.joint_info:
-            joint = joint_inf[0]
-            translation_control = self.get_translation_control(f"{self.module_namespace}:{joint}")
-            
-            connections = cmds.listConnections(translation_control)
-            for connection in connections:
-                modules_instance = utils.strip_leading_namespace(connection)
-                
-                if modules_instance != None:
-                    split_string = modules_instance[0].partition("__")
-                    
-                    if modules_instance[0] != self.module_namespace and split_string[0] in valid_module_names:
-                        index = valid_module_names.index(split_string[0])
-                        hooked_modules.add((valid_module[index], split_string[2]))
-                        
-        for module in hooked_modules:
-            mod = __import__(f"Blueprint.{module[0]}", {}, {}, [module[0]])
-            ModuleClass = getattr(mod, mod.CLASS_NAME)
-            modules_inst = ModuleClass(module[1], None)
-            modules_inst.rehook(None)
-            
-        
-        
-        module_transform = f"{self.module_namespace}:module_transform"
-        module_transform_parent = cmds.listRelatives(module_transform, p=1)
-        
-        
-        cmds.delete(self.container_name)
-        
-        
-        cmds.namespace(set=":")
-        cmds.namespace(rm=self.module_namespace)
-        
-        if module_transform_parent != None:
-            parent_group = module_transform_parent[0]
-            children = cmds.listRelatives(parent_group, c=1)
-            children = cmds.ls(children, tr=1)
-            
-            if len(children) == 0:
-                cmds.select(parent_group, r=1)
-                import System.GroupSelected as group_selected
-                importlib.reload(group_selected)
-                group_selected.UngroupSelected()
+        delete_modules([self.module_namespace])
             
         
+    @utils.undo_chunk("blueprint_rename")
     def rename_module_instance(self, new_name):
         if new_name == self.user_specified_name:
             return True
@@ -615,17 +826,27 @@ class Blueprint:
         
         else:
             new_namespace = f"{self.module_name}__{new_name}"
-            cmds.lockNode(self.container_name, l=0, lu=0)
-            cmds.namespace(set=":")
-            cmds.namespace(add=new_namespace)
-            cmds.namespace(set=":")
+            new_container_name = f"{new_namespace}:module_container"
+            hook_object = self.find_hook_object()
+            with utils.unlocked_containers(self.container_name):
+                cmds.namespace(set=":")
+                cmds.namespace(add=new_namespace)
+                cmds.namespace(set=":")
+                
+                cmds.namespace(mv=[self.module_namespace, new_namespace])
+                cmds.namespace(rm=self.module_namespace)
+                utils.rename_unlocked_container(self.container_name, new_container_name)
+                
+                group_index.get_index(validate=False).rename_module(self.module_namespace, new_namespace)
+                hooks = hook_index.get_index()
+                hooks.forget(self.module_namespace)
+                hooks.rename_dependent(self.module_namespace, new_namespace, hook_object)
+                old_namespace = self.module_namespace
+                self.module_namespace = new_namespace
+                self.container_name = new_container_name
             
-            cmds.namespace(mv=[self.module_namespace, new_namespace])
-            cmds.namespace(rm=self.module_namespace)
-            self.module_namespace = new_namespace
-            self.container_name = f"{self.module_namespace}:module_container"
+            events.emit(events.ModuleRenamed(old_namespace, new_namespace, new_container_name))
             
-            cmds.lockNode(self.container_name, l=1, lu=1)
             return True
             
             
@@ -670,6 +891,7 @@ class Blueprint:
         target_point_constraint = cmds.pointConstraint(self.hook_object, end_locator, mo=0, n=f"{self.module_namespace}:hook_pointConstraint")[0]
         
         utils.add_node_to_container(hook_container, [root_point_constraint, target_point_constraint])
+        hook_index.get_index().update([(self.module_namespace, None, self.hook_object)])
         
         for node in [ik_handle, root_locator, end_locator, poleVectorObject]:
             cmds.parent(node, hook_grp, a=1)
@@ -685,31 +907,26 @@ class Blueprint:
         utils.add_node_to_container(hook_container, hook_representation_container)
         
         
+    @utils.undo_chunk("blueprint_rehook")
     def rehook(self, new_hook_object):
-        old_hook_object = self.find_hook_object()
+        unconstrained = rehook_modules({self: new_hook_object})
+        
+        if self in unconstrained:
+            root_control = self.get_root_translation_control()
+            cmds.select(root_control, r=1)
+            cmds.setToolTo("moveSuperContext")
         
-        self.hook_object = f"{self.module_namespace}:unhookedTarget"
+    def resolve_hook_object(self, new_hook_object):
+        hook_object = f"{self.module_namespace}:unhookedTarget"
         
         if new_hook_object != None:
             if new_hook_object.find("_translation_control") != -1:
                 split_string = new_hook_object.split("_translation_control")
                 if split_string[1] == "":
                     if utils.strip_leading_namespace(new_hook_object)[0] != self.module_namespace:
-                        self.hook_object = new_hook_object
+                        hook_object = new_hook_object
                         
-        if self.hook_object == old_hook_object:
-            return
-        
-        self.unconstrain_root_to_hook()
-        
-        cmds.lockNode(self.container_name, l=0, lu=0)
-        hook_constraint = f"{self.module_namespace}:hook_pointConstraint"
-        cmds.connectAttr(f"{self.hook_object}.parentMatrix[0]", f"{hook_constraint}.target[0].targetParentMatrix", f=1)
-        cmds.connectAttr(f"{self.hook_object}.translate", f"{hook_constraint}.target[0].targetTranslate", f=1)
-        cmds.connectAttr(f"{self.hook_object}.rotatePivot", f"{hook_constraint}.target[0].targetRotatePivot", f=1)
-        cmds.connectAttr(f"{self.hook_object}.rotatePivotTranslate", f"{hook_constraint}.target[0].targetRotateTranslate", f=1)
-        
-        cmds.lockNode(self.container_name, l=1, lu=1)
+        return hook_object
         
         
     def find_hook_object(self):
@@ -745,8 +962,9 @@ class Blueprint:
         cmds.lockNode(module_container, l=1, lu=1)
         
         
+    @utils.undo_chunk("blueprint_snap_root_to_hook")
     def snap_root_to_hook(self):
-        root_control = self.get_translation_control(f"{self.module_namespace}:{self.joint_info[0][0]}")
+        root_control = self.get_root_translation_control()
         hook_object = self.find_hook_object()
         
         if hook_object == f"{self.module_namespace}:unhookedTarger":
@@ -755,54 +973,58 @@ class Blueprint:
         hook_object_pos = cmds.xform(hook_object, q=1, ws=1, t=1)
         cmds.xform(root_control, ws=1, a=1, t=hook_object_pos)
         
+    @utils.undo_chunk("blueprint_constrain_root_to_hook")
     def constrain_root_to_hook(self):
-        root_control = self.get_translation_control(f"{self.module_namespace}:{self.joint_info[0][0]}")
+        root_control = self.get_root_translation_control()
         hook_object = self.find_hook_object()
         
         if hook_object == f"{self.module_namespace}:unhookedTarger":
             return
         
-        cmds.lockNode(self.container_name, l=0, lu=0)
-        
-        cmds.pointConstraint(hook_object, root_control, mo=0, n=f"{root_control}_hookConstraint")
-        cmds.setAttr(f"{root_control}.translate", l=1)
-        cmds.setAttr(f"{root_control}.visibility", l=0)
-        cmds.setAttr(f"{root_control}.visibility", 0)
-        cmds.setAttr(f"{root_control}.visibility", l=1)
-        
-        cmds.select(cl=1)
-        
-        cmds.lockNode(self.container_name, l=1, lu=1)
+        with utils.unlocked_containers(self.container_name):
+            cmds.pointConstraint(hook_object, root_control, mo=0, n=f"{root_control}_hookConstraint")
+            cmds.setAttr(f"{root_control}.translate", l=1)
+            cmds.setAttr(f"{root_control}.visibility", l=0)
+            cmds.setAttr(f"{root_control}.visibility", 0)
+            cmds.setAttr(f"{root_control}.visibility", l=1)
+            
+            cmds.select(cl=1)
         
         
         
+    @utils.undo_chunk("blueprint_unconstrain_root_to_hook")
     def unconstrain_root_to_hook(self):
-        cmds.lockNode(self.container_name, l=0, lu=0)
-        
-        root_control = self.get_translation_control(f"{self.module_namespace}:{self.joint_info[0][0]}")
+        with utils.unlocked_containers(self.container_name):
+            if self.remove_root_hook_constraint():
+                root_control = self.get_root_translation_control()
+                cmds.select(root_control, r=1)
+                cmds.setToolTo("moveSuperContext")
+        
+    def remove_root_hook_constraint(self):
+        # Expects the module container to be unlocked, returns True if a constraint was removed
+        root_control = self.get_root_translation_control()
         root_control_hook_constraint = f"{root_control}_hookConstraint"
         
-        if cmds.objExists(root_control_hook_constraint):
-            cmds.delete(root_control_hook_constraint)
-            
-            cmds.setAttr(f"{root_control}.translate", l=0)
-            cmds.setAttr(f"{root_control}.visibility", l=0)
-            cmds.setAttr(f"{root_control}.visibility", 1)
-            cmds.setAttr(f"{root_control}.visibility", l=1)
-            
-            cmds.select(root_control, r=1)
-            cmds.setToolTo("moveSuperContext")
-            
-        cmds.lockNode(self.container_name, l=1, lu=1)
+        if not cmds.objExists(root_control_hook_constraint):
+            return False
+        
+        cmds.delete(root_control_hook_constraint)
+        
+        cmds.setAttr(f"{root_control}.translate", l=0)
+        cmds.setAttr(f"{root_control}.visibility", l=0)
+        cmds.setAttr(f"{root_control}.visibility", 1)
+        cmds.setAttr(f"{root_control}.visibility", l=1)
+        return True
         
     def is_root_constrained(self):
-        root_control = self.get_translation_control(f"{self.module_namespace}:{self.joint_info[0][0]}")
+        root_control = self.get_root_translation_control()
         root_control_hook_constraint = f"{root_control}_hookConstraint"
         return cmds.objExists(root_control_hook_constraint)
     
     def can_module_be_mirrored(self):
         return self.module_can_be_mirrored
     
+    @utils.build_mode("blueprint_mirror")
     def mirror(self, original_module, mirror_plane, rotation_function, translation_function):
         self.mirrored = True
         self.original_module = original_module
@@ -811,101 +1033,63 @@ class Blueprint:
         
         self.install()
         
-        cmds.lockNode(self.container_name,l=0, lu=0)
+        with utils.unlocked_containers([self.container_name, f"{original_module}:module_container"]):
+            original_joints = self.joint_info.full_names(self.original_module)
+            new_joints = self.joint_info.full_names(self.module_namespace)
         
-        for joint_info in self.joint_info:
-            joint_name = joint_info[0]
+            bulk_attrs.set_rotate_orders(new_joints, bulk_attrs.rotate_orders(original_joints))
             
+            original_controlled_joints = self.translation_controlled_joints(original_joints)
+            new_controlled_joints = self.translation_controlled_joints(new_joints)
             
-            original_joint = f"{self.original_module}:{joint_name}"
-            new_joint = f"{self.module_namespace}:{joint_name}"
+            # Every control but the last has a pole vector locator, all of them are read and reflected in one pass
+            original_controls = [self.get_translation_control(joint) for joint in original_controlled_joints]
+            new_controls = [self.get_translation_control(joint) for joint in new_controlled_joints]
+            original_nodes = original_controls + [f"{control}_poleVectorLocator" for control in original_controls[:-1]]
+            new_nodes = new_controls + [f"{control}_poleVectorLocator" for control in new_controls[:-1]]
             
-            original_rotation_order = cmds.getAttr(f"{original_joint}.rotateOrder")
-            cmds.setAttr(f"{new_joint}.rotateOrder", original_rotation_order)
+            positions = bulk_attrs.world_positions(original_nodes)
+            positions[:, MIRROR_PLANE_AXIS[self.mirror_plane]] *= -1
+            bulk_attrs.set_world_positions(new_nodes, positions)
             
-        index = 0
-        for joint_info in self.joint_info:
-            mirror_pole_vector_locator = False
-            if index < len(self.joint_info) - 1:
-                mirror_pole_vector_locator = True
+            self.mirror_custom(original_module)
+        
+            module_group = f"{self.module_namespace}:module_grp"
+            cmds.select(module_group, r=1)
+        
+            enum_names = "none:x:y:z"
+            cmds.addAttr(at="enum", en=enum_names, ln="mirrorInfo", k=0)
+
+            enum_value = 0
+            if translation_function == "mirrored":
+                if mirror_plane == "YZ":
+                    enum_value = 1
+                elif mirror_plane == "XZ":
+                    enum_value = 1
+                elif mirror_plane == "XY":
+                    enum_value = 1
                 
-            joint_name = joint_info[0]
-            original_joint = f"{self.original_module}:{joint_name}"
-            new_joint = f"{self.module_namespace}:{joint_name}"
-            
-            original_translation_control = self.get_translation_control(original_joint)
-            new_translation_control = self.get_translation_control(new_joint)
+            cmds.setAttr(f"{module_group}.mirrorInfo", enum_value)
         
-            original_translation_control_position = cmds.xform(original_translation_control, q=1, ws=1, t=1)
-            
-            if self.mirror_plane == "YZ":
-                original_translation_control_position[0] *= -1  
-            elif self.mirror_plane == "XZ":
-                original_translation_control_position[1] *= -1
-            elif self.mirror_plane == "XY":
-                original_translation_control_position[2] *= -1
-                
-                
-            cmds.xform(new_translation_control, ws=1, a=1, t=original_translation_control_position)
-            
-            if mirror_pole_vector_locator:
-                original_pole_vector_locator = f"{original_translation_control}_poleVectorLocator"
-                new_pole_vector_locator = f"{new_translation_control}_poleVectorLocator"
-                original_pole_vector_locator_position = cmds.xform(original_pole_vector_locator, q=1, ws=1, t=1)
-                
-                if self.mirror_plane == "YZ":
-                    original_pole_vector_locator_position[0] *= -1  
-                elif self.mirror_plane == "XZ":
-                    original_pole_vector_locator_position[1] *= -1
-                elif self.mirror_plane == "XY":
-                    original_pole_vector_locator_position[2] *= -1
-                    
-                cmds.xform(new_pole_vector_locator, ws=1, a=1, t=original_pole_vector_locator_position)
-                
-            index += 1
-                
-            
-        self.mirror_custom(original_module)
+            linked_attribute = "mirrorLinks"
         
-        module_group = f"{self.module_namespace}:module_grp"
-        cmds.select(module_group, r=1)
-        
-        enum_names = "none:x:y:z"
-        cmds.addAttr(at="enum", en=enum_names, ln="mirrorInfo", k=0)
-
-        enum_value = 0
-        if translation_function == "mirrored":
-            if mirror_plane == "YZ":
-                enum_value = 1
-            elif mirror_plane == "XZ":
-                enum_value = 1
-            elif mirror_plane == "XY":
-                enum_value = 1
-                
-        cmds.setAttr(f"{module_group}.mirrorInfo", enum_value)
-        
-        linked_attribute = "mirrorLinks"
-        cmds.lockNode(f"{original_module}:module_container", l=0, lu=0)
-        
-        for module_link in ((original_module, self.module_namespace),(self.module_namespace, original_module)):
-            module_group = f"{module_link[0]}:module_grp"
-            attribute_value = f"{module_link[1]}__"
+            for module_link in ((original_module, self.module_namespace),(self.module_namespace, original_module)):
+                module_group = f"{module_link[0]}:module_grp"
+                attribute_value = f"{module_link[1]}__"
             
-            if mirror_plane == "YZ":
-                attribute_value += "X"
-            elif mirror_plane == "XZ":
-                attribute_value += "Y"
-            elif mirror_plane == "XY":
-                attribute_value += "Z"
+                if mirror_plane == "YZ":
+                    attribute_value += "X"
+                elif mirror_plane == "XZ":
+                    attribute_value += "Y"
+                elif mirror_plane == "XY":
+                    attribute_value += "Z"
                 
-            cmds.select(module_group)
-            cmds.addAttr(dt="string", ln=linked_attribute, k=0)
-            cmds.setAttr(f"{module_group}.{linked_attribute}", attribute_value, typ="string")
-            
-        for c in [f"{original_module}:module_container", self.container_name]:
-            cmds.lockNode(c, l=1, lu=1)
+                cmds.select(module_group)
+                cmds.addAttr(dt="string", ln=linked_attribute, k=0)
+                cmds.setAttr(f"{module_group}.{linked_attribute}", attribute_value, typ="string")
             
         cmds.select(cl=1)
+        events.emit(events.ModuleMirrored(self.module_namespace, original_module, mirror_plane))
             
             
             
\ No newline at end of file
@@ -1,9 +1,18 @@
-from PySide2 import QtCore, QtWidgets, QtGui
+from PySide2 import QtCore, QtWidgets
 from shiboken2 import wrapInstance
 import maya.cmds as cmds
 import maya.OpenMayaUI as omui
 import System.utils as utils
-import importlib
+import System.blueprint as blueprint_mod
+import System.group_index as group_index
+import System.hook_index as hook_index
+import System.progress as progress
+import System.warmup as warmup
+import System.module_manifest as module_manifest
+import System.viewport_lod as viewport_lod
+import System.events as events
+import System.lock_checkpoint as lock_checkpoint
+import System.bulk_attrs as bulk_attrs
 from functools import partial
 
 
@@ -17,6 +26,9 @@ class Blueprint_UI(QtWidgets.QDialog):
     def __init__(self, parent=None):
         super(Blueprint_UI, self).__init__(parent or maya_main_window())
         self.module_instance = None
+        self.shown_module_namespace = None  # Module whose controls the panel shows, kept current by scene events
+        self.event_handlers = [(events.ModuleRenamed, self.on_module_renamed), (events.ModulesRehooked, self.on_modules_rehooked),
+                               (events.ModulesDeleted, self.on_modules_deleted), (events.SceneReset, self.on_scene_reset)]
         self.setWindowTitle("Nardt Industries")
         self.setObjectName("BlueprintUIDialog")
         self.setMinimumSize(400, 598)
@@ -32,15 +44,61 @@ class Blueprint_UI(QtWidgets.QDialog):
     def showEvent(self, event):
         super().showEvent(event)
         self.create_script_job()  # Recreate the script job when the UI is shown
+        self.subscribe_events()
+        warmup.start()  # Warm the module registry and icon caches while Maya is idle
 
     def hideEvent(self, event):
         self.delete_script_job()  # Delete the script job when the UI is hidden
+        self.unsubscribe_events()
         super().hideEvent(event)
 
     def closeEvent(self, event):
         self.delete_script_job()  # Delete the script job when the UI is closed
+        self.unsubscribe_events()
         super().closeEvent(event)
 
+    def subscribe_events(self):
+        events.watch_scene()
+        for event_type, handler in self.event_handlers:
+            events.subscribe(event_type, handler)
+
+    def unsubscribe_events(self):
+        for event_type, handler in self.event_handlers:
+            events.unsubscribe(event_type, handler)
+        # Changes made while hidden were not followed, the next selection rebuilds the panel
+        self.shown_module_namespace = None
+
+    def forget_shown_module(self):
+        self.module_instance = None
+        self.shown_module_namespace = None
+        self.module_name_edit_top.setText("")
+        self.clear_rotation_order_widgets()
+
+    def on_module_renamed(self, event):
+        if event.old_namespace == self.shown_module_namespace:
+            # The instance was renamed in place, only the joint widgets hold the old names
+            self.shown_module_namespace = event.new_namespace
+            self.module_name_edit_top.setText(event.new_namespace.partition("__")[2])
+            self.create_module_specific_controls()
+
+    def on_modules_rehooked(self, event):
+        if self.module_instance != None and self.shown_module_namespace in [change[0] for change in event.changes]:
+            self.update_constrain_button()
+
+    def on_modules_deleted(self, event):
+        if self.shown_module_namespace in event.namespaces:
+            self.forget_shown_module()
+
+    def on_scene_reset(self, event):
+        if self.shown_module_namespace != None:
+            self.forget_shown_module()
+
+    def update_constrain_button(self):
+        if self.module_instance.is_root_constrained():
+            self.button_references['Constrain Root > Hook'].setText('Unconstrain Root')
+        else:
+            self.button_references['Constrain Root > Hook'].setText('Constrain Root > Hook')
+
     def create_script_job(self):
         if self.job_num is None:
             self.job_num = cmds.scriptJob(event=["SelectionChanged", self.modify_selected], parent=self.objectName())
@@ -55,9 +113,7 @@ class Blueprint_UI(QtWidgets.QDialog):
         control_enable = False  # Initialize control_enable at the beginning
 
         if len(selected_nodes) <= 1:
-            self.module_instance = None
             selected_module_namespace = None
-            current_module_file = None
             
             self.button_references['Ungroup'].setEnabled(False)
             self.button_references['Mirror Module'].setEnabled(False)
@@ -75,53 +131,38 @@ class Blueprint_UI(QtWidgets.QDialog):
                 namespace_and_node = utils.strip_leading_namespace(last_selected)
                 if namespace_and_node:
                     namespace = namespace_and_node[0]
-                    module_name_info = utils.find_all_module_names("/Modules/Blueprint")
-                    valid_modules = module_name_info[0]
-                    valid_modules_names = module_name_info[1]
-
-                    index = 0
-                    for module_name in valid_modules_names:
-                        module_name_inc_suffix = f"{module_name}__"
-                        if namespace.find(module_name_inc_suffix) == 0:
-                            current_module_file = valid_modules[index]
-                            selected_module_namespace = namespace
-                            break
-                        index += 1
+                    ModuleClass = utils.find_module_class(namespace)
+                    if ModuleClass != None and namespace.find("__") != -1:
+                        selected_module_namespace = namespace
 
             user_specified_name = ""
 
             if selected_module_namespace:
                 control_enable = True
-                user_specified_name = selected_module_namespace.partition("__")[2]
-                mod = __import__(f"Blueprint.{current_module_file}", {}, {}, [current_module_file])
-                importlib.reload(mod)
-
-                ModuleClass = getattr(mod, mod.CLASS_NAME)
-                self.module_instance = ModuleClass(user_specified_name, None)
-                self.module_name_edit_top.setText(user_specified_name)
-                
+                # Reselecting the shown module keeps its instance and widgets, events tell when they go stale
+                if selected_module_namespace != self.shown_module_namespace:
+                    user_specified_name = selected_module_namespace.partition("__")[2]
+                    self.module_instance = ModuleClass(user_specified_name, None)
+                    self.shown_module_namespace = selected_module_namespace
+                    self.module_name_edit_top.setText(user_specified_name)
+
+                    # Clear existing widgets
+                    self.clear_rotation_order_widgets()
+                    # Add module-specific controls
+                    self.create_module_specific_controls()
                 
                 self.button_references['Mirror Module'].setEnabled(True)
                 self.button_references['Mirror Module'].setText('Mirror Module')
                 
-                if self.module_instance.is_root_constrained():
-                    self.button_references['Constrain Root > Hook'].setText('Unconstrain Root')
-                else:
-                    self.button_references['Constrain Root > Hook'].setText('Constrain Root > Hook')
-
-                # Clear existing widgets
-                self.clear_rotation_order_widgets()
-                # Add module-specific controls
-                self.create_module_specific_controls()
+                self.update_constrain_button()
             else:
-                self.module_name_edit_top.setText("")
-                self.clear_rotation_order_widgets()
+                self.forget_shown_module()
         else:
             # Enable control when multiple nodes are selected
             control_enable = True
 
         # Enable or disable buttons based on control_enable flag
-        buttons_to_enable = ['Re-hook', 'Snap Root > Hook', 'Constrain Root > Hook', 'Group Selected',  'Delete']
+        buttons_to_enable = ['Re-hook', 'Snap Root > Hook', 'Constrain Root > Hook', 'Group Selected', 'Auto-hook', 'Delete']
         for button_text in buttons_to_enable:
             if button_text in self.button_references:
                 self.button_references[button_text].setEnabled(control_enable)
@@ -160,17 +201,21 @@ class Blueprint_UI(QtWidgets.QDialog):
 
         
         self.buttons = self.setup_buttons([
-            'Re-hook', 'Snap Root > Hook', 'Constrain Root > Hook', 'Group Selected', 'Ungroup', 'Mirror Module', ' ', 'Delete', ''
+            'Re-hook', 'Snap Root > Hook', 'Constrain Root > Hook', 'Group Selected', 'Ungroup', 'Mirror Module', 'Auto-hook', 'Delete', ''
         ])
 
+        self.auto_hook_checkbox = QtWidgets.QCheckBox("Auto-hook on Install")
+        self.viewport_lod_checkbox = QtWidgets.QCheckBox("Viewport LOD")
+        self.viewport_lod_checkbox.setChecked(viewport_lod.is_enabled())
+
         self.lock_button = QtWidgets.QPushButton("Lock")
+        self.unlock_button = QtWidgets.QPushButton("Unlock")
         self.publish_button = QtWidgets.QPushButton("Publish")
 
         self.module_widgets = []
-        for module in utils.find_all_modules("Modules/Blueprint"):
-            module_data = self.dynamic_import(module)
-            if module_data:
-                self.module_widgets.append(self.create_module_widget(module_data, module))
+        for module, constants in module_manifest.get_manifest("/Modules/Blueprint").items():
+            module_data = (constants.get("TITLE", "Default Title"), constants.get("DESCRIPTION", "No description provided."), constants.get("ICON", ""))
+            self.module_widgets.append(self.create_module_widget(module_data, module))
 
         self.rotation_order_scroll_area = self.create_rotation_order_scroll_area()
 
@@ -181,7 +226,7 @@ class Blueprint_UI(QtWidgets.QDialog):
         item_widget.setFixedSize(380, 80)
 
         button = QtWidgets.QPushButton()
-        icon = QtGui.QIcon(module_data[2])
+        icon = warmup.get_icon(module_data[2])
         button.setIcon(icon)
         button.setIconSize(QtCore.QSize(55, 55))
         button.setFixedSize(60, 60)
@@ -214,13 +259,17 @@ class Blueprint_UI(QtWidgets.QDialog):
         return item_widget
 
     def add_rotation_order_widget(self, label_text, combo_items, joint):
-        joint_label = QtWidgets.QLabel(label_text)
-        rotation_order_combo = QtWidgets.QComboBox()
-        rotation_order_combo.addItems(combo_items)
+        self.add_rotation_order_widgets([label_text], combo_items, [joint])
 
-        try:
-            # Attempt to get the current rotation order of the joint
-            current_rotation_order = cmds.getAttr(f"{joint}.rotateOrder")
+    def add_rotation_order_widgets(self, label_texts, combo_items, joints):
+        # The current rotation order of every joint is read in one call
+        widgets = [(label_text, joint) for label_text, joint in zip(label_texts, joints) if cmds.objExists(joint)]  # Locked joints get no widget
+        rotation_orders = bulk_attrs.rotate_orders([joint for _, joint in widgets])
+
+        for (label_text, joint), current_rotation_order in zip(widgets, rotation_orders.tolist()):
+            joint_label = QtWidgets.QLabel(label_text)
+            rotation_order_combo = QtWidgets.QComboBox()
+            rotation_order_combo.addItems(combo_items)
             rotation_order_combo.setCurrentIndex(current_rotation_order)
 
             # Connect the combo box change signal to update the joint's rotation order
@@ -228,13 +277,6 @@ class Blueprint_UI(QtWidgets.QDialog):
 
             self.rotation_order_layout.addWidget(joint_label)
             self.rotation_order_layout.addWidget(rotation_order_combo)
-        except ValueError as e:
-            # Handle the error if the joint does not exist
-            # print(f"joint locked removing {joint}.rotateOrder: {e} ui element")
-            pass
-            # Optionally, you can add a message or log the error
-
-
 
     def update_joint_rotation_order(self, joint, index):
         cmds.setAttr(f"{joint}.rotateOrder", index)
@@ -272,6 +314,8 @@ class Blueprint_UI(QtWidgets.QDialog):
 
         form_layout_top = QtWidgets.QFormLayout()
         form_layout_top.addRow("Module Name:", self.module_name_edit_top)
+        form_layout_top.addRow(self.auto_hook_checkbox)
+        form_layout_top.addRow(self.viewport_lod_checkbox)
         blueprint_layout.addLayout(form_layout_top)
 
         grid_layout = QtWidgets.QGridLayout()
@@ -283,6 +327,7 @@ class Blueprint_UI(QtWidgets.QDialog):
 
         vbox_layout = QtWidgets.QVBoxLayout()
         vbox_layout.addWidget(self.lock_button)
+        vbox_layout.addWidget(self.unlock_button)
         vbox_layout.addWidget(self.publish_button)
         blueprint_layout.addLayout(vbox_layout)
 
@@ -298,21 +343,6 @@ class Blueprint_UI(QtWidgets.QDialog):
         main_layout.addWidget(self.tab_widget)
         self.setLayout(main_layout)
 
-    def dynamic_import(self, module_name):
-        try:
-            module_path = f"Blueprint.{module_name}"
-            mod = __import__(module_path, fromlist=[module_name])
-            importlib.reload(mod)
-
-            title = getattr(mod, 'TITLE', 'Default Title')
-            description = getattr(mod, 'DESCRIPTION', 'No description provided.')
-            icon_path = getattr(mod, 'ICON', '')
-
-            return (title, description, icon_path)
-        except Exception as e:
-            self.display_error(f"Failed to import {module_name}: {e}")
-            return None
-        
     def display_error(self, message):
         msg_box = QtWidgets.QMessageBox()
         msg_box.setText("Error: " + message)
@@ -320,32 +350,26 @@ class Blueprint_UI(QtWidgets.QDialog):
         msg_box.exec_()
 
     def question(self):
-        button_pressed = QtWidgets.QMessageBox.question(self, "Question", "Converting blueprints to joints is irreversible..\nOnce done, modifications will no longer be possible.\nDo you wish to proceed?")
+        button_pressed = QtWidgets.QMessageBox.question(self, "Question", "Converting blueprints to joints replaces the blueprint controls.\nUse Unlock to rebuild the blueprints as they are now.\nDo you wish to proceed?")
         if button_pressed == QtWidgets.QMessageBox.Yes:
             self.lock()
         else:
             return
 
     def install_module(self, module, *args):
-        basename = "instance_"
-        cmds.namespace(setNamespace=":")
-        namespaces = cmds.namespaceInfo(listOnlyNamespaces=True)
-        for i in range(len(namespaces)):
-            if namespaces[i].find("__") != -1:
-                namespaces[i] = namespaces[i].partition("__")[2]
-        new_suffix = utils.find_highest_trailing_number(namespaces, basename) + 1
-        user_spec_name = f"{basename}{str(new_suffix)}"
+        user_spec_name = utils.new_user_specified_names(1)[0]
         
         hook_obj = self.find_hook_object_from_selection()
         
         
         try:
             module_path = f"Blueprint.{module}"
-            mod = __import__(module_path, fromlist=[module])
-            importlib.reload(mod)
+            mod = __import__(module_path, fromlist=[module])  # First import happens here, when the module is installed
             ModuleClass = getattr(mod, mod.CLASS_NAME)
             module_instance = ModuleClass(user_spec_name, hook_obj)
             module_instance.install()
+            if self.auto_hook_checkbox.isChecked() and not hook_index.is_translation_control(hook_obj):
+                blueprint_mod.auto_hook_modules([module_instance])
             module_transform = f"{mod.CLASS_NAME}__{user_spec_name}:module_transform"
             cmds.select(module_transform, r=1)
             cmds.setToolTo("moveSuperContext")
@@ -354,13 +378,35 @@ class Blueprint_UI(QtWidgets.QDialog):
 
     def create_connections(self):
         self.lock_button.clicked.connect(self.question)
+        self.unlock_button.clicked.connect(self.unlock)
         self.module_name_edit_top.editingFinished.connect(self.rename_module)
+        self.viewport_lod_checkbox.toggled.connect(self.toggle_viewport_lod)
         for button in self.buttons:
             if button.text() != '':
                 button.clicked.connect(self.button_clicked)
                 
     
     def lock(self, *args):
+        try:
+            self.lock_modules()
+        except progress.OperationCancelled:
+            # lock_modules is one undo chunk, undoing it restores every blueprint locked so far
+            progress.undo_cancelled_operation("blueprint_lock")
+            group_index.invalidate()
+            hook_index.invalidate()
+            
+    def unlock(self, *args):
+        # Selected locked modules, or every locked module when nothing locked is selected
+        selected = [namespace_info[0] for namespace_info in map(utils.strip_leading_namespace, cmds.ls(sl=1)) if namespace_info is not None]
+        locked = lock_checkpoint.locked_modules()
+        module_namespaces = [m for m in dict.fromkeys(selected) if m in locked] or None
+        try:
+            lock_checkpoint.unlock_modules(module_namespaces)
+        except RuntimeError as e:
+            self.display_error(str(e))
+            
+    @utils.build_mode("blueprint_lock")
+    def lock_modules(self):
         module_info = []  # Store (module, user_specified_name) pairs
         cmds.namespace(set=":")
         namespaces = cmds.namespaceInfo(ls=1)
@@ -375,7 +421,8 @@ class Blueprint_UI(QtWidgets.QDialog):
                 module = split_string[0]
                 user_specified_name = split_string[2]
 
-                if module in valid_module_names:
+                # Modules locked earlier, and not unlocked since, have no module transform
+                if module in valid_module_names and cmds.objExists(f"{n}:module_transform"):
                     index = valid_module_names.index(module)
                     module_info.append([valid_module_names[index], user_specified_name])
 
@@ -383,38 +430,58 @@ class Blueprint_UI(QtWidgets.QDialog):
             self.display_error("There appears to be no blueprint modules\ninstances in the current scene.\nAborting lock")
             return
 
-        module_instances = []
+        blueprint_instances = []
         for module in module_info:
             module_name = "Blueprint." + module[0]
-            try:
-                mod = __import__(module_name, fromlist=[module[0]])
-                importlib.reload(mod)
+            ModuleClass = utils.find_module_class(module[0])
+            if ModuleClass is None:
+                print(f"ModuleNotFoundError: No module named {module_name}")
+                self.display_error(f"Module {module_name} not found.\nAborting lock")
+                return
+            blueprint_instances.append(ModuleClass(module[1], None))
 
-                ModuleClass = getattr(mod, mod.CLASS_NAME)
-                module_inst = ModuleClass(module[1], None)
+        # Saved before lock_phase_1, which unhooks the modules, so unlock can rebuild them as they are now
+        lock_checkpoint.capture(blueprint_instances)
+
+        module_instances = []
+        for module_inst in blueprint_instances:
+            module_name = "Blueprint." + module_inst.module_name
+            try:
                 module_info = module_inst.lock_phase_1()
 
                 module_instances.append((module_inst, module_info))
-            except ModuleNotFoundError as e:
-                print(f"ModuleNotFoundError: {e}")
-                self.display_error(f"Module {module_name} not found.\nAborting lock")
-                return
             except Exception as e:
                 print(f"An error occurred: {e}")
                 self.display_error(f"An error occurred while locking module {module_name}.\nAborting lock")
                 return
 
-        for module in module_instances:
-            module[0].lock_phase_2(module[1])
-            
-        group_container = "Group_container"
-        if cmds.objExists(group_container):
-            cmds.lockNode(group_container, l=0, lu=0)
-            cmds.delete(group_container)
-            
-        for module in module_instances:
-            hook_object = module[1][4]
-            module[0].lock_phase_3(hook_object)
+        stages = [
+            ("Building joints", [progress.module_cost(module[0]) for module in module_instances], 0.01),
+            ("Hooking joints", [1] * len(module_instances), 0.02),
+        ]
+        with progress.ProgressTask("blueprint_lock", "Locking Blueprint(s)", stages) as task:
+            task.begin_stage("Building joints")
+            for module in module_instances:
+                task.check_cancel()
+                module[0].lock_phase_2(module[1])
+                task.advance()
+                
+            task.check_cancel()
+            task.begin_stage("Hooking joints")
+            group_container = "Group_container"
+            if cmds.objExists(group_container):
+                with utils.unlocked_containers(group_container):
+                    cmds.delete(group_container)
+                group_index.invalidate()
+                
+            for module in module_instances:
+                hook_object = module[1][4]
+                module[0].lock_phase_3(hook_object)
+                task.advance()
+            task.end_stage()
+
+        # Every module left the blueprint state, subscribers start over once the lock chunk closes
+        events.scene_reset("blueprint_lock")
 
     def button_clicked(self):
         sender = self.sender()
@@ -439,6 +506,8 @@ class Blueprint_UI(QtWidgets.QDialog):
             self.mirror_selection()
         elif sender.text() == 'Mirror Group':
             self.mirror_selection()
+        elif sender.text() == 'Auto-hook':
+            self.auto_hook_selection()
         
             
             
@@ -459,8 +528,17 @@ class Blueprint_UI(QtWidgets.QDialog):
                 controls.append(button)
         return controls
 
+    def auto_hook_selection(self, *args):
+        # Every selected module, or every module in a selected group, hooks to its nearest compatible control
+        selection = cmds.ls(sl=1)
+        modules = blueprint_mod.expand_selection(selection)[0]
+        blueprint_mod.auto_hook_modules(list(modules.values()))
+        
+        if len(selection) > 0:
+            cmds.select(selection, r=1)
+        
     def delete_module(self, *args):
-        self.module_instance.delete()
+        blueprint_mod.delete_modules(cmds.ls(sl=1))
         cmds.select(cl=1)
         
     def rename_module(self):
@@ -473,6 +551,12 @@ class Blueprint_UI(QtWidgets.QDialog):
             cmds.select(previous_selection, r=1)
         else:
             cmds.select(cl=1)
+
+    def toggle_viewport_lod(self, checked):
+        if checked:
+            viewport_lod.enable()
+        else:
+            viewport_lod.disable()
             
     def find_hook_object_from_selection(self, *args):
         selected_objects = cmds.ls(sl=1, tr=1)
@@ -517,17 +601,13 @@ class Blueprint_UI(QtWidgets.QDialog):
         
     def group_select(self, *args):
         import System.GroupSelected as group_selected
-        importlib.reload(group_selected)
-        
         group_selected.GroupSelected().show_UI()
         
     def ungroup_select(self, *args):
         import System.GroupSelected as group_selected
-        importlib.reload(group_selected)
         group_selected.UngroupSelected()
             
     def mirror_selection(self, *args):
         import System.MirrorModule as mirror_module
-        importlib.reload(mirror_module)
         mirror_module.MirrorModule()
             
@@ -0,0 +1,230 @@
+"""
+Batched attribute access: lists of plugs or nodes in, NumPy arrays out (and back).
+
+Reads go through maya.api.OpenMaya (one selection list and one pass over the plugs), or through cmds when
+OpenMaya is not available or a plug can't be resolved by it (published container attributes). Writes always go
+through cmds so they stay on the undo queue. HeadlessBackend keeps attribute values in a dict, for running the
+same code without Maya.
+Values are returned in UI units, like getAttr and xform: compound attributes give one row per plug.
+"""
+import numpy as np
+
+try:
+    import maya.cmds as cmds
+except ImportError:
+    cmds = None
+
+try:
+    import maya.api.OpenMaya as om
+except ImportError:
+    om = None
+
+_state = {"backend": None}
+_stats = {"calls": 0, "plugs": 0, "fallbacks": 0}
+
+
+def as_array(values, dtype=float):
+    # getAttr returns compounds as [(x, y, z)], every row is flattened to a plain list
+    flat = []
+    for value in values:
+        if isinstance(value, (list, tuple)):
+            if len(value) == 1 and isinstance(value[0], (list, tuple)):
+                value = value[0]
+            value = list(value)
+        flat.append(value)
+    return np.array(flat, dtype=dtype)
+
+
+def rows(values):
+    # Inverse of as_array for writing, a Python number per scalar plug and a list per compound plug
+    return np.asarray(values).tolist()
+
+
+class CmdsBackend:
+    name = "cmds"
+
+    def get_values(self, plugs):
+        return [cmds.getAttr(plug) for plug in plugs]
+
+    def set_values(self, plugs, values):
+        for plug, value in zip(plugs, rows(values)):
+            if isinstance(value, list):
+                cmds.setAttr(plug, *value)
+            else:
+                cmds.setAttr(plug, value)
+
+    def world_positions(self, nodes):
+        values = cmds.xform(nodes, q=1, ws=1, t=1)
+        return [values[i:i + 3] for i in range(0, len(values), 3)]
+
+    def set_world_positions(self, nodes, positions):
+        for node, position in zip(nodes, rows(positions)):
+            cmds.xform(node, ws=1, a=1, t=position)
+
+
+class OpenMayaBackend(CmdsBackend):
+    name = "openmaya"
+
+    def plug_value(self, plug):
+        if plug.isCompound:
+            return [self.plug_value(plug.child(i)) for i in range(plug.numChildren())]
+
+        attribute = plug.attribute()
+        if attribute.hasFn(om.MFn.kUnitAttribute):
+            unit_type = om.MFnUnitAttribute(attribute).unitType()
+            if unit_type == om.MFnUnitAttribute.kAngle:
+                return plug.asMAngle().asUnits(om.MAngle.uiUnit())
+            if unit_type == om.MFnUnitAttribute.kDistance:
+                return plug.asMDistance().asUnits(om.MDistance.uiUnit())
+            if unit_type == om.MFnUnitAttribute.kTime:
+                return plug.asMTime().asUnits(om.MTime.uiUnit())
+        elif attribute.hasFn(om.MFn.kEnumAttribute):
+            return plug.asShort()
+        elif attribute.hasFn(om.MFn.kNumericAttribute):
+            numeric_type = om.MFnNumericAttribute(attribute).numericType()
+            if numeric_type == om.MFnNumericData.kBoolean:
+                return int(plug.asBool())
+            if numeric_type in (om.MFnNumericData.kByte, om.MFnNumericData.kChar, om.MFnNumericData.kShort,
+                                om.MFnNumericData.kInt, om.MFnNumericData.kLong):
+                return plug.asInt()
+        return plug.asDouble()
+
+    def get_values(self, plugs):
+        selection = om.MSelectionList()
+        try:
+            for plug in plugs:
+                selection.add(plug)
+            return [self.plug_value(selection.getPlug(i)) for i in range(len(plugs))]
+        except (RuntimeError, TypeError):
+            # Published container attributes and other plugs the API does not resolve
+            _stats["fallbacks"] += 1
+            return CmdsBackend.get_values(self, plugs)
+
+    def world_positions(self, nodes):
+        selection = om.MSelectionList()
+        for node in nodes:
+            selection.add(node)
+
+        to_ui = om.MDistance.internalToUI(1.0)
+        positions = []
+        for i in range(len(nodes)):
+            translation = om.MTransformationMatrix(selection.getDagPath(i).inclusiveMatrix()).translation(om.MSpace.kWorld)
+            positions.append([translation.x * to_ui, translation.y * to_ui, translation.z * to_ui])
+        return positions
+
+
+class HeadlessBackend:
+    """
+    Attribute values in a dict, {"node.attribute": value}. There is no hierarchy:
+    the world position of a node is its translate.
+    """
+    name = "headless"
+
+    def __init__(self, values=None) -> None:
+        self.values = dict(values or {})
+
+    def get_values(self, plugs):
+        return [self.values[plug] for plug in plugs]
+
+    def set_values(self, plugs, values):
+        for plug, value in zip(plugs, rows(values)):
+            self.values[plug] = value
+
+    def world_positions(self, nodes):
+        return self.get_values([f"{node}.translate" for node in nodes])
+
+    def set_world_positions(self, nodes, positions):
+        self.set_values([f"{node}.translate" for node in nodes], positions)
+
+
+def get_backend():
+    if _state["backend"] is None:
+        if om is not None:
+            _state["backend"] = OpenMayaBackend()
+        elif cmds is not None:
+            _state["backend"] = CmdsBackend()
+        else:
+            _state["backend"] = HeadlessBackend()
+    return _state["backend"]
+
+
+def set_backend(backend=None):
+    # None goes back to the best backend available
+    _state["backend"] = backend
+
+
+def count(plugs):
+    _stats["calls"] += 1
+    _stats["plugs"] += len(plugs)
+
+
+# Plugs
+def get_values(plugs, dtype=float):
+    """
+    Values of every plug in one call: shape (n,) for scalar plugs, (n, k) for compound plugs.
+    """
+    plugs = list(plugs)
+    count(plugs)
+    if len(plugs) == 0:
+        return np.zeros(0, dtype=dtype)
+    return as_array(get_backend().get_values(plugs), dtype)
+
+
+def set_values(plugs, values):
+    plugs = list(plugs)
+    count(plugs)
+    if len(plugs) != 0:
+        get_backend().set_values(plugs, values)
+
+
+def get_attr(nodes, attr, dtype=float):
+    # The same attribute on every node
+    return get_values([f"{node}.{attr}" for node in nodes], dtype)
+
+
+def set_attr(nodes, attr, values):
+    set_values([f"{node}.{attr}" for node in nodes], values)
+
+
+# Transforms
+def world_positions(nodes):
+    # (n, 3) world space translations, xform -q -ws -t for every node
+    nodes = list(nodes)
+    count(nodes)
+    if len(nodes) == 0:
+        return np.zeros((0, 3))
+    return np.array(get_backend().world_positions(nodes), dtype=float).reshape(len(nodes), 3)
+
+
+def set_world_positions(nodes, positions):
+    nodes = list(nodes)
+    count(nodes)
+    if len(nodes) != 0:
+        get_backend().set_world_positions(nodes, np.asarray(positions, dtype=float).reshape(len(nodes), 3))
+
+
+def rotations(nodes):
+    return get_attr(nodes, "rotate").reshape(-1, 3)
+
+
+def joint_orients(nodes):
+    return get_attr(nodes, "jointOrient").reshape(-1, 3)
+
+
+def rotate_orders(nodes):
+    return get_attr(nodes, "rotateOrder", dtype=int)
+
+
+def set_rotate_orders(nodes, orders):
+    set_attr(nodes, "rotateOrder", [int(order) for order in orders])
+
+
+def get_stats():
+    stats = dict(_stats)
+    stats["backend"] = get_backend().name
+    return stats
+
+
+def reset_stats():
+    for key in _stats:
+        _stats[key] = 0
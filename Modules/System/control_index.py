@@ -0,0 +1,85 @@
+import maya.cmds as cmds
+import System.hook_index as hook_index
+import System.events as events
+import System.bulk_attrs as bulk_attrs
+from System.kdtree import KDTree
+
+
+class ControlIndex:
+    """
+    Spatial index over every module translation control in the scene.
+    ensure_current() reads all control positions with one bulk query and rebuilds the tree
+    only when a control was added, removed or moved. The control list itself is only searched again
+    after an event that adds or removes controls (see System.events).
+    """
+
+    def __init__(self) -> None:
+        self.controls = []
+        self.positions = []
+        self.control_modules = []
+        self.control_positions = {}
+        self.tree = None
+        self.controls_current = False
+
+    def clear(self):
+        self.controls = []
+        self.positions = []
+        self.control_modules = []
+        self.control_positions = {}
+        self.tree = None
+        self.controls_current = False
+
+    def scene_controls(self):
+        return [c for c in cmds.ls("*:*_translation_control", tr=1) or [] if hook_index.is_translation_control(c)]
+
+    def ensure_current(self):
+        controls = self.controls
+        # Controls deleted by hand are caught by the count, everything else arrives as an event
+        if not self.controls_current or len(cmds.ls(controls)) != len(controls):
+            controls = self.scene_controls()
+            self.controls_current = True
+
+        positions = [tuple(position) for position in bulk_attrs.world_positions(controls).tolist()]
+
+        if self.tree is None or controls != self.controls or positions != self.positions:
+            self.controls = controls
+            self.positions = positions
+            self.control_modules = [control.partition(":")[0] for control in controls]
+            self.control_positions = dict(zip(controls, positions))
+            self.tree = KDTree(positions)
+
+    def position_of(self, control):
+        if control in self.control_positions:
+            return self.control_positions[control]
+        return tuple(cmds.xform(control, q=1, ws=1, t=1))
+
+    def nearest(self, position, exclude_modules=(), max_distance=None):
+        """
+        Nearest translation control to position whose module is not in exclude_modules, or None.
+        """
+        exclude_modules = set(exclude_modules)
+        index = self.tree.nearest(position, lambda i: self.control_modules[i] not in exclude_modules, max_distance)
+        if index is None:
+            return None
+        return self.controls[index]
+
+
+_index = ControlIndex()
+
+
+def get_index(validate=True):
+    if validate:
+        _index.ensure_current()
+    return _index
+
+
+def invalidate():
+    _index.clear()
+
+
+def on_controls_changed(event):
+    _index.controls_current = False
+
+
+for event_type in (events.ModuleInstalled, events.ModuleRenamed, events.ModulesDeleted, events.SceneReset):
+    events.subscribe(event_type, on_controls_changed)
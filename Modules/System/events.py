@@ -0,0 +1,116 @@
+"""
+In-process notifications of blueprint scene changes.
+
+Operations emit typed events, subscribers register a callback per event type. Events emitted inside an undo chunk
+are held and delivered when the outermost chunk closes, so subscribers only ever see finished operations.
+When an operation raises, its held events are dropped and SceneReset is delivered instead, as it is after
+undo, redo and scene changes: state derived from the scene can no longer be updated incrementally.
+"""
+import traceback
+from collections import namedtuple
+from functools import partial
+
+try:
+    import maya.cmds as cmds
+except ImportError:
+    cmds = None  # Only watch_scene needs Maya, events themselves are plain Python
+
+ModuleInstalled = namedtuple("ModuleInstalled", ["namespace", "container", "hook_object"])
+ModuleRenamed = namedtuple("ModuleRenamed", ["old_namespace", "new_namespace", "container"])
+ModulesRehooked = namedtuple("ModulesRehooked", ["changes"])  # [(module namespace, old hook object, new hook object)]
+ModuleMirrored = namedtuple("ModuleMirrored", ["namespace", "original_namespace", "mirror_plane"])
+ModulesDeleted = namedtuple("ModulesDeleted", ["namespaces", "groups"])
+GroupsCreated = namedtuple("GroupsCreated", ["groups", "members"])  # members = {group: [module transforms and groups]}
+GroupsDissolved = namedtuple("GroupsDissolved", ["groups", "namespaces"])
+SceneReset = namedtuple("SceneReset", ["reason"])
+
+SCENE_EVENTS = ("Undo", "Redo", "SceneOpened", "NewSceneOpened")
+
+_subscribers = {}
+_pending = []
+_state = {"hold": 0, "jobs": []}
+_stats = {"emitted": 0, "delivered": 0, "dropped": 0, "errors": 0}
+
+
+def subscribe(event_type, callback):
+    callbacks = _subscribers.setdefault(event_type, [])
+    if callback not in callbacks:
+        callbacks.append(callback)
+
+
+def unsubscribe(event_type, callback):
+    callbacks = _subscribers.get(event_type, [])
+    if callback in callbacks:
+        callbacks.remove(callback)
+
+
+def deliver(event):
+    # A failing subscriber is reported and skipped, it never breaks the operation or the other subscribers
+    for callback in list(_subscribers.get(type(event), ())):
+        _stats["delivered"] += 1
+        try:
+            callback(event)
+        except Exception:
+            _stats["errors"] += 1
+            traceback.print_exc()
+
+
+def emit(event):
+    _stats["emitted"] += 1
+    if _state["hold"] > 0:
+        _pending.append(event)
+    else:
+        deliver(event)
+
+
+def hold():
+    _state["hold"] += 1
+
+
+def release(completed=True):
+    """
+    End a hold(). When the outermost hold ends the held events are delivered in emission order,
+    or replaced by a single SceneReset when the operation did not complete.
+    """
+    _state["hold"] = max(_state["hold"] - 1, 0)
+    if _state["hold"] > 0:
+        return
+
+    held = list(_pending)
+    del _pending[:]
+    if not completed:
+        _stats["dropped"] += len(held)
+        held = [SceneReset("failed_operation")]
+
+    for event in held:
+        deliver(event)
+
+
+def scene_reset(reason, *args):
+    emit(SceneReset(reason))
+
+
+def watch_scene():
+    # Undo, redo and file changes bypass the emitting operations, subscribers are told to start over
+    if _state["jobs"] and all(cmds.scriptJob(exists=job) for job in _state["jobs"]):
+        return
+    unwatch_scene()
+    _state["jobs"] = [cmds.scriptJob(event=[name, partial(scene_reset, name)]) for name in SCENE_EVENTS]
+
+
+def unwatch_scene():
+    for job in _state["jobs"]:
+        if cmds.scriptJob(exists=job):
+            cmds.scriptJob(kill=job, force=True)
+    _state["jobs"] = []
+
+
+def get_stats():
+    stats = dict(_stats)
+    stats["subscribers"] = {event_type.__name__: len(callbacks) for event_type, callbacks in _subscribers.items() if callbacks}
+    return stats
+
+
+def reset_stats():
+    for key in _stats:
+        _stats[key] = 0
@@ -0,0 +1,92 @@
+import functools
+from contextlib import contextmanager
+import maya.cmds as cmds
+
+# Footprint keys compared against a budget, node_types is compared per node type
+BUDGET_KEYS = ("nodes", "published_attributes", "cmds_calls")
+
+
+def _counted(name, function, counts):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        counts[name] = counts.get(name, 0) + 1
+        return function(*args, **kwargs)
+    return wrapper
+
+
+@contextmanager
+def count_cmds_calls():
+    """
+    Count every maya.cmds call made inside the block, by command name. Yields the {command: calls} dict.
+    Works because every module calls through the maya.cmds module attribute (import maya.cmds as cmds).
+    """
+    counts = {}
+    originals = {}
+    for name in dir(cmds):
+        function = getattr(cmds, name)
+        if name.startswith("_") or not callable(function):
+            continue
+        originals[name] = function
+        setattr(cmds, name, _counted(name, function, counts))
+    try:
+        yield counts
+    finally:
+        for name, function in originals.items():
+            setattr(cmds, name, function)
+
+
+def scene_node_ids():
+    return set(cmds.ls(uuid=1) or [])
+
+
+def measure(operation, *args, **kwargs):
+    """
+    Run operation(*args, **kwargs) and return its footprint:
+    {"nodes", "node_types": {type: count}, "published_attributes", "cmds_calls", "cmds_by_command": {command: count}}.
+    Nodes are the ones created by the operation that still exist afterwards, published attributes are counted
+    on the containers among them.
+    """
+    before = scene_node_ids()
+    with count_cmds_calls() as calls:
+        operation(*args, **kwargs)
+
+    created = cmds.ls(list(scene_node_ids() - before)) or []
+    node_types = {}
+    published_attributes = 0
+    for node in created:
+        node_type = cmds.nodeType(node)
+        node_types[node_type] = node_types.get(node_type, 0) + 1
+        if node_type == "container":
+            published_attributes += len(cmds.container(node, q=1, bindAttr=1) or []) // 2
+
+    return {
+        "nodes": len(created),
+        "node_types": dict(sorted(node_types.items())),
+        "published_attributes": published_attributes,
+        "cmds_calls": sum(calls.values()),
+        "cmds_by_command": dict(sorted(calls.items(), key=lambda item: -item[1])),
+    }
+
+
+def compare(footprint, budget):
+    """
+    Return a list of "key: measured > budget" strings for every value of footprint over its budget.
+    Keys missing from budget are not checked.
+    """
+    over = []
+    for key in BUDGET_KEYS:
+        if key in budget and footprint[key] > budget[key]:
+            over.append(f"{key}: {footprint[key]} > {budget[key]}")
+
+    if "node_types" in budget:
+        for node_type, count in footprint["node_types"].items():
+            if count > budget["node_types"].get(node_type, 0):
+                over.append(f"{node_type} nodes: {count} > {budget['node_types'].get(node_type, 0)}")
+    return over
+
+
+def to_budget(footprint):
+    # The part of a footprint that is checked in as a budget
+    budget = {key: footprint[key] for key in BUDGET_KEYS}
+    budget["node_types"] = dict(footprint["node_types"])
+    return budget
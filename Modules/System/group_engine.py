@@ -0,0 +1,311 @@
+import maya.cmds as cmds
+import System.utils as utils
+import System.group_index as group_index
+import System.events as events
+import System.bulk_attrs as bulk_attrs
+
+GROUP_PREFIX = group_index.GROUP_PREFIX
+GROUP_CONTAINER = "Group_container"
+MIRROR_AXIS = {"YZ": "X", "XZ": "Y", "XY": "Z"}
+
+
+def full_group_name(name):
+    if name.find(GROUP_PREFIX) == 0:
+        return name
+    return f"{GROUP_PREFIX}{name}"
+
+
+def create_group_transforms(names):
+    # The control shape is imported once per call, every further group is a duplicate of the raw import
+    if len(names) == 0:
+        return []
+
+    control_grp_file = utils.control_asset_path("/ControlObjects/Blueprint/controlGroup_control.ma")
+    cmds.file(control_grp_file, i=1)
+    group_transforms = [cmds.rename("controlGroup_control", names[0])]
+    for name in names[1:]:
+        group_transforms.append(cmds.duplicate(group_transforms[0], n=name)[0])
+
+    for group_transform in group_transforms:
+        cmds.connectAttr(f"{group_transform}.scaleY", f"{group_transform}.scaleX")
+        cmds.connectAttr(f"{group_transform}.scaleY", f"{group_transform}.scaleZ")
+
+        for attr in ['scaleX', 'scaleZ', 'visibility']:
+            cmds.setAttr(f"{group_transform}.{attr}", l=1, k=0)
+
+        cmds.aliasAttr("globalScale", f"{group_transform}.scaleY")
+
+    return group_transforms
+
+
+def read_positions(objects):
+    # Single bulk query for every object, returned as one [x, y, z] per object
+    return bulk_attrs.world_positions(objects).tolist()
+
+
+def average_position(positions):
+    number_of_positions = len(positions)
+    if number_of_positions == 0:
+        return None
+    return [sum(pos[axis] for pos in positions) / number_of_positions for axis in range(3)]
+
+
+def module_containers_for(objects):
+    containers = []
+    for obj in objects:
+        if obj.find(GROUP_PREFIX) == 0:
+            continue
+        namespace_info = utils.strip_leading_namespace(obj)
+        if namespace_info is None:
+            continue
+        container = f"{namespace_info[0]}:module_container"
+        if container not in containers:
+            containers.append(container)
+    return containers
+
+
+def publish_group(group):
+    utils.add_node_to_container(GROUP_CONTAINER, group, include_shapes=True)
+    group_name = group.partition(GROUP_PREFIX)[2]
+
+    # Ensure valid attribute alias names
+    if group_name[0].isdigit():
+        group_name = "_" + group_name
+
+    cmds.container(GROUP_CONTAINER, e=1, pb=[f"{group}.translate", f"{group_name}_t"])
+    cmds.container(GROUP_CONTAINER, e=1, pb=[f"{group}.rotate", f"{group_name}_r"])
+    cmds.container(GROUP_CONTAINER, e=1, pb=[f"{group}.globalScale", f"{group_name}_globalScale"])
+
+
+def prepare_group_specs(specs):
+    """
+    Normalize group specs and resolve every pivot from one bulk position read.
+    spec keys: name, objects (module transforms and/or groups), pivot ("last", "average" or [x, y, z]),
+    match (node whose world transform and globalScale the group copies), parent (group to nest under).
+    """
+    prepared = []
+    names = set()
+    to_read = []
+    for spec in specs:
+        name = full_group_name(spec["name"])
+        if name in names or cmds.objExists(name):
+            raise RuntimeError(f"Group {name} already exists")
+        names.add(name)
+
+        objects = list(spec.get("objects") or [])
+        pivot = spec.get("pivot", "last")
+        prepared.append({"name": name, "objects": objects, "pivot": pivot, "match": spec.get("match"),
+                         "parent": spec.get("parent"), "position": None})
+
+        if spec.get("match") is None and objects:
+            if pivot == "last":
+                to_read.append(objects[-1])
+            elif pivot == "average":
+                to_read.extend(objects)
+
+    to_read = list(dict.fromkeys(to_read))
+    positions = dict(zip(to_read, read_positions(to_read)))
+
+    for spec in prepared:
+        if spec["match"] is not None:
+            continue
+        pivot = spec["pivot"]
+        if isinstance(pivot, (list, tuple)):
+            spec["position"] = list(pivot)
+        elif spec["objects"]:
+            if pivot == "last":
+                spec["position"] = positions[spec["objects"][-1]]
+            elif pivot == "average":
+                spec["position"] = average_position([positions[obj] for obj in spec["objects"]])
+
+    return prepared
+
+
+def build_groups(prepared):
+    # Expects Group_container and every member module container to be unlocked
+    index = group_index.get_index(validate=False)
+    group_transforms = create_group_transforms([spec["name"] for spec in prepared])
+
+    for spec, group_transform in zip(prepared, group_transforms):
+        if spec["match"] is not None:
+            parent_constraint = cmds.parentConstraint(spec["match"], group_transform, mo=0)[0]
+            cmds.delete(parent_constraint)
+            cmds.setAttr(f"{group_transform}.globalScale", cmds.getAttr(f"{spec['match']}.globalScale"))
+        elif spec["position"] is not None:
+            cmds.xform(group_transform, ws=1, a=1, t=spec["position"])
+
+        if spec["parent"] is not None:
+            cmds.parent(group_transform, spec["parent"], a=1)
+
+        objects = spec["objects"]
+        if len(objects) != 0:
+            temp_group = cmds.group(objects, a=1)
+            group_parent = cmds.listRelatives(temp_group, p=1)
+
+            if group_parent != None:
+                cmds.parent(group_transform, group_parent[0], a=1)
+
+            cmds.parent(objects, group_transform, a=1)
+            cmds.delete(temp_group)
+
+        publish_group(group_transform)
+
+        group_parent = cmds.listRelatives(group_transform, p=1)
+        if group_parent is not None:
+            group_parent = group_parent[0]
+        index.add_group(group_transform, group_parent, objects)
+
+    return group_transforms
+
+
+@utils.undo_chunk("create_groups")
+def create_groups(specs):
+    """
+    Create several groups in one operation. Groups may nest under groups created earlier in the same call.
+    Group_container and every member module container are unlocked and relocked once.
+    Returns the new group transforms in spec order.
+    """
+    prepared = prepare_group_specs(specs)
+    if len(prepared) == 0:
+        return []
+
+    if not cmds.objExists(GROUP_CONTAINER):
+        cmds.container(n=GROUP_CONTAINER)
+
+    objects = [obj for spec in prepared for obj in spec["objects"]]
+    containers = [GROUP_CONTAINER] + module_containers_for(objects)
+
+    with utils.unlocked_containers(containers):
+        group_transforms = build_groups(prepared)
+
+    events.emit(events.GroupsCreated(group_transforms, {g: list(spec["objects"]) for spec, g in zip(prepared, group_transforms)}))
+    return group_transforms
+
+
+def create_group(name, objects=(), pivot="last", parent=None, match=None):
+    return create_groups([{"name": name, "objects": objects, "pivot": pivot, "parent": parent, "match": match}])[0]
+
+
+@utils.undo_chunk("nest_groups")
+def nest_groups(groups, parent):
+    # Move existing groups under parent, or back to the top level when parent is None
+    index = group_index.get_index()
+    groups = [g for g in groups if g in index.group_parent and g != parent]
+    if len(groups) == 0:
+        return
+
+    with utils.unlocked_containers(GROUP_CONTAINER):
+        if parent is None:
+            cmds.parent(groups, w=1, a=1)
+        else:
+            cmds.parent(groups, parent, a=1)
+
+    index.move_members(groups, parent)
+
+
+@utils.undo_chunk("dissolve_groups")
+def dissolve_groups(groups):
+    """
+    Ungroup every group in groups: members move up to the group's parent, the group and its
+    published attributes are removed. Parent groups left empty are removed as well, and Group_container
+    is deleted once no group in it has members.
+    """
+    index = group_index.get_index()
+    groups = [g for g in groups if g in index.group_parent]
+    if len(groups) == 0:
+        return
+
+    modules = []
+    for group in groups:
+        modules.extend(index.modules_under(group))
+    modules = list(dict.fromkeys(modules))
+
+    parent_groups = [index.group_parent[g] for g in groups if index.group_parent[g] not in (None, *groups)]
+    containers = [GROUP_CONTAINER] + [f"{module}:module_container" for module in modules]
+
+    with utils.unlocked_containers(containers):
+        for group in groups:
+            if not index.is_group_empty(group):
+                cmds.ungroup(group, a=1)
+            remove_group(index, group)
+
+        dissolved = list(groups)
+        for parent in dict.fromkeys(parent_groups):
+            if parent in index.group_parent and index.is_group_empty(parent):
+                remove_group(index, parent)
+                dissolved.append(parent)
+
+        if all(index.is_group_empty(g) for g in index.group_parent):
+            dissolved.extend(index.group_parent)
+            for group in list(index.group_parent):
+                remove_group(index, group)
+            cmds.delete(GROUP_CONTAINER)
+
+    events.emit(events.GroupsDissolved(dissolved, modules))
+
+
+def remove_group(index, group):
+    # Unpublish and delete an ungrouped or empty group, Group_container must be unlocked
+    for attr in ['t', 'r', 'globalScale']:
+        cmds.container(GROUP_CONTAINER, e=1, ubp=f"{group}.{attr}")
+
+    if cmds.objExists(group):
+        cmds.delete(group)
+    index.remove_group(group)
+
+
+@utils.undo_chunk("mirror_group")
+def mirror_group(group, mirror_plane, module_map, parent=None, suffix="_mirror"):
+    """
+    Mirror group and every group nested in it across mirror_plane ("XY", "YZ" or "XZ").
+    module_map = {original module namespace: mirrored module namespace}. Mirrored modules are parented
+    into the mirrored counterpart of their original group, and both sides get mirrorLinks.
+    Returns {original group: mirrored group}.
+    """
+    index = group_index.get_index()
+    tree = []
+    pending = [group]
+    while pending:
+        current = pending.pop(0)
+        tree.append(current)
+        pending.extend(index.child_groups.get(current, ()))
+
+    # All groups are mirrored together under a single negatively scaled parent
+    empty_group = cmds.group(em=1, n="TEMP_mirror_group")
+    temp_groups = {}
+    for current in tree:
+        temp_group = cmds.duplicate(current, po=1, n=f"TEMP_{current}")[0]
+        cmds.parent(temp_group, empty_group, a=1)
+        temp_groups[current] = temp_group
+
+    cmds.setAttr(f"{empty_group}.scale{MIRROR_AXIS[mirror_plane]}", -1)
+
+    mirrored_names = {current: full_group_name(f"{current.partition(GROUP_PREFIX)[2]}{suffix}") for current in tree}
+    specs = []
+    for current in tree:
+        objects = [f"{module_map[m]}:module_transform" for m in index.group_modules.get(current, ()) if m in module_map]
+        group_parent = parent if current == group else mirrored_names[index.group_parent[current]]
+        specs.append({"name": mirrored_names[current], "objects": objects, "match": temp_groups[current], "parent": group_parent})
+
+    try:
+        prepared = prepare_group_specs(specs)
+
+        if not cmds.objExists(GROUP_CONTAINER):
+            cmds.container(n=GROUP_CONTAINER)
+
+        objects = [obj for spec in prepared for obj in spec["objects"]]
+        containers = [GROUP_CONTAINER] + module_containers_for(objects)
+
+        with utils.unlocked_containers(containers):
+            new_groups = build_groups(prepared)
+
+            for original_group, new_group in zip(tree, new_groups):
+                for group_link in ((original_group, new_group), (new_group, original_group)):
+                    if not cmds.attributeQuery("mirrorLinks", n=group_link[0], ex=1):
+                        cmds.addAttr(group_link[0], dt="string", ln="mirrorLinks", k=0)
+                    cmds.setAttr(f"{group_link[0]}.mirrorLinks", f"{group_link[1]}__{MIRROR_AXIS[mirror_plane]}", typ="string")
+    finally:
+        cmds.delete(empty_group)
+
+    events.emit(events.GroupsCreated(new_groups, {g: list(spec["objects"]) for spec, g in zip(prepared, new_groups)}))
+    return dict(zip(tree, new_groups))
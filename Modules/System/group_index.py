@@ -0,0 +1,236 @@
+import maya.cmds as cmds
+import System.utils as utils
+import System.events as events
+
+GROUP_PREFIX = "Group__"
+TEMP_GROUP = "Group__tempGroupTransform"
+
+
+class GroupIndex:
+    """
+    In-memory tree of the Group__ hierarchy.
+    group_parent = group -> enclosing group (None at the top level).
+    child_groups = group -> direct child groups.
+    group_modules = group -> module namespaces parented directly under the group.
+    module_group = module namespace -> direct enclosing group.
+    subtree_modules / module_chains are derived from the above so that "every module under a group"
+    and "every group around a module" are single dictionary lookups.
+    """
+
+    def __init__(self) -> None:
+        self.group_parent = {}
+        self.child_groups = {}
+        self.group_modules = {}
+        self.module_group = {}
+        self.subtree_modules = {}
+        self.module_chains = {}
+        self.built = False
+
+    def clear(self):
+        self.group_parent.clear()
+        self.child_groups.clear()
+        self.group_modules.clear()
+        self.module_group.clear()
+        self.subtree_modules.clear()
+        self.module_chains.clear()
+
+    def rebuild(self):
+        self.clear()
+        groups = [g for g in cmds.ls(f"{GROUP_PREFIX}*", tr=1) or [] if g != TEMP_GROUP]
+        for group in groups:
+            self._register_group(group)
+
+        if groups:
+            # One listRelatives call for the whole tree, parents are read back from the full paths
+            children = cmds.listRelatives(groups, c=1, type="transform", f=1) or []
+            for child_path in children:
+                parent_path, _, child = child_path.rpartition("|")
+                parent = parent_path.rpartition("|")[2]
+                if parent not in self.child_groups:
+                    continue
+
+                if child.find(GROUP_PREFIX) == 0:
+                    if child in self.child_groups:
+                        self.group_parent[child] = parent
+                        self.child_groups[parent][child] = None
+                else:
+                    namespace_info = utils.strip_leading_namespace(child)
+                    if namespace_info is not None and namespace_info[1] == "module_transform":
+                        self.group_modules[parent][namespace_info[0]] = None
+                        self.module_group[namespace_info[0]] = parent
+
+        self.built = True
+        self._update_derived()
+
+    def ensure_current(self):
+        if not self.built:
+            self.rebuild()
+            return
+
+        # Cheap consistency check against undo, file open and new scene: the set of groups must match
+        existing = set(cmds.ls(f"{GROUP_PREFIX}*", tr=1) or [])
+        existing.discard(TEMP_GROUP)
+        if existing != set(self.group_parent):
+            self.rebuild()
+
+    def _register_group(self, group, parent=None):
+        self.group_parent[group] = parent
+        self.child_groups.setdefault(group, {})
+        self.group_modules.setdefault(group, {})
+
+    def _detach(self, member):
+        if member.find(GROUP_PREFIX) == 0:
+            old_parent = self.group_parent.get(member)
+            if old_parent is not None:
+                self.child_groups[old_parent].pop(member, None)
+        else:
+            old_parent = self.module_group.pop(member, None)
+            if old_parent is not None:
+                self.group_modules[old_parent].pop(member, None)
+
+    def _attach(self, member, group):
+        if member.find(GROUP_PREFIX) == 0:
+            self.group_parent[member] = group
+            if group is not None:
+                self.child_groups[group][member] = None
+        elif group is not None:
+            self.module_group[member] = group
+            self.group_modules[group][member] = None
+
+    def _member_key(self, obj):
+        # Accepts a group, a module namespace or any node inside a module namespace
+        if obj.find(GROUP_PREFIX) == 0:
+            return obj
+        namespace_info = utils.strip_leading_namespace(obj)
+        if namespace_info is None:
+            return obj
+        return namespace_info[0]
+
+    def _update_derived(self):
+        self.subtree_modules.clear()
+        self.module_chains.clear()
+
+        roots = [g for g, p in self.group_parent.items() if p is None]
+        for root in roots:
+            self._collect_subtree(root, ())
+
+    def _collect_subtree(self, group, outer_chain):
+        chain = (group,) + outer_chain
+        modules = []
+        for module in self.group_modules[group]:
+            modules.append(module)
+            self.module_chains[module] = chain
+        for child in self.child_groups[group]:
+            modules.extend(self._collect_subtree(child, chain))
+
+        self.subtree_modules[group] = tuple(modules)
+        return modules
+
+    # Queries
+    def modules_under(self, group):
+        return self.subtree_modules.get(group, ())
+
+    def enclosing_groups(self, module_namespace):
+        return self.module_chains.get(module_namespace, ())
+
+    def parent_group(self, obj):
+        member = self._member_key(obj)
+        if member.find(GROUP_PREFIX) == 0:
+            return self.group_parent.get(member)
+        return self.module_group.get(member)
+
+    def is_group_empty(self, group):
+        return not self.child_groups.get(group) and not self.group_modules.get(group)
+
+    # Updates
+    def add_group(self, group, parent, members):
+        if parent not in self.child_groups:
+            parent = None
+
+        self._register_group(group, parent)
+        if parent is not None:
+            self.child_groups[parent][group] = None
+
+        for obj in members:
+            member = self._member_key(obj)
+            self._detach(member)
+            self._attach(member, group)
+
+        self._update_derived()
+
+    def move_members(self, members, group):
+        # Reparent existing groups / modules under group (None = top level)
+        if group not in self.child_groups:
+            group = None
+        for obj in members:
+            member = self._member_key(obj)
+            self._detach(member)
+            self._attach(member, group)
+        self._update_derived()
+
+    def remove_group(self, group):
+        # Ungrouping hands the group's members to its parent
+        self.remove_many(groups=[group])
+
+    def add_module(self, module_namespace, group=None):
+        self._detach(module_namespace)
+        self._attach(module_namespace, group)
+        self._update_derived()
+
+    def rename_module(self, old_namespace, new_namespace):
+        group = self.module_group.get(old_namespace)
+        if group is None:
+            return
+        # Keep the member order of the enclosing group
+        self.group_modules[group] = {(new_namespace if m == old_namespace else m): None for m in self.group_modules[group]}
+        del self.module_group[old_namespace]
+        self.module_group[new_namespace] = group
+        self._update_derived()
+
+    def remove_module(self, module_namespace):
+        self._detach(module_namespace)
+        self._update_derived()
+
+    def remove_many(self, modules=(), groups=()):
+        # Same as remove_module / remove_group in a loop, with a single derived update
+        for module_namespace in modules:
+            self._detach(module_namespace)
+
+        for group in groups:
+            if group not in self.group_parent:
+                continue
+            parent = self.group_parent[group]
+            for child in list(self.child_groups[group]):
+                self._attach(child, parent)
+            for module in list(self.group_modules[group]):
+                self.module_group.pop(module, None)
+                self._attach(module, parent)
+            self._detach(group)
+            del self.group_parent[group]
+            del self.child_groups[group]
+            del self.group_modules[group]
+
+        self._update_derived()
+
+
+_index = GroupIndex()
+
+
+def get_index(validate=True):
+    if validate:
+        _index.ensure_current()
+    elif not _index.built:
+        _index.rebuild()
+    return _index
+
+
+def invalidate():
+    _index.clear()
+    _index.built = False
+
+
+def on_scene_reset(event):
+    invalidate()
+
+
+events.subscribe(events.SceneReset, on_scene_reset)
@@ -0,0 +1,162 @@
+import json
+import maya.cmds as cmds
+import System.utils as utils
+import System.events as events
+
+HOOK_ATTR = "hookedModules"
+TRANSLATION_CONTROL_SUFFIX = "_translation_control"
+HOOK_CONSTRAINT = "hook_pointConstraint"
+
+
+def is_translation_control(node):
+    if node is None:
+        return False
+    partition_info = str(node).rpartition(TRANSLATION_CONTROL_SUFFIX)
+    return partition_info[1] != "" and partition_info[2] == "" and utils.strip_leading_namespace(node) is not None
+
+
+class HookIndex:
+    """
+    Reverse hook lookup: translation control -> module namespaces hooked onto it.
+    The entries for a module's controls are stored as a JSON string on that module's container (HOOK_ATTR),
+    keyed by control name without namespace, and cached here together with the raw string they were parsed from.
+    """
+
+    def __init__(self) -> None:
+        self.cache = {}
+
+    def clear(self):
+        self.cache.clear()
+
+    def container_for(self, module_namespace):
+        return f"{module_namespace}:module_container"
+
+    def load(self, module_namespace):
+        container = self.container_for(module_namespace)
+        if not cmds.objExists(container):
+            self.cache.pop(module_namespace, None)
+            return {}
+
+        if not cmds.attributeQuery(HOOK_ATTR, n=container, ex=1):
+            # Scenes built before the index existed, crawl the connections once and persist the result
+            entries = self.scan_connections(module_namespace)
+            self.store(module_namespace, entries)
+            return entries
+
+        raw = cmds.getAttr(f"{container}.{HOOK_ATTR}") or ""
+        cached = self.cache.get(module_namespace)
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+
+        entries = {}
+        if raw:
+            entries = {control: dict.fromkeys(dependents) for control, dependents in json.loads(raw).items()}
+        self.cache[module_namespace] = (raw, entries)
+        return entries
+
+    def scan_connections(self, module_namespace):
+        entries = {}
+        for control in cmds.ls(f"{module_namespace}:*{TRANSLATION_CONTROL_SUFFIX}", tr=1) or []:
+            connections = cmds.listConnections(control, s=0, d=1, type="pointConstraint") or []
+            for connection in set(connections):
+                namespace_info = utils.strip_leading_namespace(connection)
+                if namespace_info is None or namespace_info[0] == module_namespace:
+                    continue
+                if namespace_info[1] == HOOK_CONSTRAINT:
+                    control_name = utils.strip_leading_namespace(control)[1]
+                    entries.setdefault(control_name, {})[namespace_info[0]] = None
+        return entries
+
+    def store(self, module_namespace, entries):
+        container = self.container_for(module_namespace)
+        if not cmds.objExists(container):
+            return
+
+        raw = json.dumps({control: list(dependents) for control, dependents in entries.items() if dependents}, sort_keys=True)
+
+        # Containers that are unlocked outside of a lock scope (mid install) are left unlocked
+        scope = []
+        if utils.is_container_unlocked_in_scope(container) or cmds.lockNode(container, q=1, l=1)[0]:
+            scope = [container]
+
+        with utils.unlocked_containers(scope):
+            if not cmds.attributeQuery(HOOK_ATTR, n=container, ex=1):
+                cmds.addAttr(container, ln=HOOK_ATTR, dt="string")
+            cmds.setAttr(f"{container}.{HOOK_ATTR}", raw, typ="string")
+
+        self.cache[module_namespace] = (raw, entries)
+
+    # Queries
+    def dependents(self, control):
+        if not is_translation_control(control):
+            return ()
+        module_namespace, control_name = utils.strip_leading_namespace(control)
+        return tuple(self.load(module_namespace).get(control_name, ()))
+
+    def module_dependents(self, module_namespace):
+        dependents = {}
+        for control_dependents in self.load(module_namespace).values():
+            dependents.update(control_dependents)
+        dependents.pop(module_namespace, None)
+        return list(dependents)
+
+    # Updates
+    def update(self, changes):
+        """
+        changes = an iterable of (dependent module namespace, old hook object, new hook object).
+        Hook objects that are not translation controls (unhookedTarget, None) are ignored.
+        Every affected container is written once.
+        """
+        touched = {}
+        for dependent, old_hook, new_hook in changes:
+            if old_hook == new_hook:
+                continue
+
+            for hook, add in ((old_hook, False), (new_hook, True)):
+                if not is_translation_control(hook):
+                    continue
+                module_namespace, control_name = utils.strip_leading_namespace(hook)
+                if module_namespace == dependent:
+                    continue
+
+                if module_namespace not in touched:
+                    touched[module_namespace] = self.load(module_namespace)
+                entries = touched[module_namespace]
+
+                if add:
+                    entries.setdefault(control_name, {})[dependent] = None
+                elif control_name in entries:
+                    entries[control_name].pop(dependent, None)
+
+        for module_namespace, entries in touched.items():
+            self.store(module_namespace, entries)
+
+    def rename_dependent(self, old_namespace, new_namespace, hook_object):
+        if not is_translation_control(hook_object):
+            return
+        module_namespace, control_name = utils.strip_leading_namespace(hook_object)
+        entries = self.load(module_namespace)
+        if control_name in entries:
+            entries[control_name] = {(new_namespace if m == old_namespace else m): None for m in entries[control_name]}
+            self.store(module_namespace, entries)
+
+    def forget(self, module_namespace):
+        self.cache.pop(module_namespace, None)
+
+
+_index = HookIndex()
+
+
+def get_index():
+    return _index
+
+
+def invalidate():
+    _index.clear()
+
+
+def on_scene_reset(event):
+    invalidate()
+
+
+events.subscribe(events.SceneReset, on_scene_reset)
@@ -0,0 +1,76 @@
+import sys
+import numpy as np
+
+
+class JointLayout:
+    """
+    Joint names and positions of a blueprint module.
+    names = tuple of interned joint names, from root down the hierarchy.
+    positions = (N, 3) float array. Layouts created with shared=True (class-level defaults) hold a read-only
+    array; shared_copy() hands out views of it, and the first write through set_position(s) copies it.
+    """
+    __slots__ = ("names", "positions", "_full_names")
+
+    def __init__(self, names, positions, shared=False) -> None:
+        self.names = tuple(sys.intern(str(name)) for name in names)
+        positions = np.array(positions, dtype=float).reshape(len(self.names), 3)
+        if shared:
+            positions.flags.writeable = False
+        self.positions = positions
+        self._full_names = {}
+
+    @classmethod
+    def from_joint_info(cls, joint_info):
+        # joint_info = [[name, [x, y, z]], ...]
+        if isinstance(joint_info, cls):
+            return joint_info
+        return cls([j[0] for j in joint_info], [j[1] for j in joint_info])
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["names"], data["positions"])
+
+    def shared_copy(self):
+        layout = JointLayout.__new__(JointLayout)
+        layout.names = self.names
+        layout.positions = self.positions
+        layout._full_names = {}
+        return layout
+
+    def copy(self):
+        return JointLayout(self.names, self.positions)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(zip(self.names, self.positions.tolist()))
+
+    def position(self, index):
+        return self.positions[index].tolist()
+
+    def _writable_positions(self):
+        if not self.positions.flags.writeable:
+            self.positions = self.positions.copy()
+        return self.positions
+
+    def set_position(self, index, position):
+        self._writable_positions()[index] = position
+
+    def set_positions(self, positions):
+        self._writable_positions()[:] = np.asarray(positions, dtype=float).reshape(len(self.names), 3)
+
+    def full_names(self, namespace, prefix=""):
+        # Full node names are built once per namespace / prefix pair
+        key = (namespace, prefix)
+        full_names = self._full_names.get(key)
+        if full_names is None:
+            full_names = tuple(f"{namespace}:{prefix}{name}" for name in self.names)
+            self._full_names[key] = full_names
+        return full_names
+
+    def to_dict(self):
+        return {"names": list(self.names), "positions": self.positions.tolist()}
+
+    def to_joint_info(self):
+        return [[name, position] for name, position in self]
@@ -0,0 +1,47 @@
+class KDTree:
+    """
+    Static 3D KD-tree over a list of points, nodes = (point index, split axis, left, right).
+    nearest() visits O(log n) nodes on average.
+    """
+
+    def __init__(self, points) -> None:
+        self.points = [tuple(point) for point in points]
+        self.root = self._build(list(range(len(self.points))), 0)
+
+    def _build(self, indices, depth):
+        if len(indices) == 0:
+            return None
+        axis = depth % 3
+        indices.sort(key=lambda i: self.points[i][axis])
+        middle = len(indices) // 2
+        return (indices[middle], axis, self._build(indices[:middle], depth + 1), self._build(indices[middle + 1:], depth + 1))
+
+    def nearest(self, point, accept=None, max_distance=None):
+        """
+        Index of the point closest to point for which accept(index) is true, or None.
+        Points further away than max_distance are ignored.
+        """
+        best_index = None
+        best_distance = float("inf") if max_distance is None else max_distance * max_distance
+
+        pending = [self.root]
+        while pending:
+            node = pending.pop()
+            if node is None:
+                continue
+            index, axis, left, right = node
+            candidate = self.points[index]
+
+            distance = sum((candidate[i] - point[i]) ** 2 for i in range(3))
+            if distance < best_distance and (accept is None or accept(index)):
+                best_index = index
+                best_distance = distance
+
+            split = point[axis] - candidate[axis]
+            near, far = (left, right) if split < 0 else (right, left)
+            # The far side is only searched when the splitting plane is closer than the best match so far
+            if split * split < best_distance:
+                pending.append(far)
+            pending.append(near)
+
+        return best_index
@@ -0,0 +1,185 @@
+"""
+Detects temporary nodes left in the scene by blueprint operations and removes them in one batch.
+
+While an operation runs (the outermost utils.undo_chunk), every node Maya creates is recorded through an
+OpenMaya node added callback. Nodes still in the scene when the operation ends, and not inside a module or group
+container (directly or through a DAG parent), are kept as leaks of that operation; an operation that throws
+half way usually leaves its TEMP_ transforms, locators and duplicated joints behind.
+Recording is a debugging aid and is off by default: enable() turns it on for the session.
+scan_scene() finds the same kind of leftovers in scenes saved by earlier sessions.
+"""
+import maya.cmds as cmds
+
+om = None  # maya.api.OpenMaya, imported by enable()
+
+# Nodes that live outside containers on purpose: containers themselves, shared representation materials,
+# display layers, the lock checkpoint, and the scene nodes a control object file import can bring along
+EXEMPT_TYPES = ["container", "dagContainer", "hyperLayout", "nodeGraphEditorInfo", "displayLayer", "displayLayerManager",
+                "renderLayer", "renderLayerManager", "script", "shadingEngine", "materialInfo", "lambert", "groupId", "network"]
+TEMP_PATTERNS = ["TEMP_*", "Group__tempGroupTransform*"]
+MODULE_NAMESPACE_PATTERN = "*__*:*"
+
+_state = {"enabled": False, "callback": None, "operation": None, "created": []}
+_leaks = {}  # node -> operation that left it
+_stats = {"operations": 0, "created": 0, "leaked": 0, "swept": 0}
+
+
+def enable():
+    # Record the nodes every following operation leaves behind, returns False when OpenMaya is not available
+    global om
+    try:
+        import maya.api.OpenMaya as om
+    except ImportError:
+        return False
+    _state["enabled"] = True
+    return True
+
+
+def disable():
+    _state["enabled"] = False
+
+
+def is_enabled():
+    return _state["enabled"]
+
+
+def node_added(node, *args):
+    _state["created"].append(om.MObjectHandle(node))
+
+
+def begin(operation):
+    # Start recording the nodes created by operation, called when the outermost undo chunk opens
+    if not _state["enabled"] or _state["callback"] is not None:
+        return
+    _state["operation"] = operation
+    _state["created"] = []
+    _state["callback"] = om.MDGMessage.addNodeAddedCallback(node_added, "dependNode")
+
+
+def node_name(handle):
+    node = handle.object()
+    if node.hasFn(om.MFn.kDagNode):
+        return om.MFnDagNode(node).fullPathName()
+    return om.MFnDependencyNode(node).name()
+
+
+def end():
+    """
+    Stop recording. Nodes created by the operation that survived it outside every container become leaks.
+    Returns the leaked nodes.
+    """
+    if _state["callback"] is None:
+        return []
+    om.MMessage.removeCallback(_state["callback"])
+    _state["callback"] = None
+
+    created = [node_name(handle) for handle in _state["created"] if handle.isValid()]
+    _state["created"] = []
+    _stats["operations"] += 1
+    _stats["created"] += len(created)
+    if len(created) == 0:
+        return []
+
+    exempt = set(cmds.ls(created, long=1, type=EXEMPT_TYPES) or [])
+    candidates = [node for node in cmds.ls(created, long=1) or [] if node not in exempt]
+    # One membership query per container for the whole operation, not one findContainer per node
+    contained = contained_paths() if candidates else set()
+    leaked = [node for node in candidates if not is_contained(node, contained)]
+    if leaked:
+        operation = _state["operation"]
+        for node in leaked:
+            _leaks[node] = operation
+        _stats["leaked"] += len(leaked)
+        print(f"{operation} left {len(leaked)} temporary node(s) outside any container, leak_detector.sweep() removes them")
+    return leaked
+
+
+def contained_paths():
+    # Long names of every container and container member, one nodeList query per container
+    containers = cmds.ls(type=["container", "dagContainer"]) or []
+    members = list(containers)
+    for container in containers:
+        members.extend(cmds.container(container, q=1, nodeList=1) or [])
+    return set(cmds.ls(members, long=1) or [])
+
+
+def is_contained(node, contained):
+    # node or one of its DAG parents is in contained (contained_paths())
+    path = node.split("|")
+    return node in contained or any("|".join(path[:i]) in contained for i in range(2, len(path)))
+
+
+def scan_scene():
+    """
+    Leftovers of earlier sessions: TEMP_ nodes, the Group Selected preview transform and nodes of blueprint
+    module namespaces that are outside every container. Run while no Group Selected dialog is open.
+    Returns {node: "scene_scan"}.
+    """
+    candidates = cmds.ls(TEMP_PATTERNS + [MODULE_NAMESPACE_PATTERN], long=1) or []
+    if len(candidates) == 0:
+        return {}
+
+    contained = contained_paths()
+    exempt = set(cmds.ls(candidates, long=1, type=EXEMPT_TYPES) or [])
+    leaks = {}
+    for node in candidates:
+        if node not in exempt and not is_contained(node, contained):
+            leaks[node] = "scene_scan"
+    return leaks
+
+
+def find_leaks(scan=False):
+    """
+    {node: operation} for the leaks recorded this session that are still in the scene and still outside
+    every container, plus scan_scene() when scan is True.
+    """
+    contained = contained_paths() if _leaks else set()
+    for node in list(_leaks):
+        if not cmds.objExists(node) or is_contained(node, contained):
+            del _leaks[node]
+
+    leaks = dict(_leaks)
+    if scan:
+        for node, operation in scan_scene().items():
+            leaks.setdefault(node, operation)
+    return leaks
+
+
+def sweep(scan=False):
+    """
+    Delete every leak in one undoable delete. A leaked parent takes its leaked children with it.
+    Returns the deleted nodes.
+    """
+    leaks = find_leaks(scan)
+    nodes = sorted(leaks)
+    # Children of a swept parent go with it, deleting them again would fail
+    leaked = set(nodes)
+    roots = []
+    for node in nodes:
+        path = node.split("|")
+        if not any("|".join(path[:i]) in leaked for i in range(2, len(path))):
+            roots.append(node)
+    if len(roots) == 0:
+        return []
+
+    cmds.undoInfo(openChunk=True, chunkName="sweep_leaks")
+    try:
+        cmds.delete(roots)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+    for node in nodes:
+        _leaks.pop(node, None)
+    _stats["swept"] += len(nodes)
+    return nodes
+
+
+def get_stats():
+    stats = dict(_stats)
+    stats["pending"] = len(_leaks)
+    return stats
+
+
+def reset_stats():
+    for key in _stats:
+        _stats[key] = 0
@@ -0,0 +1,269 @@
+"""
+Blueprint state saved before lock, so locked modules can be turned back into blueprints.
+
+The state of a blueprint module is the set of attributes its module container publishes (module transform,
+translation controls, orientation controls, rotate orders), plus its hook, root constraint, mirror attributes
+and group. capture() stores that for every module about to be locked, and the Group__ hierarchy, as JSON on
+CHECKPOINT_NODE. unlock_modules() deletes the locked nodes of the chosen modules and reinstalls them from it.
+"""
+import json
+import maya.cmds as cmds
+import System.utils as utils
+import System.blueprint as blueprint_mod
+import System.group_engine as group_engine
+import System.group_index as group_index
+
+CHECKPOINT_NODE = "blueprint_lock_checkpoint"
+CHECKPOINT_ATTR = "checkpoint"
+CHECKPOINT_VERSION = 1
+MIRROR_ATTRS = ("mirrorInfo", "mirrorLinks")
+GROUP_ATTRS = ("translate", "rotate", "globalScale")
+PRECISION = 6
+
+
+def compact(value):
+    # getAttr values as plain JSON lists, floats rounded so the checkpoint stays small
+    if isinstance(value, (list, tuple)):
+        if len(value) == 1 and isinstance(value[0], (list, tuple)):
+            value = value[0]
+        return [compact(v) for v in value]
+    if isinstance(value, float):
+        return round(value, PRECISION)
+    return value
+
+
+def read_checkpoint():
+    if not cmds.objExists(CHECKPOINT_NODE):
+        return {"version": CHECKPOINT_VERSION, "modules": {}, "groups": {}}
+    checkpoint = json.loads(cmds.getAttr(f"{CHECKPOINT_NODE}.{CHECKPOINT_ATTR}") or "{}")
+    if checkpoint.get("version") != CHECKPOINT_VERSION:
+        return {"version": CHECKPOINT_VERSION, "modules": {}, "groups": {}}
+    return checkpoint
+
+
+def write_checkpoint(checkpoint):
+    if not cmds.objExists(CHECKPOINT_NODE):
+        cmds.createNode("network", n=CHECKPOINT_NODE)
+        cmds.addAttr(CHECKPOINT_NODE, dt="string", ln=CHECKPOINT_ATTR)
+    cmds.setAttr(f"{CHECKPOINT_NODE}.{CHECKPOINT_ATTR}", json.dumps(checkpoint, separators=(",", ":"), sort_keys=True), typ="string")
+
+
+def published_values(container):
+    # {published name: value} for every bound plug that can be set, driven and locked plugs are left out
+    bindings = cmds.container(container, q=1, bindAttr=1) or []
+    values = {}
+    for plug, published_name in zip(bindings[0::2], bindings[1::2]):
+        if cmds.getAttr(plug, settable=1):
+            values[published_name] = compact(cmds.getAttr(plug))
+    return values
+
+
+def capture_module(module_inst):
+    hook_object = module_inst.find_hook_object()
+    if hook_object == f"{module_inst.module_namespace}:unhookedTarget":
+        hook_object = None
+
+    module_grp = f"{module_inst.module_namespace}:module_grp"
+    mirror = {}
+    for attr in MIRROR_ATTRS:
+        if cmds.attributeQuery(attr, n=module_grp, ex=1):
+            mirror[attr] = cmds.getAttr(f"{module_grp}.{attr}")
+
+    return {
+        "module": module_inst.module_name,
+        "name": module_inst.user_specified_name,
+        "options": module_inst.rebuild_options(),
+        "published": published_values(module_inst.container_name),
+        "hook": hook_object,
+        "root_constrained": module_inst.is_root_constrained(),
+        "mirror": mirror,
+    }
+
+
+def capture_groups():
+    # Every group, parents before children, with its local transform and direct members
+    index = group_index.get_index()
+    groups = {}
+    pending = [g for g, parent in index.group_parent.items() if parent is None]
+    while pending:
+        group = pending.pop(0)
+        groups[group] = {
+            "parent": index.group_parent[group],
+            "modules": list(index.group_modules[group]),
+            "values": {attr: compact(cmds.getAttr(f"{group}.{attr}")) for attr in GROUP_ATTRS},
+        }
+        pending.extend(index.child_groups[group])
+    return groups
+
+
+def capture(module_instances):
+    """
+    Add the blueprint state of module_instances, and the current groups, to the scene checkpoint.
+    Call before lock_phase_1, which already unhooks modules. Entries of modules locked earlier are kept.
+    """
+    checkpoint = read_checkpoint()
+    for module_inst in module_instances:
+        checkpoint["modules"][module_inst.module_namespace] = capture_module(module_inst)
+
+    captured = set(module_inst.module_namespace for module_inst in module_instances)
+    for group, entry in capture_groups().items():
+        # Members that are still locked come from the previous lock, they are not in the scene's groups
+        previous = checkpoint["groups"].get(group, {}).get("modules", [])
+        entry["modules"].extend(m for m in previous if m not in entry["modules"] and m not in captured)
+        checkpoint["groups"][group] = entry
+
+    write_checkpoint(checkpoint)
+    return checkpoint
+
+
+def is_locked(module_namespace):
+    return cmds.objExists(f"{module_namespace}:blueprint_container") and not cmds.objExists(f"{module_namespace}:module_transform")
+
+
+def hook_module(entry):
+    hook_info = utils.strip_leading_namespace(entry["hook"]) if entry["hook"] != None else None
+    return None if hook_info is None else hook_info[0]
+
+
+def hook_connected(modules, selected):
+    """
+    selected and every module hooked onto them or that they hook onto, recursively.
+    A locked module's hook is a constraint to a locked joint, so a hook chain unlocks as a whole.
+    """
+    neighbours = {module_namespace: set() for module_namespace in modules}
+    for module_namespace, entry in modules.items():
+        parent = hook_module(entry)
+        if parent in neighbours:
+            neighbours[module_namespace].add(parent)
+            neighbours[parent].add(module_namespace)
+
+    connected = {}
+    pending = [m for m in selected if m in neighbours]
+    while pending:
+        module_namespace = pending.pop()
+        if module_namespace in connected:
+            continue
+        connected[module_namespace] = None
+        pending.extend(neighbours[module_namespace])
+    return list(connected)
+
+
+def delete_locked(module_namespaces):
+    containers = [f"{module_namespace}:module_container" for module_namespace in module_namespaces]
+    with utils.unlocked_containers(containers):
+        cmds.delete(cmds.ls(containers))
+
+    cmds.namespace(set=":")
+    for module_namespace in module_namespaces:
+        if cmds.namespace(exists=f":{module_namespace}"):
+            cmds.namespace(rm=module_namespace, deleteNamespaceContent=True)
+
+
+def rebuild_groups(groups, module_namespaces):
+    """
+    Recreate the checkpoint groups holding any of module_namespaces, with their local transforms, and parent the
+    rebuilt module transforms back into them. Groups already in the scene (an earlier unlock) are reused.
+    Expects the module containers to be unlocked.
+    """
+    module_namespaces = set(module_namespaces)
+    needed = {}
+    for group, entry in groups.items():
+        if module_namespaces.intersection(entry["modules"]):
+            while group != None and group not in needed:
+                needed[group] = None
+                group = groups.get(group, {}).get("parent")
+
+    # groups is stored parents first
+    to_create = [g for g in groups if g in needed and not cmds.objExists(g)]
+    if to_create:
+        group_engine.create_groups([{"name": g, "objects": [], "parent": groups[g]["parent"]} for g in to_create])
+
+    index = group_index.get_index(validate=False)
+    with utils.unlocked_containers(group_engine.GROUP_CONTAINER):
+        for group in to_create:
+            for attr, value in groups[group]["values"].items():
+                if isinstance(value, list):
+                    cmds.setAttr(f"{group}.{attr}", *value)
+                else:
+                    cmds.setAttr(f"{group}.{attr}", value)
+
+        for group in needed:
+            members = [f"{m}:module_transform" for m in groups[group]["modules"] if m in module_namespaces]
+            if members:
+                cmds.parent(members, group, r=1)
+                index.move_members(members, group)
+
+
+def apply_published(module_inst, values):
+    for published_name, value in values.items():
+        plug = f"{module_inst.container_name}.{published_name}"
+        if not cmds.objExists(plug):
+            continue
+        if isinstance(value, list):
+            cmds.setAttr(plug, *value)
+        else:
+            cmds.setAttr(plug, value)
+
+
+def apply_mirror(module_inst, mirror):
+    module_grp = f"{module_inst.module_namespace}:module_grp"
+    if "mirrorInfo" in mirror and not cmds.attributeQuery("mirrorInfo", n=module_grp, ex=1):
+        cmds.addAttr(module_grp, at="enum", en="none:x:y:z", ln="mirrorInfo", k=0)
+    if "mirrorLinks" in mirror and not cmds.attributeQuery("mirrorLinks", n=module_grp, ex=1):
+        cmds.addAttr(module_grp, dt="string", ln="mirrorLinks", k=0)
+
+    if "mirrorInfo" in mirror:
+        cmds.setAttr(f"{module_grp}.mirrorInfo", mirror["mirrorInfo"])
+    if "mirrorLinks" in mirror:
+        cmds.setAttr(f"{module_grp}.mirrorLinks", mirror["mirrorLinks"], typ="string")
+
+
+def locked_modules():
+    return [module_namespace for module_namespace in read_checkpoint()["modules"] if is_locked(module_namespace)]
+
+
+@utils.build_mode("blueprint_unlock")
+def unlock_modules(module_namespaces=None):
+    """
+    Turn locked modules back into blueprints, as they were when locked.
+    module_namespaces = modules to unlock (None = every locked module in the checkpoint), extended to their hook chains.
+    The locked nodes are deleted, every module is reinstalled in one install_modules batch, then groups,
+    published attribute values, mirror attributes, hooks and root constraints are restored in bulk.
+    Returns the new module instances.
+    """
+    checkpoint = read_checkpoint()
+    modules = checkpoint["modules"]
+    locked = [module_namespace for module_namespace in modules if is_locked(module_namespace)]
+    if module_namespaces is None:
+        module_namespaces = locked
+    module_namespaces = [m for m in hook_connected(modules, module_namespaces) if m in locked]
+    if len(module_namespaces) == 0:
+        raise RuntimeError("No locked module with a lock checkpoint to unlock")
+
+    for module_namespace in module_namespaces:
+        installed_attr = f"{module_namespace}:blueprint_joint_grp.controlModulesInstalled"
+        if cmds.objExists(installed_attr) and cmds.getAttr(installed_attr):
+            raise RuntimeError(f"{module_namespace} has control modules installed, uninstall them before unlocking")
+
+    delete_locked(module_namespaces)
+
+    entries = [modules[module_namespace] for module_namespace in module_namespaces]
+    module_instances = blueprint_mod.install_modules([{"module": entry["module"], "name": entry["name"], "options": entry["options"]}
+                                                      for entry in entries])
+
+    containers = [module_inst.container_name for module_inst in module_instances]
+    with utils.unlocked_containers(containers):
+        rebuild_groups(checkpoint["groups"], module_namespaces)
+        for module_inst, entry in zip(module_instances, entries):
+            apply_published(module_inst, entry["published"])
+            apply_mirror(module_inst, entry["mirror"])
+
+    hook_map = {module_inst: entry["hook"] for module_inst, entry in zip(module_instances, entries)
+                if entry["hook"] != None and cmds.objExists(entry["hook"])}
+    blueprint_mod.rehook_modules(hook_map)
+
+    for module_inst, entry in zip(module_instances, entries):
+        if entry["root_constrained"] and module_inst in hook_map:
+            module_inst.constrain_root_to_hook()
+
+    return module_instances
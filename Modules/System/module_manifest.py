@@ -0,0 +1,174 @@
+"""
+Static metadata of the module files in a directory, read without importing them.
+
+CLASS_NAME, TITLE, DESCRIPTION and ICON are extracted from the module level assignments with ast and
+cached in MANIFEST_FILE next to the modules, keyed by file mtime and size, so only new or edited files are parsed.
+os.environ lookups in f-strings are stored as ${NAME} templates and substituted when the manifest is read.
+"""
+import ast
+import json
+import os
+from string import Template
+
+MANIFEST_FILE = "module_manifest.json"
+MANIFEST_VERSION = 1
+METADATA_KEYS = ("CLASS_NAME", "TITLE", "DESCRIPTION", "ICON")
+
+_manifests = {}
+_stats = {"parsed": 0, "reused": 0, "imported": 0}
+
+
+class NotStatic(Exception):
+    pass
+
+
+def environ_name(node):
+    # NAME for os.environ["NAME"], os.environ.get("NAME") and os.getenv("NAME"), otherwise None
+    if isinstance(node, ast.Subscript):
+        target, key = node.value, node.slice
+        if isinstance(key, ast.Index):  # Python < 3.9
+            key = key.value
+    elif isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.args:
+        target, key = node.func, node.args[0]
+        if target.attr == "getenv":
+            target = None
+        elif target.attr == "get":
+            target = target.value
+        else:
+            return None
+    else:
+        return None
+
+    if target is not None and not (isinstance(target, ast.Attribute) and target.attr == "environ"):
+        return None
+    if isinstance(key, ast.Constant) and isinstance(key.value, str):
+        return key.value
+    return None
+
+
+def static_value(node):
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value.replace("$", "$$")
+
+    name = environ_name(node)
+    if name is not None:
+        return "${" + name + "}"
+
+    if isinstance(node, ast.JoinedStr):
+        parts = []
+        for value in node.values:
+            if isinstance(value, ast.FormattedValue):
+                if value.format_spec is not None or value.conversion != -1:
+                    raise NotStatic()
+                value = value.value
+            parts.append(static_value(value))
+        return "".join(parts)
+
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        return static_value(node.left) + static_value(node.right)
+
+    raise NotStatic()
+
+
+def scan_source(source, filename="<module>"):
+    """
+    Return ({key: value template} for every METADATA_KEYS constant with a static value, [keys that are not static]).
+    """
+    tree = ast.parse(source, filename)
+    constants = {}
+    dynamic = []
+    for statement in tree.body:
+        if not isinstance(statement, ast.Assign) or len(statement.targets) != 1:
+            continue
+        target = statement.targets[0]
+        if not isinstance(target, ast.Name) or target.id not in METADATA_KEYS:
+            continue
+        try:
+            constants[target.id] = static_value(statement.value)
+            if target.id in dynamic:
+                dynamic.remove(target.id)
+        except NotStatic:
+            constants.pop(target.id, None)
+            dynamic.append(target.id)
+    return constants, dynamic
+
+
+def import_constants(package_folder, module_file, keys):
+    # Fallback for constants computed at import time
+    _stats["imported"] += 1
+    mod = __import__(f"{package_folder}.{module_file}", {}, {}, [module_file])
+    return {key: str(getattr(mod, key)).replace("$", "$$") for key in keys if hasattr(mod, key)}
+
+
+def directory_path(relative_directory):
+    return os.path.join(os.environ["RIGGING_TOOL_ROOT"], relative_directory.strip("/"))
+
+
+def load_manifest_file(path):
+    try:
+        with open(path, "r") as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("modules", {})
+
+
+def save_manifest_file(path, entries):
+    # The manifest is a cache, a read-only install just parses again next session
+    try:
+        with open(path, "w") as manifest_file:
+            json.dump({"version": MANIFEST_VERSION, "modules": entries}, manifest_file, indent=4, sort_keys=True)
+            manifest_file.write("\n")
+    except OSError:
+        pass
+
+
+def get_manifest(relative_directory="/Modules/Blueprint"):
+    """
+    {module file: {CLASS_NAME, TITLE, DESCRIPTION, ICON}} for every .py file in relative_directory except __init__.
+    Files whose mtime and size match the manifest are not read, the others are parsed, never imported,
+    unless one of their constants can't be resolved statically.
+    """
+    relative_directory = relative_directory.strip("/")
+    directory = directory_path(relative_directory)
+    manifest_path = os.path.join(directory, MANIFEST_FILE)
+
+    entries = _manifests.get(relative_directory)
+    if entries is None:
+        entries = load_manifest_file(manifest_path)
+
+    current = {}
+    changed = False
+    for file_entry in sorted(os.scandir(directory), key=lambda e: e.name):
+        module_file, extension = os.path.splitext(file_entry.name)
+        if extension != ".py" or module_file == "__init__" or not file_entry.is_file():
+            continue
+
+        stat = file_entry.stat()
+        entry = entries.get(module_file)
+        if entry is not None and entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+            _stats["reused"] += 1
+            current[module_file] = entry
+            continue
+
+        _stats["parsed"] += 1
+        with open(file_entry.path, "r", encoding="utf-8") as source_file:
+            constants, dynamic = scan_source(source_file.read(), file_entry.path)
+        if dynamic:
+            constants.update(import_constants(relative_directory.partition("Modules/")[2], module_file, dynamic))
+
+        current[module_file] = {"mtime": stat.st_mtime, "size": stat.st_size, "constants": constants}
+        changed = True
+
+    if changed or len(current) != len(entries):
+        save_manifest_file(manifest_path, current)
+    _manifests[relative_directory] = current
+
+    return {module_file: {key: Template(value).safe_substitute(os.environ) for key, value in entry["constants"].items()}
+            for module_file, entry in current.items()}
+
+
+def get_stats():
+    return dict(_stats)
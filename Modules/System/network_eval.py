@@ -0,0 +1,168 @@
+"""
+NumPy evaluator for the utility network built by the blueprint phase, usable without Maya.
+
+Node vocabulary, matching the nodes created by utils.basic_stretchy_IK, Blueprint.setup_stretchy_joint_segment
+and Blueprint.lock_phase_2: distanceBetween, multiplyDivide, plusMinusAverage, point / parent constraints
+(no offset) and the creationPoseWeight blend. Every function works on stacked arrays, the leading axes are
+modules (and joints), so a whole batch of modules is evaluated in one call.
+"""
+import numpy as np
+
+# multiplyDivide.operation
+MULTIPLY = 1
+DIVIDE = 2
+POWER = 3
+
+# plusMinusAverage.operation
+SUM = 1
+SUBTRACT = 2
+AVERAGE = 3
+
+POLE_VECTOR_OFFSET = np.array([0.0, -0.5, 0.0])  # Pole vector locator offset under its parent translation control
+
+
+# Nodes
+def distance_between(point1, point2):
+    return np.linalg.norm(np.asarray(point2, dtype=float) - np.asarray(point1, dtype=float), axis=-1)
+
+
+def multiply_divide(input1, input2, operation=MULTIPLY):
+    input1 = np.asarray(input1, dtype=float)
+    input2 = np.asarray(input2, dtype=float)
+    if operation == MULTIPLY:
+        return input1 * input2
+    if operation == DIVIDE:
+        # Like the node, a zero divisor passes input1 through
+        input1, input2 = np.broadcast_arrays(input1, input2)
+        return np.divide(input1, input2, out=input1.copy(), where=input2 != 0)
+    if operation == POWER:
+        return np.power(input1, input2)
+    return input1
+
+
+def plus_minus_average(inputs, operation=SUM):
+    # inputs = input1D / input3D entries stacked on the first axis
+    inputs = np.asarray(inputs, dtype=float)
+    if operation == SUM:
+        return inputs.sum(axis=0)
+    if operation == SUBTRACT:
+        return inputs[0] - inputs[1:].sum(axis=0)
+    if operation == AVERAGE:
+        return inputs.mean(axis=0)
+    return inputs[0]
+
+
+def point_constraint(target_positions, weights=None):
+    # target_positions = (targets, ..., 3), the constrained position is the weighted average of the targets
+    target_positions = np.asarray(target_positions, dtype=float)
+    if weights is None:
+        return target_positions.mean(axis=0)
+    weights = np.asarray(weights, dtype=float)
+    weights = weights.reshape(weights.shape + (1,) * (target_positions.ndim - weights.ndim))
+    return (target_positions * weights).sum(axis=0) / weights.sum(axis=0)
+
+
+def parent_constraint(target_matrices):
+    # Single target, maintain offset off: the constrained world matrix is the target's
+    return np.array(target_matrices, dtype=float)
+
+
+# Networks
+def normalize(vectors):
+    # Zero length vectors stay zero instead of turning into NaN
+    vectors = np.asarray(vectors, dtype=float)
+    length = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.divide(vectors, length, out=np.zeros_like(vectors), where=length != 0)
+
+
+def segment_lengths(positions):
+    # Creation lengths of every joint segment, the total_original_length of each one-bone stretchy IK
+    positions = np.asarray(positions, dtype=float)
+    return distance_between(positions[..., :-1, :], positions[..., 1:, :])
+
+
+def stretchy_segment(root_positions, end_positions, original_lengths, original_translate_x):
+    """
+    distanceBetween(root locator, end locator) / original length = scale factor,
+    original translateX * scale factor = child joint translateX.
+    Returns (translate_x, scale_factor).
+    """
+    distance = distance_between(root_positions, end_positions)
+    scale_factor = multiply_divide(distance, original_lengths, DIVIDE)
+    return multiply_divide(original_translate_x, scale_factor, MULTIPLY), scale_factor
+
+
+def aim_orientation(root_positions, end_positions, pole_positions):
+    # Rotate plane solve of a one bone chain: X aims down the bone, the pole vector lies on -Y
+    x_axis = normalize(np.asarray(end_positions, dtype=float) - root_positions)
+
+    pole = np.asarray(pole_positions, dtype=float) - root_positions
+    y_axis = normalize(-(pole - (pole * x_axis).sum(axis=-1, keepdims=True) * x_axis))
+
+    z_axis = np.cross(x_axis, y_axis)
+    return np.stack([x_axis, y_axis, z_axis], axis=-2)
+
+
+def predict_blueprint_pose(layout_positions, control_positions, pole_positions=None, module_scale=1.0):
+    """
+    Predict the blueprint joints driven by the translation controls.
+    layout_positions = (modules, joints, 3) creation positions (JointLayout.positions).
+    control_positions = (modules, joints, 3) world positions of the translation controls.
+    pole_positions = (modules, joints - 1, 3) pole vector locators, by default offset from each segment's
+    parent control by POLE_VECTOR_OFFSET * module_scale.
+    Returns {"positions", "translate_x", "scale_factors", "orientations" (rows = joint X, Y, Z axes)}.
+    """
+    layout_positions = np.asarray(layout_positions, dtype=float)
+    control_positions = np.asarray(control_positions, dtype=float)
+    module_scale = np.asarray(module_scale, dtype=float).reshape(-1, 1, 1)
+
+    if pole_positions is None:
+        pole_positions = control_positions[:, :-1] + POLE_VECTOR_OFFSET * module_scale
+
+    original_lengths = segment_lengths(layout_positions)
+    translate_x = np.empty(original_lengths.shape)
+    scale_factors = np.empty(original_lengths.shape)
+    positions = np.empty(control_positions.shape)
+
+    # The root joint is point constrained to the root control, every child sits on its stretched bone
+    positions[:, 0] = control_positions[:, 0]
+    for index in range(original_lengths.shape[1]):
+        root = positions[:, index]
+        end = control_positions[:, index + 1]
+        translate_x[:, index], scale_factors[:, index] = stretchy_segment(root, end, original_lengths[:, index], original_lengths[:, index])
+
+        positions[:, index + 1] = root + normalize(end - root) * translate_x[:, index, None]
+
+    orientations = aim_orientation(positions[:, :-1], positions[:, 1:], pole_positions)
+    return {"positions": positions, "translate_x": translate_x, "scale_factors": scale_factors, "orientations": orientations}
+
+
+def predict_creation_pose_blend(original_values, creation_pose_weight, control_inputs=0.0):
+    """
+    lock_phase_2 blend: original value * creationPoseWeight (multiplyDivide) + control module inputs (plusMinusAverage sum).
+    original_values = child translateX values, or the root translate / scale when root_transform is on.
+    """
+    original_values = np.asarray(original_values, dtype=float)
+    creation_pose_weight = np.asarray(creation_pose_weight, dtype=float)
+    creation_pose_weight = creation_pose_weight.reshape(creation_pose_weight.shape + (1,) * (original_values.ndim - creation_pose_weight.ndim))
+    weighted = multiply_divide(original_values, creation_pose_weight, MULTIPLY)
+    return plus_minus_average([weighted, np.broadcast_to(control_inputs, weighted.shape)], SUM)
+
+
+def predict_layouts(layouts, control_positions):
+    """
+    Evaluate many modules of any joint counts: layouts = JointLayout per module,
+    control_positions = (joints, 3) per module. Modules with the same joint count are evaluated together.
+    Returns one result dict per module, in input order.
+    """
+    batches = {}
+    for module_index, layout in enumerate(layouts):
+        batches.setdefault(len(layout), []).append(module_index)
+
+    results = [None] * len(layouts)
+    for module_indices in batches.values():
+        prediction = predict_blueprint_pose(np.stack([layouts[i].positions for i in module_indices]),
+                                            np.stack([np.asarray(control_positions[i], dtype=float) for i in module_indices]))
+        for batch_index, module_index in enumerate(module_indices):
+            results[module_index] = {key: value[batch_index] for key, value in prediction.items()}
+    return results
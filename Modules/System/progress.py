@@ -0,0 +1,120 @@
+import time
+import maya.cmds as cmds
+
+
+class OperationCancelled(Exception):
+    """Raised by ProgressTask.check_cancel once the user interrupts the progress window (Esc)."""
+
+
+# (operation, stage) -> measured seconds per cost unit, kept for the session
+_measured_rates = {}
+
+
+def module_cost(module_inst):
+    # Node count of the module container, the joint count when the module is not in the scene
+    if cmds.objExists(module_inst.container_name):
+        nodes = cmds.container(module_inst.container_name, q=1, nl=1) or []
+        if nodes:
+            return len(nodes)
+    return max(len(module_inst.joint_info), 1)
+
+
+def undo_cancelled_operation(chunk_name):
+    """
+    Roll back a cancelled operation that ran as a single undo chunk (utils.undo_chunk / utils.build_mode).
+    Only undoes when chunk_name is the next entry on the undo queue. Returns True if the scene was rolled back.
+    """
+    if not cmds.undoInfo(q=1, state=1):
+        return False
+    if cmds.undoInfo(q=1, undoName=1) != chunk_name:
+        return False
+    cmds.undo()
+    return True
+
+
+class ProgressTask:
+    """
+    Progress window weighted by predicted cost instead of fixed stage proportions.
+    stages = [(stage name, [cost of each item], default seconds per cost unit), ...].
+    Item costs come from the modules being processed (module_cost). The seconds per cost unit of every stage
+    is measured while it runs and reused by the next run of the same operation, which also drives the ETA.
+    Use as a context manager; call check_cancel() between items to allow the user to interrupt.
+    """
+
+    def __init__(self, operation, title, stages, interruptable=True) -> None:
+        self.operation = operation
+        self.title = title
+        self.interruptable = interruptable
+
+        self.stage_order = []
+        self.stages = {}
+        for name, costs, default_rate in stages:
+            rate = _measured_rates.get((operation, name), default_rate)
+            self.stages[name] = {"costs": list(costs), "rate": rate, "done": 0}
+            self.stage_order.append(name)
+
+        self.predicted_total = sum(self.stage_seconds(name) for name in self.stage_order)
+        self.predicted_done = 0.0
+        self.current_stage = None
+        self.stage_start = None
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        cmds.progressWindow(t=self.title, st="This may take a few minutes", pr=0, min=0, max=100, ii=self.interruptable)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        cmds.progressWindow(e=1, ep=1)
+        return False
+
+    def stage_seconds(self, name):
+        stage = self.stages[name]
+        return sum(stage["costs"]) * stage["rate"]
+
+    def begin_stage(self, name):
+        if self.current_stage is not None:
+            self.end_stage()
+        self.current_stage = name
+        self.stage_start = time.perf_counter()
+        self.update()
+
+    def end_stage(self):
+        stage = self.stages[self.current_stage]
+        cost = sum(stage["costs"][:stage["done"]])
+        if cost > 0:
+            _measured_rates[(self.operation, self.current_stage)] = (time.perf_counter() - self.stage_start) / cost
+        self.current_stage = None
+
+    def advance(self, count=1):
+        stage = self.stages[self.current_stage]
+        costs = stage["costs"][stage["done"]:stage["done"] + count]
+        stage["done"] += len(costs)
+        self.predicted_done += sum(costs) * stage["rate"]
+        self.update()
+
+    def fraction(self):
+        if self.predicted_total <= 0:
+            return 0.0
+        return min(self.predicted_done / self.predicted_total, 1.0)
+
+    def eta(self):
+        # Seconds left: the remaining prediction, scaled by how far off the prediction has been so far
+        remaining = max(self.predicted_total - self.predicted_done, 0.0)
+        if self.predicted_done <= 0:
+            return remaining
+        return remaining * (time.perf_counter() - self.start) / self.predicted_done
+
+    def update(self):
+        status = self.current_stage or ""
+        if self.predicted_done > 0:
+            status = f"{status} - about {int(round(self.eta()))}s left"
+        cmds.progressWindow(e=1, pr=int(self.fraction() * 100), st=status)
+
+    def check_cancel(self):
+        if self.interruptable and cmds.progressWindow(q=1, ic=1):
+            raise OperationCancelled(self.operation)
+
+
+def get_measured_rates():
+    return dict(_measured_rates)
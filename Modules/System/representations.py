@@ -0,0 +1,151 @@
+import maya.cmds as cmds
+import System.utils as utils
+
+# Level of detail of generated blueprint representations
+LOD_CURVE = 0  # Low-CV curves, no shading
+LOD_MESH = 1  # Low resolution shaded polygons
+LOD_ASSET = 2  # Import the original control object file
+
+_settings = {"lod": LOD_MESH, "mesh_sides": 6}
+
+ARROW_POINTS = [(0.0, 0.0, 0.0), (0.5, 0.0, 0.0), (0.4, 0.1, 0.0), (0.5, 0.0, 0.0), (0.4, -0.1, 0.0), (0.5, 0.0, 0.0),
+                (0.4, 0.0, 0.1), (0.5, 0.0, 0.0), (0.4, 0.0, -0.1), (0.5, 0.0, 0.0), (1.0, 0.0, 0.0)]
+
+
+def set_lod(lod, mesh_sides=None):
+    """
+    Level of detail used by every representation created afterwards (LOD_CURVE, LOD_MESH or LOD_ASSET),
+    mesh_sides = number of sides of LOD_MESH tubes and cones.
+    """
+    _settings["lod"] = lod
+    if mesh_sides != None:
+        _settings["mesh_sides"] = max(3, int(mesh_sides))
+
+
+def get_lod():
+    return _settings["lod"]
+
+
+def shared_shading_group(name, color):
+    # One material per representation type for the whole scene, the control object files bring one per import
+    shading_group = f"{name}_SG"
+    if not cmds.objExists(shading_group):
+        material = cmds.shadingNode("lambert", asShader=1, n=name)
+        cmds.setAttr(f"{material}.color", color[0], color[1], color[2], typ="double3")
+        shading_group = cmds.sets(renderable=1, noSurfaceShader=1, empty=1, n=shading_group)
+        cmds.connectAttr(f"{material}.outColor", f"{shading_group}.surfaceShader")
+    return shading_group
+
+
+def set_reference_display(node):
+    cmds.setAttr(f"{node}.overrideEnabled", 1)
+    cmds.setAttr(f"{node}.overrideDisplayType", 2)
+
+
+def curve(name, points):
+    return cmds.curve(d=1, p=points, n=name)
+
+
+def tube(name, radius, material):
+    # Unit length tube along +X, from the origin
+    sides = _settings["mesh_sides"]
+    node = cmds.polyCylinder(n=name, r=radius, h=1, sx=sides, sy=1, sc=0, ax=[1, 0, 0], ch=0)[0]
+    cmds.move(0.5, 0, 0, f"{node}.vtx[*]", r=1, os=1)
+    cmds.sets(node, e=1, forceElement=shared_shading_group(*material))
+    return node
+
+
+def cone(name, radius, height, axis, material):
+    sides = _settings["mesh_sides"]
+    node = cmds.polyCone(n=name, r=radius, h=height, sx=sides, sy=1, sz=0, ax=axis, ch=0)[0]
+    cmds.sets(node, e=1, forceElement=shared_shading_group(*material))
+    return node
+
+
+def lock_attributes(node, attributes):
+    for attr in attributes:
+        cmds.setAttr(f"{node}.{attr}", l=1, k=0)
+
+
+# Builders, each creates the object node of a control object file as name and returns it
+def build_hierarchy_representation(name, lod):
+    if lod == LOD_CURVE:
+        node = curve(name, ARROW_POINTS)
+    else:
+        material = ("m_hierarchyRepresentation", (0.851, 0.742, 0.677))
+        node = tube(name, 0.2, material)
+        arrow = cone(name.replace("hierarchy_representation", "hierarchy_arrow_representation"), 0.35, 0.45, [1, 0, 0], material)
+        cmds.move(0.5, 0, 0, arrow, a=1)
+        cmds.parent(arrow, node, r=1)
+        set_reference_display(cmds.listRelatives(arrow, s=1)[0])
+
+    set_reference_display(cmds.listRelatives(node, s=1)[0])
+    return node
+
+
+def build_hook_representation(name, lod):
+    if lod == LOD_CURVE:
+        node = curve(name, [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0)])
+    else:
+        node = tube(name, 0.2, ("m_hookRepresentation", (0.596, 0.695, 0.758)))
+
+    set_reference_display(cmds.listRelatives(node, s=1)[0])
+    return node
+
+
+def build_orientation_control(name, lod):
+    # Y and Z axis pins half way along +X, rotateX turns them around the segment
+    if lod == LOD_CURVE:
+        node = curve(name, [(0.0, 0.0, 0.0), (0.5, 0.0, 0.0), (0.5, 0.5, 0.0), (0.5, 0.0, 0.0), (0.5, 0.0, 0.5), (0.5, 0.0, 0.0), (1.0, 0.0, 0.0)])
+    else:
+        node = cone(name, 0.12, 0.5, [0, 1, 0], ("m_yAxisBlock", (0.432, 1.0, 0.197)))
+        cmds.move(0.5, 0.25, 0, f"{node}.vtx[*]", r=1, os=1)
+        z_axis = cone(f"{name}_zAxis", 0.12, 0.5, [0, 0, 1], ("m_zAxisBlock", (0.098, 0.385, 0.873)))
+        cmds.move(0.5, 0, 0.25, f"{z_axis}.vtx[*]", r=1, os=1)
+        cmds.parent(cmds.listRelatives(z_axis, s=1)[0], node, r=1, s=1)
+        cmds.delete(z_axis)
+
+    lock_attributes(node, ["visibility", "ty", "tz", "ry", "rz", "sy", "sz"])
+    for attr in ["tx", "sx"]:
+        cmds.setAttr(f"{node}.{attr}", k=0)
+    return node
+
+
+_builders = {
+    "hierarchy_representation": build_hierarchy_representation,
+    "hook_representation": build_hook_representation,
+    "orientation_control": build_orientation_control,
+}
+
+
+def import_asset(relative_path, container_name, object_name, prefix):
+    # Import a control object file and prefix every node of its container
+    cmds.file(utils.control_asset_path(relative_path), i=1)
+    container = cmds.rename(container_name, f"{prefix}_{container_name}")
+
+    for node in cmds.container(container, q=1, nl=1):
+        cmds.rename(node, f"{prefix}_{node}", ignoreShape=1)
+
+    return (container, f"{prefix}_{object_name}")
+
+
+def create(relative_path, container_name, object_name, prefix, lod=None):
+    """
+    Create the representation stored in the control object file relative_path, named like an import of the file
+    renamed with prefix: returns (prefix_container_name container, prefix_object_name object).
+    Representations with a builder are generated at the current level of detail (set_lod), everything else,
+    and every representation at LOD_ASSET, is imported from the file.
+    """
+    if lod is None:
+        lod = _settings["lod"]
+
+    build = _builders.get(object_name)
+    if build is None or lod == LOD_ASSET:
+        return import_asset(relative_path, container_name, object_name, prefix)
+
+    node = build(f"{prefix}_{object_name}", lod)
+
+    container = cmds.container(n=f"{prefix}_{container_name}")
+    utils.add_node_to_container(container, node, ihb=1, include_shapes=1)
+
+    return (container, node)
@@ -0,0 +1,125 @@
+from math import floor
+import maya.cmds as cmds
+import System.utils as utils
+import System.control_index as control_index
+from System.group_engine import MIRROR_AXIS
+
+AXIS_INDEX = {"X": 0, "Y": 1, "Z": 2}
+LINK_ATTR = "mirrorLinks"
+INFO_ATTR = "mirrorInfo"
+INFO_ENUM = "none:x:y:z"
+INFO_MIRRORED = 1  # The value Blueprint.mirror writes for a "mirrored" translation function, on every plane
+
+
+def reflect(position, mirror_plane):
+    reflected = list(position)
+    reflected[AXIS_INDEX[MIRROR_AXIS[mirror_plane]]] *= -1
+    return tuple(reflected)
+
+
+def module_controls():
+    """
+    {module namespace: (signature, [control positions])} for every module with translation controls.
+    signature = (module type, control names without namespace), controls in name order, so two modules
+    with the same signature have the same type and topology and their controls correspond one to one.
+    """
+    index = control_index.get_index()
+    controls = {}
+    for control, module_namespace, position in zip(index.controls, index.control_modules, index.positions):
+        controls.setdefault(module_namespace, []).append((control.partition(":")[2], position))
+
+    modules = {}
+    for module_namespace, entries in controls.items():
+        if utils.find_module_class(module_namespace) is None:
+            continue
+        entries.sort()
+        signature = (module_namespace.partition("__")[0], tuple(name for name, _ in entries))
+        modules[module_namespace] = (signature, [position for _, position in entries])
+    return modules
+
+
+def cell_of(position, cell_size):
+    return tuple(int(floor(value / cell_size)) for value in position)
+
+
+def match_error(positions, counterpart_positions, mirror_plane):
+    # Largest distance between a control and its counterpart's reflection
+    error = 0.0
+    for position, counterpart in zip(positions, counterpart_positions):
+        reflected = reflect(counterpart, mirror_plane)
+        error = max(error, sum((position[i] - reflected[i]) ** 2 for i in range(3)) ** 0.5)
+    return error
+
+
+def find_symmetry_pairs(mirror_plane="YZ", tolerance=0.1, modules=None):
+    """
+    Pair every module with its counterpart reflected across mirror_plane.
+    Modules are hashed into a grid of tolerance sized cells by (signature, root control cell); the reflection of
+    each module's root only probes the 27 surrounding cells, so pairing is near linear in the number of modules.
+    Every control must land within tolerance of its counterpart's reflection. Modules lying on the plane
+    (their own reflection) are not paired.
+    Returns [(module namespace, counterpart namespace, error)], each module appears at most once.
+    """
+    if modules is None:
+        modules = module_controls()
+
+    grid = {}
+    for module_namespace, (signature, positions) in modules.items():
+        grid.setdefault((signature, cell_of(positions[0], tolerance)), []).append(module_namespace)
+
+    candidates = []
+    for module_namespace, (signature, positions) in modules.items():
+        x, y, z = cell_of(reflect(positions[0], mirror_plane), tolerance)
+        for cell in [(x + i, y + j, z + k) for i in (-1, 0, 1) for j in (-1, 0, 1) for k in (-1, 0, 1)]:
+            for counterpart in grid.get((signature, cell), ()):
+                if counterpart <= module_namespace:
+                    continue
+                error = match_error(positions, modules[counterpart][1], mirror_plane)
+                if error <= tolerance:
+                    candidates.append((error, module_namespace, counterpart))
+
+    # Closest matches first, a module keeps the first counterpart it is paired with
+    pairs = []
+    paired = set()
+    for error, module_namespace, counterpart in sorted(candidates):
+        if module_namespace in paired or counterpart in paired:
+            continue
+        paired.update((module_namespace, counterpart))
+        pairs.append((module_namespace, counterpart, error))
+    return pairs
+
+
+@utils.undo_chunk("link_symmetry_pairs")
+def link_symmetry_pairs(pairs, mirror_plane="YZ", overwrite=False):
+    """
+    Write mirrorLinks and mirrorInfo on both modules of every pair, the values Blueprint.mirror writes for a
+    mirrored translation function: pairs are matched by reflected control positions.
+    Pairs where either side is already linked are skipped unless overwrite is True.
+    All module containers are unlocked once. Returns the pairs that were linked.
+    """
+    axis = MIRROR_AXIS[mirror_plane]
+    linked = []
+    for module_namespace, counterpart, _ in pairs:
+        existing = [cmds.attributeQuery(LINK_ATTR, n=f"{m}:module_grp", ex=1) for m in (module_namespace, counterpart)]
+        if any(existing) and not overwrite:
+            continue
+        linked.append((module_namespace, counterpart))
+
+    containers = [f"{m}:module_container" for pair in linked for m in pair]
+    with utils.unlocked_containers(containers):
+        for module_namespace, counterpart in linked:
+            for module_link in ((module_namespace, counterpart), (counterpart, module_namespace)):
+                module_group = f"{module_link[0]}:module_grp"
+                if not cmds.attributeQuery(LINK_ATTR, n=module_group, ex=1):
+                    cmds.addAttr(module_group, dt="string", ln=LINK_ATTR, k=0)
+                cmds.setAttr(f"{module_group}.{LINK_ATTR}", f"{module_link[1]}__{axis}", typ="string")
+
+                if not cmds.attributeQuery(INFO_ATTR, n=module_group, ex=1):
+                    cmds.addAttr(module_group, at="enum", en=INFO_ENUM, ln=INFO_ATTR, k=0)
+                cmds.setAttr(f"{module_group}.{INFO_ATTR}", INFO_MIRRORED)
+    return linked
+
+
+def link_symmetric_modules(mirror_plane="YZ", tolerance=0.1, overwrite=False):
+    # Detect and link every left / right pair in the scene in one step
+    return link_symmetry_pairs(find_symmetry_pairs(mirror_plane, tolerance), mirror_plane, overwrite)
@@ -1,6 +1,10 @@
 import os
+import time
 import maya.cmds as cmds
-import importlib
+import System.module_manifest as module_manifest
+import System.events as events
+import System.leak_detector as leak_detector
+from contextlib import contextmanager
 
 
 def find_all_modules(relative_directory):
@@ -9,16 +13,47 @@ def find_all_modules(relative_directory):
 
 
 def find_all_module_names(relative_directory):
-    valid_modules = find_all_modules(relative_directory)
-    valid_module_names = []
-    package_folder = relative_directory.partition("/Modules/")[2]
-    for m in valid_modules:
-        mod = __import__(f"{package_folder}.{m}", (), {}, [m])
-        importlib.reload(mod)
-        valid_module_names.append(mod.CLASS_NAME)
+    # Read from the static module manifest, the module files are not imported
+    manifest = module_manifest.get_manifest(relative_directory)
+    valid_modules = [m for m, constants in manifest.items() if "CLASS_NAME" in constants]
+    valid_module_names = [manifest[m]["CLASS_NAME"] for m in valid_modules]
     return (valid_modules, valid_module_names)
 
 
+_module_registry = {}
+_module_registry_stats = {"hits": 0, "misses": 0}
+
+
+def find_module_class(module_name, relative_directory="/Modules/Blueprint"):
+    # module_name is a CLASS_NAME or a module namespace (CLASS_NAME__user_specified_name)
+    module_name = module_name.partition("__")[0]
+    registry = _module_registry.get(relative_directory)
+    if registry is None or module_name not in registry:
+        _module_registry_stats["misses"] += 1
+        valid_modules, valid_module_names = find_all_module_names(relative_directory)
+        registry = dict(zip(valid_module_names, valid_modules))
+        _module_registry[relative_directory] = registry
+    else:
+        _module_registry_stats["hits"] += 1
+
+    module_file = registry.get(module_name)
+    if module_file is None:
+        return None
+
+    package_folder = relative_directory.partition("/Modules/")[2]
+    mod = __import__(f"{package_folder}.{module_file}", {}, {}, [module_file])
+    return getattr(mod, mod.CLASS_NAME)
+
+
+def get_module_registry_stats():
+    return dict(_module_registry_stats)
+
+
+def control_asset_path(relative_path):
+    # Absolute path of a control object file
+    return f"{os.environ['RIGGING_TOOL_ROOT']}{relative_path}"
+
+
 def find_all_files(relative_directory, file_extension):
     file_directory = f"{os.environ['RIGGING_TOOL_ROOT']}/{relative_directory}/"
     return [str(current_file).rpartition(file_extension)[0] for current_file in os.listdir(file_directory)
@@ -161,14 +196,33 @@ def basic_stretchy_IK(root_joint, end_joint, container=None, lockMinimumLength=T
     return return_dict
 
 
-def force_scene_update():
+def force_scene_update(namespaces=None):
+    # Inside build_mode the update is deferred and run once, for every requested namespace, when the build ends
+    if _build_mode_state["depth"] > 0:
+        if namespaces is None:
+            _build_mode_state["update_all"] = True
+        else:
+            _build_mode_state["update_namespaces"].update(namespaces)
+        return
+
     cmds.setToolTo("moveSuperContext")
-    nodes = cmds.ls()
+    if namespaces is None:
+        nodes = cmds.ls()
+    else:
+        nodes = cmds.ls([f"{namespace}:*" for namespace in namespaces])
     
-    for node in nodes:
-        cmds.select(node, r=1)
-        
-    cmds.select(cl=1)
+    # The per-node selection only exists to push the nodes through an update, it is kept out of the undo queue
+    undo_state = cmds.undoInfo(q=1, state=1)
+    if undo_state:
+        cmds.undoInfo(stateWithoutFlush=False)
+    try:
+        for node in nodes:
+            cmds.select(node, r=1)
+            
+        cmds.select(cl=1)
+    finally:
+        if undo_state:
+            cmds.undoInfo(stateWithoutFlush=True)
     
     cmds.setToolTo("selectSuperContext")
     
@@ -191,14 +245,249 @@ def add_node_to_container(container, nodes_in, ihb=False, include_shapes=False,
     cmds.container(container, edit=True, addNode=nodes, ihb=ihb, includeShapes=include_shapes, force=force)
     
 
-def does_user_specified_name_exist(name):
+def existing_user_specified_names():
     cmds.namespace(set=":")
-    namespaces = cmds.namespaceInfo(lon=1)
-    
-    names = []
-    for namespace in namespaces:
-        if namespace.find("__") != -1:
-            names.append(namespace.partition("__")[2])
-            
-    return name in names
-    
\ No newline at end of file
+    namespaces = cmds.namespaceInfo(lon=1) or []
+    return [namespace.partition("__")[2] for namespace in namespaces if namespace.find("__") != -1]
+
+
+def does_user_specified_name_exist(name):
+    return name in existing_user_specified_names()
+
+
+def new_user_specified_names(count, basename="instance_", taken=None):
+    # count fresh <basename><N> names numbered above the highest existing one
+    if taken is None:
+        taken = existing_user_specified_names()
+    first = find_highest_trailing_number(taken, basename) + 1
+    return [f"{basename}{first + i}" for i in range(count)]
+
+
+_container_lock_depth = {}
+_container_lock_renames = {}
+_lock_scope_stats = {"unlocks": 0, "relocks": 0, "unlocks_avoided": 0, "relocks_avoided": 0}
+
+
+@contextmanager
+def unlocked_containers(containers):
+    """
+    Reference-counted unlock of one or more containers.
+    A container is unlocked on the first enclosing scope and relocked once when the outermost scope exits,
+    exceptions included. Containers deleted inside the scope are skipped on relock.
+    """
+    if isinstance(containers, str):
+        containers = [containers]
+    containers = list(dict.fromkeys(containers))
+
+    to_unlock = []
+    for container in containers:
+        if _container_lock_depth.get(container, 0) == 0:
+            to_unlock.append(container)
+        else:
+            _lock_scope_stats["unlocks_avoided"] += 1
+        _container_lock_depth[container] = _container_lock_depth.get(container, 0) + 1
+
+    try:
+        to_unlock = cmds.ls(to_unlock)
+        if to_unlock:
+            cmds.lockNode(to_unlock, l=0, lu=0)
+            _lock_scope_stats["unlocks"] += len(to_unlock)
+        yield
+    finally:
+        to_relock = []
+        for container in containers:
+            container = _container_lock_renames.get(container, container)
+            depth = _container_lock_depth.get(container, 1) - 1
+            if depth > 0:
+                _container_lock_depth[container] = depth
+                _lock_scope_stats["relocks_avoided"] += 1
+            else:
+                _container_lock_depth.pop(container, None)
+                to_relock.append(container)
+
+        for container in to_relock:
+            for old_name in [k for k, v in _container_lock_renames.items() if v == container]:
+                del _container_lock_renames[old_name]
+
+        to_relock = cmds.ls(to_relock)
+        if to_relock:
+            cmds.lockNode(to_relock, l=1, lu=1)
+            _lock_scope_stats["relocks"] += len(to_relock)
+
+
+def rename_unlocked_container(old_name, new_name):
+    # Call when a container renames (namespace move) inside an unlocked_containers scope, so the scope relocks the new name
+    if old_name in _container_lock_depth:
+        _container_lock_depth[new_name] = _container_lock_depth.pop(old_name)
+        _container_lock_renames[old_name] = new_name
+
+
+def is_container_unlocked_in_scope(container):
+    return _container_lock_depth.get(container, 0) > 0
+
+
+def get_lock_scope_stats():
+    return dict(_lock_scope_stats)
+
+
+def reset_lock_scope_stats():
+    for key in _lock_scope_stats:
+        _lock_scope_stats[key] = 0
+
+
+_build_mode_state = {"depth": 0, "update_all": False, "update_namespaces": set()}
+_control_prototypes = {}
+
+
+def import_control_copy(relative_path, node_name, new_name):
+    """
+    Import the control object file at relative_path and rename its node_name node to new_name.
+    Inside build_mode the file is imported once per build, every further copy duplicates that first import,
+    and the prototype is deleted when the build ends. Only for files without a container (controlGroup_control.ma).
+    """
+    if _build_mode_state["depth"] == 0:
+        cmds.file(control_asset_path(relative_path), i=1)
+        return cmds.rename(node_name, new_name)
+
+    prototype = _control_prototypes.get(relative_path)
+    if prototype is None or not cmds.objExists(prototype):
+        cmds.file(control_asset_path(relative_path), i=1)
+        prototype = cmds.rename(node_name, f"{node_name}_prototype")
+        _control_prototypes[relative_path] = prototype
+    return cmds.duplicate(prototype, n=new_name)[0]
+
+
+@contextmanager
+def build_mode(chunk_name="blueprint_build"):
+    """
+    Wrap a bulk construction: viewport refresh is suspended, the evaluation manager runs in DG mode,
+    and everything lands in one undo chunk. Nested build modes join the outermost one.
+    On exit every setting is restored and deferred force_scene_update requests run once.
+    Can also be used as a decorator.
+    """
+    if _build_mode_state["depth"] > 0:
+        _build_mode_state["depth"] += 1
+        try:
+            yield
+        finally:
+            _build_mode_state["depth"] -= 1
+        return
+
+    _build_mode_state["depth"] = 1
+    _build_mode_state["update_all"] = False
+    _build_mode_state["update_namespaces"] = set()
+
+    with undo_chunk(chunk_name):
+        evaluation_mode = cmds.evaluationManager(q=1, mode=1)[0]
+        if evaluation_mode != "off":
+            cmds.evaluationManager(mode="off")
+        cmds.refresh(suspend=True)
+        try:
+            yield
+        finally:
+            _build_mode_state["depth"] = 0
+            prototypes = cmds.ls(list(_control_prototypes.values()))
+            if prototypes:
+                cmds.delete(prototypes)
+            _control_prototypes.clear()
+
+            cmds.refresh(suspend=False)
+            if evaluation_mode != "off":
+                cmds.evaluationManager(mode=evaluation_mode)
+
+            update_namespaces = [ns for ns in _build_mode_state["update_namespaces"] if cmds.namespace(exists=f":{ns}")]
+            if _build_mode_state["update_all"]:
+                force_scene_update()
+            elif update_namespaces:
+                force_scene_update(update_namespaces)
+            cmds.refresh()
+
+
+def in_build_mode():
+    return _build_mode_state["depth"] > 0
+
+
+_undo_chunk_state = {"depth": 0}
+_undo_stats = {}
+
+
+def used_memory():
+    # Memory used by the whole Maya process in MB. Deltas of this include the scene the operation builds, not only its undo entries
+    memory = cmds.memory(usedMemory=True, megaByte=True)
+    if isinstance(memory, (list, tuple)):
+        memory = memory[0]
+    return float(memory)
+
+
+@contextmanager
+def undo_chunk(chunk_name):
+    """
+    Record everything inside as one named undo entry. Nested chunks join the outermost one,
+    so an operation built from other operations still undoes in a single step.
+    The outermost chunk is added to the per operation stats (see get_undo_stats), holds the events
+    emitted inside it until it closes (see System.events) and, when System.leak_detector is enabled,
+    records the nodes it leaves behind.
+    Can also be used as a decorator.
+    """
+    if _undo_chunk_state["depth"] > 0:
+        _undo_chunk_state["depth"] += 1
+        try:
+            yield
+        finally:
+            _undo_chunk_state["depth"] -= 1
+        return
+
+    _undo_chunk_state["depth"] = 1
+    memory_before = used_memory()
+    start = time.perf_counter()
+    completed = False
+    events.hold()
+    leak_detector.begin(chunk_name)
+    cmds.undoInfo(openChunk=True, chunkName=chunk_name)
+    try:
+        yield
+        completed = True
+    finally:
+        cmds.undoInfo(closeChunk=True)
+        _undo_chunk_state["depth"] = 0
+
+        stats = _undo_stats.setdefault(chunk_name, {"chunks_recorded": 0, "process_memory_delta_mb": 0.0, "seconds": 0.0})
+        stats["chunks_recorded"] += 1
+        stats["process_memory_delta_mb"] += max(used_memory() - memory_before, 0.0)
+        stats["seconds"] += time.perf_counter() - start
+        leak_detector.end()
+        events.release(completed)
+
+
+def get_undo_stats():
+    """
+    Per operation type stats of the outermost undo chunks recorded since the last reset:
+    {chunk name: {"chunks_recorded", "process_memory_delta_mb", "average_process_memory_delta_mb", "seconds"}, ..., "queue": {...}}.
+    process_memory_delta_mb is the growth of the whole Maya process while the chunk was open (scene nodes included),
+    an upper bound of what the operation adds to the undo queue, not the size of its undo entries.
+    queue totals the chunks recorded and their process memory deltas, with the queue length setting
+    ("infinite", "length_limit"); Maya does not report the number of entries actually in the queue.
+    """
+    report = {}
+    for chunk_name, stats in _undo_stats.items():
+        report[chunk_name] = dict(stats, average_process_memory_delta_mb=stats["process_memory_delta_mb"] / stats["chunks_recorded"])
+
+    report["queue"] = {
+        "chunks_recorded": sum(stats["chunks_recorded"] for stats in _undo_stats.values()),
+        "process_memory_delta_mb": sum(stats["process_memory_delta_mb"] for stats in _undo_stats.values()),
+        "infinite": cmds.undoInfo(q=1, infinity=1),
+        "length_limit": cmds.undoInfo(q=1, length=1),
+    }
+    return report
+
+
+def reset_undo_stats():
+    _undo_stats.clear()
+
+
+def set_undo_queue_length(length=None):
+    # Bound the undo queue to length entries, None restores an infinite queue
+    if length is None:
+        cmds.undoInfo(infinity=True)
+    else:
+        cmds.undoInfo(infinity=False, length=length)
@@ -0,0 +1,242 @@
+import time
+import maya.cmds as cmds
+import System.utils as utils
+import System.hook_index as hook_index
+import System.events as events
+
+# Detail levels of a blueprint module
+FULL = 0
+PROXY = 1  # Bounding boxes
+HIDDEN = 2  # Representations hidden, translation controls as bounding boxes
+
+PROXY_LAYER = "blueprint_lod_proxy"
+HIDDEN_LAYER = "blueprint_lod_hidden"
+DEFAULT_LAYER = "defaultLayer"
+REPRESENTATION_GROUPS = ("hierarchy_representation_grp", "orientationControls_grp", "hook_grp")
+
+_state = {"job": None, "levels": {}, "mode": PROXY, "min_modules": 20}
+_stats = {"updates": 0, "changed_modules": 0, "seconds": 0.0}
+
+
+def scene_modules():
+    # Blueprint modules that are not locked yet, every one has a module transform
+    return [node.rpartition(":")[0] for node in cmds.ls("*:module_transform") or []]
+
+
+def selected_modules(modules):
+    selected = set()
+    for node in cmds.ls(sl=1) or []:
+        namespace_info = utils.strip_leading_namespace(node)
+        if namespace_info is not None and namespace_info[0] in modules:
+            selected.add(namespace_info[0])
+        elif node.find("Group__") == 0:
+            for child in cmds.listRelatives(node, ad=1, type="transform") or []:
+                namespace_info = utils.strip_leading_namespace(child)
+                if namespace_info is not None and namespace_info[0] in modules:
+                    selected.add(namespace_info[0])
+    return selected
+
+
+def hook_parent(module_namespace):
+    # Module the given module is hooked onto, or None
+    hook_constraint = f"{module_namespace}:hook_pointConstraint"
+    if not cmds.objExists(hook_constraint):
+        return None
+    hook_object = str(cmds.connectionInfo(f"{hook_constraint}.target[0].targetParentMatrix", sfd=1)).rpartition(".")[0]
+    if not hook_index.is_translation_control(hook_object):
+        return None
+    return utils.strip_leading_namespace(hook_object)[0]
+
+
+def focus_modules(selected):
+    # Selected modules with the modules they hook onto and the modules hooked onto them
+    hooks = hook_index.get_index()
+    focus = set(selected)
+    for module_namespace in selected:
+        focus.update(hooks.module_dependents(module_namespace))
+        parent = hook_parent(module_namespace)
+        if parent != None:
+            focus.add(parent)
+    return focus
+
+
+def ensure_layers():
+    if cmds.objExists(PROXY_LAYER) and cmds.objExists(HIDDEN_LAYER):
+        return
+
+    # New scene or layers deleted by hand, nothing is assigned anymore
+    _state["levels"] = {}
+    for layer in [PROXY_LAYER, HIDDEN_LAYER]:
+        if not cmds.objExists(layer):
+            cmds.createDisplayLayer(n=layer, e=1, nr=1)
+    refresh_layer_display()
+
+
+def refresh_layer_display():
+    # Only the layers' own display attributes are kept out of the undo queue, they never reference scene nodes
+    undo_state = cmds.undoInfo(q=1, state=1)
+    if undo_state:
+        cmds.undoInfo(stateWithoutFlush=False)
+    try:
+        cmds.setAttr(f"{PROXY_LAYER}.levelOfDetail", 1)
+        cmds.setAttr(f"{HIDDEN_LAYER}.visibility", 0)
+    finally:
+        if undo_state:
+            cmds.undoInfo(stateWithoutFlush=True)
+
+
+def apply_levels(changed):
+    """
+    Move the nodes of every module in changed {module namespace: level} to their layers.
+    One editDisplayLayerMembers call per layer and one unlock of all affected containers, whatever the module count.
+    The edits connect the layers to module nodes, so they stay undoable: the SelectionChanged job compresses them
+    into the selection's undo entry, and undoing an install or mirror takes the connections with it.
+    """
+    members = {DEFAULT_LAYER: [], PROXY_LAYER: [], HIDDEN_LAYER: []}
+    for module_namespace, level in changed.items():
+        module_grp = f"{module_namespace}:module_grp"
+        module_transform = f"{module_namespace}:module_transform"
+        groups = [f"{module_namespace}:{group}" for group in REPRESENTATION_GROUPS]
+
+        if level == FULL:
+            members[DEFAULT_LAYER].extend([module_grp, module_transform] + groups)
+        elif level == PROXY:
+            members[DEFAULT_LAYER].extend(groups)
+            members[PROXY_LAYER].extend([module_grp, module_transform])
+        else:
+            members[DEFAULT_LAYER].append(module_grp)
+            members[PROXY_LAYER].append(module_transform)
+            members[HIDDEN_LAYER].extend(groups)
+
+    with utils.unlocked_containers([f"{module_namespace}:module_container" for module_namespace in changed]):
+        for layer, nodes in members.items():
+            nodes = cmds.ls(nodes)
+            if nodes:
+                cmds.editDisplayLayerMembers(layer, nodes, nr=1)
+
+
+def update(*args):
+    """
+    Full detail for the selected modules and their hook neighbours, every other module at the configured mode.
+    Scenes with fewer than min_modules modules stay at full detail. Only modules whose level changed are touched.
+    """
+    if utils.in_build_mode():
+        return
+
+    start = time.perf_counter()
+    ensure_layers()
+
+    modules = scene_modules()
+    if len(modules) < _state["min_modules"]:
+        focus = set(modules)
+    else:
+        focus = focus_modules(selected_modules(set(modules)))
+
+    levels = {module_namespace: (FULL if module_namespace in focus else _state["mode"]) for module_namespace in modules}
+    changed = {module_namespace: level for module_namespace, level in levels.items() if _state["levels"].get(module_namespace, FULL) != level}
+    if changed:
+        apply_levels(changed)
+    _state["levels"] = levels
+
+    _stats["updates"] += 1
+    _stats["changed_modules"] += len(changed)
+    _stats["seconds"] += time.perf_counter() - start
+
+
+def restore_full_detail():
+    changed = {module_namespace: FULL for module_namespace, level in _state["levels"].items()
+               if level != FULL and cmds.objExists(f"{module_namespace}:module_container")}
+    if changed:
+        apply_levels(changed)
+    _state["levels"] = {}
+
+
+def on_modules_deleted(event):
+    for module_namespace in event.namespaces:
+        _state["levels"].pop(module_namespace, None)
+
+
+def on_module_renamed(event):
+    if event.old_namespace in _state["levels"]:
+        _state["levels"][event.new_namespace] = _state["levels"].pop(event.old_namespace)
+
+
+def on_scene_reset(event):
+    # Layer membership after undo or a file change is unknown, every module is reassigned on the next update
+    _state["levels"] = {module_namespace: None for module_namespace in scene_modules()}
+
+
+_event_handlers = ((events.ModulesDeleted, on_modules_deleted), (events.ModuleRenamed, on_module_renamed), (events.SceneReset, on_scene_reset))
+
+
+def enable(mode=None, min_modules=None):
+    """
+    Start following the selection. mode = PROXY or HIDDEN for modules out of focus,
+    min_modules = module count below which every module stays at full detail.
+    """
+    if mode != None:
+        _state["mode"] = mode
+    if min_modules != None:
+        _state["min_modules"] = min_modules
+
+    if _state["job"] is None or not cmds.scriptJob(exists=_state["job"]):
+        _state["job"] = cmds.scriptJob(event=["SelectionChanged", update], compressUndo=1)
+    for event_type, handler in _event_handlers:
+        events.subscribe(event_type, handler)
+    # Levels set under another mode are reapplied
+    restore_full_detail()
+    update()
+
+
+def disable():
+    if _state["job"] is not None and cmds.scriptJob(exists=_state["job"]):
+        cmds.scriptJob(kill=_state["job"], force=True)
+    _state["job"] = None
+    for event_type, handler in _event_handlers:
+        events.unsubscribe(event_type, handler)
+
+    restore_full_detail()
+    for layer in [PROXY_LAYER, HIDDEN_LAYER]:
+        if cmds.objExists(layer):
+            cmds.delete(layer)
+
+
+def is_enabled():
+    return _state["job"] is not None
+
+
+def frame_rate(frames=30):
+    # Forced redraws of the current viewport per second, interactive sessions only
+    start = time.perf_counter()
+    for _ in range(frames):
+        cmds.refresh(cv=1, f=1)
+    return frames / (time.perf_counter() - start)
+
+
+def compare_frame_rate(frames=30):
+    """
+    Viewport frame rate with every module at full detail and with the level of detail applied to the
+    current selection. Returns {"full", "lod"} in frames per second.
+    """
+    was_enabled = is_enabled()
+    ensure_layers()
+    restore_full_detail()
+    full = frame_rate(frames)
+
+    update()
+    lod = frame_rate(frames)
+
+    if not was_enabled:
+        restore_full_detail()
+    return {"full": full, "lod": lod}
+
+
+def get_stats():
+    stats = dict(_stats)
+    stats["levels"] = {level: list(_state["levels"].values()).count(level) for level in (FULL, PROXY, HIDDEN)}
+    return stats
+
+
+def reset_stats():
+    for key in _stats:
+        _stats[key] = 0 if key != "seconds" else 0.0
@@ -0,0 +1,111 @@
+import time
+from PySide2 import QtCore, QtGui
+import maya.utils
+import System.utils as utils
+import System.module_manifest as module_manifest
+
+SLICE_BUDGET = 0.004  # Seconds of warm-up work per idle callback
+ICON_SIZES = (QtCore.QSize(55, 55), QtCore.QSize(60, 60))
+BLUEPRINT_DIRECTORY = "/Modules/Blueprint"
+
+_icons = {}
+_icon_stats = {"hits": 0, "misses": 0}
+_state = {"started": False, "complete": False, "pending": [], "slices": 0, "tasks": 0,
+          "longest_slice": 0.0, "start": None, "seconds": None}
+
+
+def get_icon(icon_path):
+    # Session wide QIcon cache, pixmaps pre-rendered by the warm-up survive the Blueprint UI being closed and reopened
+    icon = _icons.get(icon_path)
+    if icon is None:
+        _icon_stats["misses"] += 1
+        icon = QtGui.QIcon(icon_path)
+        _icons[icon_path] = icon
+    else:
+        _icon_stats["hits"] += 1
+    return icon
+
+
+def render_icon(icon_path):
+    icon = _icons.get(icon_path)
+    if icon is None:
+        icon = QtGui.QIcon(icon_path)
+        _icons[icon_path] = icon
+    for size in ICON_SIZES:
+        for mode in (QtGui.QIcon.Normal, QtGui.QIcon.Active, QtGui.QIcon.Disabled):
+            icon.pixmap(size, mode)
+
+
+def load_module_class(class_name):
+    # Fills the module registry and imports the module file, the work the first install of that module would do
+    utils.find_module_class(class_name, BLUEPRINT_DIRECTORY)
+
+
+def build_tasks(_=None):
+    # First warm-up task, reads the module manifest and queues one task per module class and module icon
+    tasks = []
+    for constants in module_manifest.get_manifest(BLUEPRINT_DIRECTORY).values():
+        if constants.get("CLASS_NAME"):
+            tasks.append((load_module_class, constants["CLASS_NAME"]))
+        if constants.get("ICON"):
+            tasks.append((render_icon, constants["ICON"]))
+    _state["pending"].extend(tasks)
+
+
+def run_slice():
+    # Runs tasks until the slice budget is spent, then hands control back to Maya and queues the next slice
+    slice_start = time.perf_counter()
+    pending = _state["pending"]
+    while pending:
+        function, argument = pending.pop(0)
+        try:
+            function(argument)
+        except Exception as e:
+            print(f"Warm-up task {function.__name__}({argument}) failed: {e}")
+        _state["tasks"] += 1
+        if time.perf_counter() - slice_start >= SLICE_BUDGET:
+            break
+
+    _state["slices"] += 1
+    _state["longest_slice"] = max(_state["longest_slice"], time.perf_counter() - slice_start)
+
+    if pending:
+        maya.utils.executeDeferred(run_slice)
+    else:
+        _state["complete"] = True
+        _state["seconds"] = time.perf_counter() - _state["start"]
+
+
+def start():
+    """
+    Schedule the warm-up on Maya's idle queue: blueprint module manifest, module classes and icon pixmaps.
+    Runs once per session, a slice stops taking new tasks once SLICE_BUDGET is spent.
+    """
+    if _state["started"]:
+        return
+    _state["started"] = True
+    _state["start"] = time.perf_counter()
+    _state["pending"] = [(build_tasks, None)]
+    maya.utils.executeDeferred(run_slice)
+
+
+def hit_rate(stats):
+    total = stats["hits"] + stats["misses"]
+    if total == 0:
+        return None
+    return stats["hits"] / total
+
+
+def get_stats():
+    report = {
+        "complete": _state["complete"],
+        "tasks": _state["tasks"],
+        "slices": _state["slices"],
+        "longest_slice_ms": _state["longest_slice"] * 1000,
+        "seconds": _state["seconds"],
+    }
+    report["module_manifest"] = module_manifest.get_stats()
+    for name, stats in (("module_registry", utils.get_module_registry_stats()),
+                        ("icons", dict(_icon_stats))):
+        report[name] = dict(stats, hit_rate=hit_rate(stats))
+    return report
@@ -0,0 +1,124 @@
+"""
+Cold import benchmark for the core rigging modules.
+
+Run with mayapy from the repository root:
+    mayapy benchmarks/import_time.py [--repeat N]            # compare against benchmarks/import_baseline.json
+    mayapy benchmarks/import_time.py [--repeat N] --update   # record the current import times as the new baseline
+    mayapy benchmarks/import_time.py [--repeat N] --strict   # also fail modules that have no baseline recorded
+
+Every module of Modules/System and Modules/Blueprint, except the dialogs in UI_MODULES, is imported in a fresh
+interpreter. The best of N runs is compared against its budget: the recorded baseline plus HEADROOM, and never
+less than HEADROOM_FLOOR_MS above it so tiny modules are not failed by timer noise.
+The core modules must also import without pulling in Qt, so they stay usable in a batch mayapy process.
+Exits with status 1 when a module is over budget or loads Qt. Modules without a baseline are reported and
+only fail the run with --strict; record them with --update and check in import_baseline.json.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_FILE = os.path.join(ROOT, "benchmarks", "import_baseline.json")
+PACKAGES = ("System", "Blueprint")
+
+# Dialogs parented to the Maya main window at import, they need an interactive session
+UI_MODULES = ("System.blueprint_UI", "System.GroupSelected", "System.MirrorModule")
+# Modules that build Qt objects and are allowed to import it
+QT_ALLOWED = ("System.warmup",)
+
+HEADROOM = 0.5  # Budget = baseline * 1.5
+HEADROOM_FLOOR_MS = 5.0
+
+QT_MODULES = ("PySide2", "shiboken2", "PySide6", "shiboken6")
+
+PROBE = """
+import json, sys, time
+import maya.cmds
+start = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - start) * 1000
+qt = sorted(name for name in sys.modules if name.split(".")[0] in {qt_modules!r})
+print(json.dumps({{"ms": elapsed, "qt": qt}}))
+"""
+
+
+def measure(module):
+    env = dict(os.environ)
+    env.setdefault("RIGGING_TOOL_ROOT", ROOT)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in [f"{ROOT}/Modules", env.get("PYTHONPATH")] if p)
+    output = subprocess.run([sys.executable, "-c", PROBE.format(module=module, qt_modules=QT_MODULES)],
+                            env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def import_modules():
+    # Timed on top of an already imported maya.cmds, each includes the modules it imports
+    modules = []
+    for package in PACKAGES:
+        for file_name in sorted(os.listdir(os.path.join(ROOT, "Modules", package))):
+            name, extension = os.path.splitext(file_name)
+            module = f"{package}.{name}"
+            if extension == ".py" and name != "__init__" and module not in UI_MODULES:
+                modules.append(module)
+    return modules
+
+
+def budget_ms(baseline_ms):
+    return max(baseline_ms * (1.0 + HEADROOM), baseline_ms + HEADROOM_FLOOR_MS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--update", action="store_true", help="write the measured import times as the new baseline")
+    parser.add_argument("--strict", action="store_true", help="fail modules that have no baseline recorded")
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, "r") as baseline_file:
+            baseline = json.load(baseline_file)
+
+    measured = {}
+    failures = []
+    for module in import_modules():
+        runs = [measure(module) for _ in range(args.repeat)]
+        best = min(run["ms"] for run in runs)
+        qt = runs[0]["qt"]
+        measured[module] = round(best, 1)
+
+        status = "ok"
+        if module not in baseline:
+            status = "no baseline, run with --update and check in import_baseline.json"
+            if args.strict:
+                failures.append(module)
+            budget = None
+        else:
+            budget = budget_ms(baseline[module])
+            if best > budget:
+                status = "OVER BUDGET"
+                failures.append(module)
+        if qt and module not in QT_ALLOWED:
+            status = f"LOADS QT ({', '.join(qt)})"
+            failures.append(module)
+
+        budget_text = "     -" if budget is None else f"{budget:6.1f}"
+        print(f"{module:<32} {best:8.1f} ms  budget {budget_text} ms  {status}")
+
+    if args.update:
+        with open(BASELINE_FILE, "w") as baseline_file:
+            json.dump(measured, baseline_file, indent=4, sort_keys=True)
+            baseline_file.write("\n")
+        print(f"Baseline written to {BASELINE_FILE}")
+        return 0
+
+    if failures:
+        print(f"\n{len(set(failures))} module(s) failed the import budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+Node and cmds-call budget audit for every registered blueprint module.
+
+Run with mayapy from the repository root:
+    mayapy benchmarks/node_budget.py            # compare against benchmarks/node_budgets.json
+    mayapy benchmarks/node_budget.py --update   # record the current footprint as the new budget
+    mayapy benchmarks/node_budget.py --strict   # also fail steps that have no budget recorded
+
+For each module in Modules/Blueprint the audit installs an instance in a new scene, mirrors it (when the
+module supports mirroring) and locks the scene, recording the nodes created by type, the published
+container attributes and the maya.cmds calls of each step (System.footprint).
+Exits with status 1 when any step of any module grows past its budget. Steps without a recorded budget are
+reported and only fail the run with --strict; record them with --update and check in node_budgets.json.
+"""
+import argparse
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_FILE = os.path.join(ROOT, "benchmarks", "node_budgets.json")
+
+
+def lock_scene_modules(module_instances):
+    # Same phases as Blueprint_UI.lock_modules, without the UI
+    import maya.cmds as cmds
+    import System.utils as utils
+
+    lock_info = [module_inst.lock_phase_1() for module_inst in module_instances]
+    for module_inst, module_info in zip(module_instances, lock_info):
+        module_inst.lock_phase_2(module_info)
+
+    if cmds.objExists("Group_container"):
+        with utils.unlocked_containers("Group_container"):
+            cmds.delete("Group_container")
+
+    for module_inst, module_info in zip(module_instances, lock_info):
+        module_inst.lock_phase_3(module_info[4])
+
+
+def audit_module(module_name):
+    import maya.cmds as cmds
+    import System.utils as utils
+    import System.footprint as footprint
+    import System.group_index as group_index
+    import System.hook_index as hook_index
+
+    cmds.file(new=1, f=1)
+    group_index.invalidate()
+    hook_index.invalidate()
+
+    ModuleClass = utils.find_module_class(module_name)
+    module_inst = ModuleClass("audit", None)
+    results = {"install": footprint.measure(module_inst.install)}
+    module_instances = [module_inst]
+
+    if module_inst.can_module_be_mirrored():
+        mirrored_inst = ModuleClass("audit_mirror", None)
+        results["mirror"] = footprint.measure(mirrored_inst.mirror, module_inst.module_namespace, "YZ", "behavior", "mirrored")
+        module_instances.append(mirrored_inst)
+
+    results["lock"] = footprint.measure(lock_scene_modules, module_instances)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--update", action="store_true", help="write the measured footprints as the new budgets")
+    parser.add_argument("--strict", action="store_true", help="fail steps that have no budget recorded")
+    args = parser.parse_args()
+
+    os.environ.setdefault("RIGGING_TOOL_ROOT", ROOT)
+    sys.path.insert(0, os.path.join(ROOT, "Modules"))
+
+    import maya.standalone
+    maya.standalone.initialize(name="python")
+    import System.utils as utils
+    import System.footprint as footprint
+
+    budgets = {}
+    if os.path.exists(BUDGET_FILE):
+        with open(BUDGET_FILE, "r") as budget_file:
+            budgets = json.load(budget_file)
+
+    measured = {}
+    failures = 0
+    for module_name in utils.find_all_module_names("/Modules/Blueprint")[1]:
+        measured[module_name] = audit_module(module_name)
+
+        for step, result in measured[module_name].items():
+            print(f"{module_name:<24} {step:<8} nodes {result['nodes']:5d}  published {result['published_attributes']:4d}  "
+                  f"cmds calls {result['cmds_calls']:6d}")
+
+            budget = budgets.get(module_name, {}).get(step)
+            if budget is None:
+                print("    no budget recorded, run with --update and check in node_budgets.json")
+                if args.strict:
+                    failures += 1
+                continue
+            for line in footprint.compare(result, budget):
+                print(f"    OVER BUDGET {line}")
+                failures += 1
+
+    if args.update:
+        budgets = {module_name: {step: footprint.to_budget(result) for step, result in steps.items()}
+                   for module_name, steps in measured.items()}
+        with open(BUDGET_FILE, "w") as budget_file:
+            json.dump(budgets, budget_file, indent=4, sort_keys=True)
+            budget_file.write("\n")
+        print(f"Budgets written to {BUDGET_FILE}")
+        return 0
+
+    if failures:
+        print(f"\n{failures} budget(s) exceeded or missing")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
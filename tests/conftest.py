@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The rigging modules import each other as System.* / Blueprint.*, like Maya does with Modules on the path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Modules"))
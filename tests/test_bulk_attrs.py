@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+import System.bulk_attrs as bulk_attrs
+
+
+@pytest.fixture
+def backend():
+    backend = bulk_attrs.HeadlessBackend()
+    bulk_attrs.set_backend(backend)
+    bulk_attrs.reset_stats()
+    yield backend
+    bulk_attrs.set_backend(None)
+
+
+def test_scalar_attributes_round_trip(backend):
+    nodes = ["a", "b", "c"]
+    bulk_attrs.set_attr(nodes, "rotateX", np.array([10.0, -20.0, 30.5]))
+
+    assert backend.values["b.rotateX"] == -20.0
+    values = bulk_attrs.get_attr(nodes, "rotateX")
+    assert values.shape == (3,)
+    np.testing.assert_allclose(values, [10.0, -20.0, 30.5])
+
+
+def test_compound_attributes_round_trip(backend):
+    nodes = ["joint1", "joint2"]
+    rotations = np.array([[0.0, 45.0, 90.0], [-10.0, 5.5, 0.0]])
+    bulk_attrs.set_attr(nodes, "rotate", rotations)
+
+    assert backend.values["joint2.rotate"] == [-10.0, 5.5, 0.0]
+    np.testing.assert_allclose(bulk_attrs.rotations(nodes), rotations)
+
+
+def test_getattr_style_compounds_are_flattened(backend):
+    # cmds.getAttr returns compound plugs as [(x, y, z)]
+    backend.values.update({"j1.jointOrient": [(1.0, 2.0, 3.0)], "j2.jointOrient": [(4.0, 5.0, 6.0)]})
+    np.testing.assert_allclose(bulk_attrs.joint_orients(["j1", "j2"]), [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+
+def test_rotate_orders_are_integers(backend):
+    nodes = ["a", "b", "c"]
+    bulk_attrs.set_rotate_orders(nodes, [0, 3, 5])
+
+    orders = bulk_attrs.rotate_orders(nodes)
+    assert orders.dtype.kind == "i"
+    assert orders.tolist() == [0, 3, 5]
+    assert all(isinstance(backend.values[f"{node}.rotateOrder"], int) for node in nodes)
+
+
+def test_world_positions_round_trip(backend):
+    nodes = ["ctrl1", "ctrl2", "ctrl3", "ctrl4"]
+    positions = np.arange(12, dtype=float).reshape(4, 3)
+    bulk_attrs.set_world_positions(nodes, positions.ravel())
+
+    result = bulk_attrs.world_positions(nodes)
+    assert result.shape == (4, 3)
+    np.testing.assert_allclose(result, positions)
+
+
+def test_empty_lists(backend):
+    assert bulk_attrs.get_values([]).shape == (0,)
+    assert bulk_attrs.world_positions([]).shape == (0, 3)
+    bulk_attrs.set_values([], [])
+    assert backend.values == {}
+
+
+def test_stats_count_calls_and_plugs(backend):
+    bulk_attrs.set_attr(["a", "b"], "tx", [1.0, 2.0])
+    bulk_attrs.get_attr(["a", "b"], "tx")
+
+    stats = bulk_attrs.get_stats()
+    assert stats["calls"] == 2
+    assert stats["plugs"] == 4
+    assert stats["backend"] == "headless"
@@ -0,0 +1,89 @@
+import pytest
+
+import System.events as events
+
+
+@pytest.fixture
+def received():
+    received = []
+    for event_type in (events.ModuleInstalled, events.ModulesDeleted, events.SceneReset):
+        events.subscribe(event_type, received.append)
+    events.reset_stats()
+    yield received
+    for event_type in (events.ModuleInstalled, events.ModulesDeleted, events.SceneReset):
+        events.unsubscribe(event_type, received.append)
+    while events._state["hold"]:
+        events.release()
+
+
+def installed(name):
+    return events.ModuleInstalled(f"Chain__{name}", f"Chain__{name}:module_container", None)
+
+
+def test_emit_delivers_immediately(received):
+    events.emit(installed("tail"))
+    assert received == [installed("tail")]
+
+
+def test_held_events_are_delivered_in_order_on_release(received):
+    events.hold()
+    events.emit(installed("tail"))
+    events.emit(events.ModulesDeleted(["Chain__old"], []))
+    assert received == []
+
+    events.release()
+    assert received == [installed("tail"), events.ModulesDeleted(["Chain__old"], [])]
+
+
+def test_nested_holds_deliver_when_the_outermost_releases(received):
+    events.hold()
+    events.hold()
+    events.emit(installed("tail"))
+    events.release()
+    assert received == []
+
+    events.release()
+    assert received == [installed("tail")]
+
+
+def test_failed_operation_drops_held_events(received):
+    events.hold()
+    events.emit(installed("tail"))
+    events.emit(installed("spine"))
+    events.release(completed=False)
+
+    assert received == [events.SceneReset("failed_operation")]
+    assert events.get_stats()["dropped"] == 2
+
+
+def test_failed_operation_without_events_still_resets(received):
+    events.hold()
+    events.release(completed=False)
+    assert received == [events.SceneReset("failed_operation")]
+
+
+def test_unsubscribe_stops_delivery(received):
+    events.unsubscribe(events.ModuleInstalled, received.append)
+    events.emit(installed("tail"))
+    events.emit(events.SceneReset("Undo"))
+    assert received == [events.SceneReset("Undo")]
+
+
+def test_subscribe_twice_delivers_once(received):
+    events.subscribe(events.ModuleInstalled, received.append)
+    events.emit(installed("tail"))
+    assert received == [installed("tail")]
+
+
+def test_failing_subscriber_does_not_stop_the_others(received):
+    def fail(event):
+        raise ValueError(event)
+
+    events.subscribe(events.ModuleInstalled, fail)
+    try:
+        events.emit(installed("tail"))
+    finally:
+        events.unsubscribe(events.ModuleInstalled, fail)
+
+    assert received == [installed("tail")]
+    assert events.get_stats()["errors"] == 1
@@ -0,0 +1,55 @@
+import json
+
+import numpy as np
+
+from System.joint_layout import JointLayout
+
+NAMES = ["root_joint", "mid_joint", "end_joint"]
+POSITIONS = [[0.0, 0.0, 0.0], [4.0, 0.5, -1.0], [8.0, 0.0, 0.0]]
+
+
+def test_dict_round_trip():
+    layout = JointLayout(NAMES, POSITIONS)
+    restored = JointLayout.from_dict(json.loads(json.dumps(layout.to_dict())))
+
+    assert restored.names == layout.names
+    np.testing.assert_array_equal(restored.positions, layout.positions)
+
+
+def test_joint_info_round_trip():
+    joint_info = [[name, position] for name, position in zip(NAMES, POSITIONS)]
+    layout = JointLayout.from_joint_info(joint_info)
+
+    assert layout.to_joint_info() == joint_info
+    assert JointLayout.from_joint_info(layout) is layout
+    assert len(layout) == 3
+    assert layout.position(1) == POSITIONS[1]
+
+
+def test_shared_layout_copies_on_write():
+    defaults = JointLayout(NAMES, POSITIONS, shared=True)
+    layout = defaults.shared_copy()
+    assert layout.positions is defaults.positions
+
+    layout.set_position(2, [9.0, 1.0, 1.0])
+
+    assert layout.position(2) == [9.0, 1.0, 1.0]
+    assert defaults.position(2) == POSITIONS[2]
+    assert not defaults.positions.flags.writeable
+
+
+def test_set_positions_and_copy():
+    layout = JointLayout(NAMES, POSITIONS)
+    copy = layout.copy()
+    layout.set_positions(np.zeros(9))
+
+    np.testing.assert_array_equal(layout.positions, np.zeros((3, 3)))
+    assert copy.to_joint_info()[1][1] == POSITIONS[1]
+
+
+def test_full_names():
+    layout = JointLayout(NAMES, POSITIONS)
+
+    assert layout.full_names("singleJointSegment__arm") == tuple(f"singleJointSegment__arm:{name}" for name in NAMES)
+    assert layout.full_names("ns", "TEMP_")[0] == "ns:TEMP_root_joint"
+    assert layout.full_names("ns", "TEMP_") is layout.full_names("ns", "TEMP_")
@@ -0,0 +1,50 @@
+import numpy as np
+
+from System.kdtree import KDTree
+
+
+def brute_force(points, point, accept=None, max_distance=None):
+    distances = ((points - point) ** 2).sum(axis=1)
+    best_index = None
+    for index in np.argsort(distances):
+        if max_distance is not None and distances[index] > max_distance * max_distance:
+            break
+        if accept is None or accept(int(index)):
+            best_index = int(index)
+            break
+    return best_index
+
+
+def test_nearest_matches_brute_force():
+    rng = np.random.default_rng(7)
+    points = rng.uniform(-10.0, 10.0, (500, 3))
+    tree = KDTree(points)
+
+    for query in rng.uniform(-12.0, 12.0, (200, 3)):
+        assert tree.nearest(query) == brute_force(points, query)
+
+
+def test_nearest_with_accept_and_max_distance():
+    rng = np.random.default_rng(11)
+    points = rng.uniform(-5.0, 5.0, (300, 3))
+    tree = KDTree(points)
+
+    def accept(index):
+        return index % 3 == 0
+
+    for query in rng.uniform(-6.0, 6.0, (100, 3)):
+        assert tree.nearest(query, accept=accept) == brute_force(points, query, accept=accept)
+        assert tree.nearest(query, max_distance=1.0) == brute_force(points, query, max_distance=1.0)
+
+
+def test_points_on_the_query():
+    points = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 2.0, 0.0)]
+    tree = KDTree(points)
+
+    assert tree.nearest((1.0, 0.0, 0.0)) == 1
+    assert tree.nearest((0.1, 1.9, 0.0)) == 2
+
+
+def test_empty_tree():
+    tree = KDTree([])
+    assert tree.nearest((0.0, 0.0, 0.0)) is None
@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+import System.module_manifest as module_manifest
+
+BLUEPRINT_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Modules", "Blueprint")
+
+
+def scan_module(module_file):
+    with open(os.path.join(BLUEPRINT_DIRECTORY, f"{module_file}.py"), "r", encoding="utf-8") as source_file:
+        return module_manifest.scan_source(source_file.read(), module_file)
+
+
+@pytest.mark.parametrize("module_file, class_name, title, icon", [
+    ("chain", "Chain", "Chain", "_spline.xpm"),
+    ("singleJointSegment", "SingleJointSegment", "Single Joint Segment", "_singleJointSeg.xpm"),
+])
+def test_scan_blueprint_modules(module_file, class_name, title, icon):
+    constants, dynamic = scan_module(module_file)
+
+    assert dynamic == []
+    assert constants["CLASS_NAME"] == class_name
+    assert constants["TITLE"] == title
+    assert constants["ICON"] == "${RIGGING_TOOL_ROOT}/Icons/" + icon
+    assert constants["DESCRIPTION"]
+
+
+def test_environ_lookups_become_templates():
+    source = "\n".join([
+        "import os",
+        "TITLE = 'Cost $5'",
+        "ICON = os.environ.get('ICON_ROOT') + '/a.xpm'",
+        "DESCRIPTION = os.getenv('TEXT')",
+    ])
+    constants, dynamic = module_manifest.scan_source(source)
+
+    assert dynamic == []
+    assert constants == {"TITLE": "Cost $$5", "ICON": "${ICON_ROOT}/a.xpm", "DESCRIPTION": "${TEXT}"}
+
+
+def test_computed_constants_are_reported_as_dynamic():
+    source = "\n".join([
+        "CLASS_NAME = 'Arm'",
+        "TITLE = make_title()",
+        "ICON = f'{ROOT:>10}/arm.xpm'",
+        "DESCRIPTION = 'first'",
+        "DESCRIPTION = 'second'",
+    ])
+    constants, dynamic = module_manifest.scan_source(source)
+
+    assert constants == {"CLASS_NAME": "Arm", "DESCRIPTION": "second"}
+    assert sorted(dynamic) == ["ICON", "TITLE"]
+
+
+def test_get_manifest_substitutes_the_environment(tmp_path, monkeypatch):
+    blueprint_directory = tmp_path / "Modules" / "Blueprint"
+    blueprint_directory.mkdir(parents=True)
+    for module_file in ("__init__", "chain"):
+        with open(os.path.join(BLUEPRINT_DIRECTORY, f"{module_file}.py"), "r", encoding="utf-8") as source_file:
+            (blueprint_directory / f"{module_file}.py").write_text(source_file.read(), encoding="utf-8")
+    monkeypatch.setenv("RIGGING_TOOL_ROOT", str(tmp_path))
+    monkeypatch.setattr(module_manifest, "_manifests", {})
+
+    manifest = module_manifest.get_manifest("/Modules/Blueprint")
+
+    assert list(manifest) == ["chain"]
+    assert manifest["chain"]["ICON"] == f"{tmp_path}/Icons/_spline.xpm"
+    assert (blueprint_directory / module_manifest.MANIFEST_FILE).exists()
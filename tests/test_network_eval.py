@@ -0,0 +1,69 @@
+import numpy as np
+
+import System.network_eval as network_eval
+from System.joint_layout import JointLayout
+
+
+def test_predict_stretched_segment():
+    # A 2 unit bone pulled to 3 units along X: scale 1.5, the child translateX becomes 3
+    layout = [[[0.0, 0.0, 0.0], [2.0, 0.0, 0.0]]]
+    controls = [[[0.0, 0.0, 0.0], [3.0, 0.0, 0.0]]]
+
+    prediction = network_eval.predict_blueprint_pose(layout, controls)
+
+    np.testing.assert_allclose(prediction["scale_factors"], [[1.5]])
+    np.testing.assert_allclose(prediction["translate_x"], [[3.0]])
+    np.testing.assert_allclose(prediction["positions"], controls)
+    # X down the bone, the default pole vector below the root keeps Y up
+    np.testing.assert_allclose(prediction["orientations"][0, 0], np.identity(3), atol=1e-12)
+
+
+def test_predict_chain_of_stretched_segments():
+    # Unit segments pulled to 2 along +Y, then to 4 along +Z
+    layout = [[[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [2.0, 0.0, 0.0]]]
+    controls = [[[0.0, 0.0, 0.0], [0.0, 2.0, 0.0], [0.0, 2.0, 4.0]]]
+    poles = [[[0.0, 0.0, -1.0], [0.0, 3.0, 0.0]]]
+
+    prediction = network_eval.predict_blueprint_pose(layout, controls, poles)
+
+    np.testing.assert_allclose(prediction["scale_factors"], [[2.0, 4.0]])
+    np.testing.assert_allclose(prediction["translate_x"], [[2.0, 4.0]])
+    np.testing.assert_allclose(prediction["positions"], controls)
+
+    x_axes = prediction["orientations"][0, :, 0]
+    y_axes = prediction["orientations"][0, :, 1]
+    np.testing.assert_allclose(x_axes, [[0.0, 1.0, 0.0], [0.0, 0.0, 1.0]], atol=1e-12)
+    # The pole vector lies on -Y of each joint
+    np.testing.assert_allclose(y_axes, [[0.0, 0.0, 1.0], [0.0, -1.0, 0.0]], atol=1e-12)
+
+
+def test_predict_batch_and_module_scale():
+    layout = [[[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]]] * 2
+    controls = [[[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]], [[1.0, 1.0, 1.0], [1.0, 1.0, 1.5]]]
+
+    prediction = network_eval.predict_blueprint_pose(layout, controls, module_scale=[1.0, 2.0])
+
+    np.testing.assert_allclose(prediction["scale_factors"], [[1.0], [0.5]])
+    np.testing.assert_allclose(prediction["translate_x"], [[1.0], [0.5]])
+    np.testing.assert_allclose(prediction["positions"][1, 1], [1.0, 1.0, 1.5])
+
+
+def test_predict_layouts_mixes_joint_counts():
+    layouts = [JointLayout(["a", "b"], [[0, 0, 0], [1, 0, 0]]),
+               JointLayout(["a", "b", "c"], [[0, 0, 0], [1, 0, 0], [2, 0, 0]])]
+    controls = [[[0, 0, 0], [3, 0, 0]], [[0, 0, 0], [2, 0, 0], [4, 0, 0]]]
+
+    results = network_eval.predict_layouts(layouts, controls)
+
+    np.testing.assert_allclose(results[0]["scale_factors"], [3.0])
+    np.testing.assert_allclose(results[1]["scale_factors"], [2.0, 2.0])
+    np.testing.assert_allclose(results[1]["positions"], controls[1])
+
+
+def test_multiply_divide_by_zero_passes_input_through():
+    np.testing.assert_allclose(network_eval.multiply_divide([4.0, 6.0], [2.0, 0.0], network_eval.DIVIDE), [2.0, 6.0])
+
+
+def test_creation_pose_blend():
+    blended = network_eval.predict_creation_pose_blend([[2.0, 4.0]], [0.5], [[1.0, 1.0]])
+    np.testing.assert_allclose(blended, [[2.0, 3.0]])